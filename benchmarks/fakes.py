@@ -0,0 +1,157 @@
+"""Deterministic stand-ins for the network services a mission talks to."""
+
+import asyncio
+import json
+import re
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+URL = re.compile(r'https?://[^\s\'"<>)\]]+')
+CURRENT_URL = re.compile(r'Current url: (\S+)')
+
+REPORT_SENTENCES = (
+	'Local-first developer tools keep gaining attention.',
+	'Several launches focus on making agents cheaper to run.',
+	'Open-source alternatives to hosted services are trending.',
+	'Discussion threads show strong interest in performance work.',
+	'Small teams ship focused products with tight feedback loops.',
+)
+
+
+def _text(message: BaseMessage) -> str:
+	if isinstance(message.content, str):
+		return message.content
+	return ' '.join(part.get('text', '') for part in message.content if isinstance(part, dict))
+
+
+class ScriptedChatModel(BaseChatModel):
+	"""Chat model that answers every prompt of the mission pipeline from a script.
+
+	Planning returns `steps`, page extraction returns the page's first lines,
+	summaries and reports are built from the prompt, and browser agents get
+	`go_to_url` (the first URL under `base_url` in the task) followed by `done`.
+	`latency` is slept before every answer and `chunk_delay` between streamed
+	chunks, so runs are repeatable while still resembling a remote model. Token
+	usage is reported as whitespace-separated words.
+	"""
+
+	steps: List[str] = []
+	base_url: str = ''
+	latency: float = 0.0
+	chunk_delay: float = 0.0
+	report_words: int = 600
+	model_name: str = 'scripted'
+
+	@property
+	def _llm_type(self) -> str:
+		return 'scripted'
+
+	def bind_tools(self, tools, **kwargs):
+		return self.bind(tools=[convert_to_openai_tool(tool) for tool in tools], **kwargs)
+
+	def respond(self, messages: List[BaseMessage], tools: Optional[List[Dict[str, Any]]] = None) -> AIMessage:
+		prompt = '\n'.join(_text(message) for message in messages)
+		if tools:
+			name = tools[0]['function']['name']
+			args = self._tool_args(name, prompt)
+			message = AIMessage(content='', tool_calls=[{'name': name, 'args': args, 'id': 'call_scripted'}])
+			content = json.dumps(args)
+		else:
+			content = self._answer(prompt)
+			message = AIMessage(content=content)
+		message.usage_metadata = {
+			'input_tokens': len(prompt.split()),
+			'output_tokens': len(content.split()),
+			'total_tokens': len(prompt.split()) + len(content.split()),
+		}
+		return message
+
+	def _answer(self, prompt: str) -> str:
+		if 'TASK ANALYSIS FRAMEWORK' in prompt or 'supposed to break down the task' in prompt:
+			return json.dumps(self.steps)
+		if 'Page content:' in prompt:
+			content = prompt.split('Page content:', 1)[1]
+			lines = [line.strip() for line in content.splitlines() if line.strip() and not line.startswith('If ')]
+			return '\n'.join(f'- {line}' for line in lines[:10])
+		if 'Summarize what this step found' in prompt:
+			result = prompt.split('RESULT:', 1)[-1]
+			return '\n'.join(line for line in result.splitlines()[:10] if line.strip())
+		if 'TASK TYPE:' in prompt:
+			return '1. Overview\n2. Key findings\n3. Opportunities\n4. Recommendations'
+		words = []
+		while len(words) < self.report_words:
+			words.extend(REPORT_SENTENCES[len(words) % len(REPORT_SENTENCES)].split())
+		return ' '.join(words[: self.report_words])
+
+	def _tool_args(self, name: str, prompt: str) -> Dict[str, Any]:
+		if name == 'TaskBreakdown':
+			return {'steps': self.steps}
+		# Browser agent: open the task's page, then report what was found
+		targets = [url for url in URL.findall(prompt) if url.startswith(self.base_url)]
+		current = CURRENT_URL.findall(prompt)
+		brain = {'evaluation_previous_goal': 'Success', 'memory': '', 'next_goal': 'Finish the task'}
+		if targets and not (current and current[-1].startswith(targets[0])):
+			return {'current_state': brain, 'action': [{'go_to_url': {'url': targets[0]}}]}
+		return {'current_state': brain, 'action': [{'done': {'text': f'Visited {current[-1] if current else "the page"}'}}]}
+
+	def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+		return ChatResult(generations=[ChatGeneration(message=self.respond(messages, kwargs.get('tools')))])
+
+	async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+		await asyncio.sleep(self.latency)
+		return self._generate(messages, stop=stop, **kwargs)
+
+	async def _astream(self, messages, stop=None, run_manager=None, **kwargs) -> AsyncIterator[ChatGenerationChunk]:
+		await asyncio.sleep(self.latency)
+		message = self.respond(messages, kwargs.get('tools'))
+		pieces = re.findall(r'\S+\s*', message.content) or ['']
+		for i, piece in enumerate(pieces):
+			if self.chunk_delay:
+				await asyncio.sleep(self.chunk_delay)
+			# The last chunk carries the usage, like OpenAI's stream_usage
+			usage = message.usage_metadata if i == len(pieces) - 1 else None
+			chunk = ChatGenerationChunk(message=AIMessageChunk(content=piece, usage_metadata=usage))
+			if run_manager:
+				await run_manager.on_llm_new_token(piece, chunk=chunk)
+			yield chunk
+
+
+class FakeSlackClient:
+	"""Records messages instead of posting them to Slack."""
+
+	def __init__(self):
+		self.messages: List[Dict[str, Any]] = []
+
+	async def chat_postMessage(self, **kwargs):
+		self.messages.append(kwargs)
+
+
+class FakeDiscordChannel:
+	def __init__(self, channel_id: int):
+		self.id = channel_id
+		self.sent: List[str] = []
+
+	async def send(self, content=None, **kwargs):
+		self.sent.append(content)
+
+
+class FakeDiscordAuthor:
+	def __init__(self, user_id: int):
+		self.id = user_id
+
+
+class FakeDiscordMessage:
+	"""Just enough of discord.Message for DiscordBot.on_message and execute_task."""
+
+	def __init__(self, user_id: int, channel: FakeDiscordChannel, content: str):
+		self.author = FakeDiscordAuthor(user_id)
+		self.channel = channel
+		self.content = content
+		self.replies: List[str] = []
+
+	async def reply(self, content=None, **kwargs):
+		self.replies.append(content)
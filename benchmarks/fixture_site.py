@@ -0,0 +1,108 @@
+"""A local fake Hacker News served over HTTP, so missions can browse without a network."""
+
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict
+from urllib.parse import urlsplit
+
+WORDS = (
+	'agent browser cache compiler database edge graph kernel latency model '
+	'notebook open-source parser queue runtime search startup terminal vector workflow'
+).split()
+
+JS_ONLY = """<!doctype html>
+<html><head><title>App</title><script src="/app.js"></script></head>
+<body><div id="root"></div><noscript>You need to enable JavaScript to run this app.</noscript></body></html>
+"""
+
+
+def _stories(seed: int, count: int = 30):
+	rng = random.Random(seed)
+	for i in range(1, count + 1):
+		title = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(3, 7))).capitalize()
+		prefix = rng.choice(('', '', 'Show HN: ', 'Ask HN: '))
+		yield i, f'{prefix}{title}', rng.randint(1, 900), rng.randint(0, 400)
+
+
+def _front_page(title: str, seed: int) -> str:
+	rows = []
+	for i, headline, points, comments in _stories(seed):
+		rows.append(
+			f'<tr class="athing" id="{seed * 100 + i}"><td class="rank">{i}.</td>'
+			f'<td class="title"><span class="titleline"><a href="/item?id={seed * 100 + i}">{headline}</a></span></td></tr>'
+			f'<tr><td class="subtext">{points} points by user{i} | {comments} comments</td></tr>'
+		)
+	return (
+		f'<!doctype html><html><head><title>{title} | Hacker News</title></head><body>'
+		f'<table id="hnmain"><tr><td><b>Hacker News</b> <a href="/newest">new</a> | <a href="/show">show</a></td></tr>'
+		f'<tr><td><table>{"".join(rows)}</table></td></tr></table></body></html>'
+	)
+
+
+def build_pages() -> Dict[str, str]:
+	"""Every page the fixture serves, keyed by path. Content is the same on every run."""
+	pages = {
+		'/news': _front_page('Top', 1),
+		'/newest': _front_page('New', 2),
+		'/show': _front_page('Show', 3),
+		'/app': JS_ONLY,
+	}
+	for seed in (1, 2, 3):
+		for i, headline, points, comments in _stories(seed):
+			pages[f'/item?id={seed * 100 + i}'] = (
+				f'<!doctype html><html><head><title>{headline}</title></head><body>'
+				f'<h1>{headline}</h1><p>{points} points, {comments} comments.</p>'
+				+ ''.join(f'<p>Comment {c}: {" ".join(WORDS[(c + k) % len(WORDS)] for k in range(12))}</p>' for c in range(8))
+				+ '</body></html>'
+			)
+	pages['/'] = pages['/news']
+	return pages
+
+
+class FixtureSite:
+	"""Serves build_pages() from a background thread on a free local port.
+
+	Usage:
+	    with FixtureSite() as site:
+	        print(site.url('/news'))
+	"""
+
+	def __init__(self, host: str = '127.0.0.1', port: int = 0):
+		pages = build_pages()
+
+		class Handler(BaseHTTPRequestHandler):
+			def do_GET(self):
+				parts = urlsplit(self.path)
+				body = pages.get(parts.path + (f'?{parts.query}' if parts.query else ''))
+				if body is None:
+					self.send_error(404)
+					return
+				data = body.encode()
+				self.send_response(200)
+				self.send_header('Content-Type', 'text/html; charset=utf-8')
+				self.send_header('Content-Length', str(len(data)))
+				self.end_headers()
+				self.wfile.write(data)
+
+			def log_message(self, format, *args):
+				pass
+
+		self.server = ThreadingHTTPServer((host, port), Handler)
+		self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+	@property
+	def base_url(self) -> str:
+		host, port = self.server.server_address[:2]
+		return f'http://{host}:{port}'
+
+	def url(self, path: str) -> str:
+		return f'{self.base_url}{path}'
+
+	def __enter__(self) -> 'FixtureSite':
+		self.thread.start()
+		return self
+
+	def __exit__(self, *exc):
+		self.server.shutdown()
+		self.server.server_close()
@@ -0,0 +1,303 @@
+"""Offline benchmarks of missions, step execution and the chat bot handlers.
+
+Everything runs against a scripted chat model (benchmarks/fakes.py) and a local
+fake Hacker News (benchmarks/fixture_site.py), so the numbers only move when the
+code does. Run from the repository root:
+
+    python benchmarks/offline.py --repeat 3 --history benchmarks/history.jsonl
+
+--history appends one JSON line per run, tagged with the git commit, and prints
+the change against the latest run of another commit. Steps are answered by the
+HTTP fetch tier unless --browser is given, which needs Playwright's Chromium.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+from unittest import mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fakes import FakeDiscordChannel, FakeDiscordMessage, FakeSlackClient, ScriptedChatModel  # noqa: E402
+from fixture_site import FixtureSite  # noqa: E402
+
+MISSION = "What's trending on Hacker News today?"
+
+# Lower is better for these, higher for everything else
+LOWER_IS_BETTER = ('_s', '_ms', '_mb')
+
+
+def git_commit() -> str:
+	try:
+		sha = subprocess.run(
+			['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True, check=True
+		).stdout.strip()
+		dirty = subprocess.run(
+			['git', 'status', '--porcelain', '--untracked-files=no'], cwd=ROOT, capture_output=True, text=True
+		).stdout.strip()
+	except (OSError, subprocess.CalledProcessError):
+		return 'unknown'
+	return f'{sha}-dirty' if dirty else sha
+
+
+def percentile(samples: List[float], q: float) -> float:
+	ordered = sorted(samples)
+	return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def peak_rss_mb() -> Dict[str, float]:
+	"""Peak resident memory of this process and of its (browser) children so far."""
+	# ru_maxrss is in kilobytes on Linux
+	return {
+		'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+		'peak_rss_children_mb': round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024, 1),
+	}
+
+
+async def bench_mission(site: FixtureSite, args) -> Dict[str, float]:
+	"""End-to-end latency of a three-step mission: plan, execute, report."""
+	from rich.console import Console
+
+	from cofounder.pipeline import run_mission
+
+	steps = [f'Go to {site.url(path)} and collect the first 10 headlines' for path in ('/news', '/newest', '/show')]
+	llm = ScriptedChatModel(steps=steps, base_url=site.base_url, latency=args.llm_latency, chunk_delay=args.chunk_delay)
+	samples, plans, executions, reports = [], [], [], []
+	# Steps never reach a browser on the HTTP tier, so don't launch one during planning; the setting is undone afterwards
+	prewarm = os.getenv('COFOUNDER_PREWARM', '1' if args.browser else '0')
+	with mock.patch.dict(os.environ, {'COFOUNDER_PREWARM': prewarm}):
+		for _ in range(args.repeat):
+			started = time.perf_counter()
+			result = await run_mission(
+				MISSION,
+				llm,
+				console=Console(quiet=True),
+				max_workers=3,
+				report_style='trends',
+				output=None,
+				http_first=not args.browser,
+			)
+			samples.append(time.perf_counter() - started)
+			plans.append(result.timings['plan'])
+			executions.append(result.timings['execute'])
+			reports.append(result.timings['report'])
+			if not all(step['success'] for step in result.steps_completed):
+				raise RuntimeError('mission steps failed')
+	return {
+		'mission_s': round(statistics.median(samples), 3),
+		'mission_plan_s': round(statistics.median(plans), 3),
+		'mission_execute_s': round(statistics.median(executions), 3),
+		'mission_report_s': round(statistics.median(reports), 3),
+	}
+
+
+async def bench_steps(site: FixtureSite, args) -> Dict[str, float]:
+	"""Steps per second through execute_steps at each worker count."""
+	from browser_use import Controller
+
+	from cofounder.executor import execute_steps
+
+	steps = [f'Go to {site.url(f"/item?id={100 + i % 30 + 1}")} and summarize the discussion' for i in range(args.steps)]
+	llm = ScriptedChatModel(base_url=site.base_url, latency=args.llm_latency)
+	results = {}
+	for workers in args.workers:
+		started = time.perf_counter()
+		done = await execute_steps(steps, llm, Controller(), max_workers=workers, http_first=not args.browser)
+		elapsed = time.perf_counter() - started
+		if not all(step['success'] for step in done):
+			raise RuntimeError('steps failed')
+		results[f'steps_w{workers}_per_s'] = round(len(steps) / elapsed, 2)
+	return results
+
+
+def simulated_agent(args) -> Callable:
+	async def run_agent(task: str) -> str:
+		await asyncio.sleep(args.agent_seconds)
+		return f'Done: {task}'
+
+	return run_agent
+
+
+async def bench_slack(site: FixtureSite, args) -> Dict[str, float]:
+	"""Event ack latency and task throughput of SlackBot, with Slack's retries mixed in."""
+	sys.path.insert(0, os.path.join(ROOT, 'integrations', 'slack'))
+	from slack_api import SlackBot
+
+	from cofounder.dedupe import MemoryDedupeStore
+	from cofounder.jobs import JobQueue
+	from cofounder.pool import BrowserPool
+
+	bot = SlackBot(
+		llm=ScriptedChatModel(),
+		bot_token='xoxb-benchmark',
+		signing_secret='benchmark',
+		ack=True,
+		browser_pool=BrowserPool(),
+		job_queue=JobQueue(workers=args.bot_workers),
+		dedupe_store=MemoryDedupeStore(),
+	)
+	bot.client = FakeSlackClient()
+	bot.run_agent = simulated_agent(args)
+
+	events = []
+	for i in range(args.events):
+		event = {'type': 'message', 'text': f'$bu task {i}', 'user': f'U{i % 50}', 'channel': f'C{i % 10}', 'ts': str(i)}
+		events.append((f'Ev{i}', event))
+		# Every fifth event is retried by Slack
+		if i % 5 == 0:
+			events.append((f'Ev{i}', event))
+
+	acks = []
+	started = time.perf_counter()
+	for event_id, event in events:
+		ack_started = time.perf_counter()
+		await bot.handle_event(event, event_id)
+		acks.append(time.perf_counter() - ack_started)
+	accepted = time.perf_counter() - started
+	await bot.job_queue.join()
+	completed = time.perf_counter() - started
+	await bot.job_queue.stop()
+	await asyncio.gather(*bot.background_tasks)
+
+	return {
+		'slack_events_per_s': round(len(events) / accepted, 1),
+		'slack_ack_p50_ms': round(percentile(acks, 0.5) * 1000, 3),
+		'slack_ack_p95_ms': round(percentile(acks, 0.95) * 1000, 3),
+		'slack_tasks_per_s': round(args.events / completed, 1),
+	}
+
+
+async def bench_discord(site: FixtureSite, args) -> Dict[str, float]:
+	"""Message handling latency and task throughput of DiscordBot's fair scheduler."""
+	sys.path.insert(0, os.path.join(ROOT, 'integrations', 'discord'))
+	from discord_api import DiscordBot
+
+	from cofounder.pool import BrowserPool
+
+	bot = DiscordBot(
+		llm=ScriptedChatModel(),
+		ack=True,
+		browser_pool=BrowserPool(),
+		max_concurrency=args.bot_workers,
+		max_per_channel=args.bot_workers,
+		max_queued_per_user=args.events,
+	)
+	bot.run_agent = simulated_agent(args)
+
+	channels = [FakeDiscordChannel(channel_id) for channel_id in range(10)]
+	messages = [FakeDiscordMessage(i % 50, channels[i % 10], f'$bu task {i}') for i in range(args.events)]
+
+	handled = []
+	started = time.perf_counter()
+	for message in messages:
+		message_started = time.perf_counter()
+		await bot.on_message(message)
+		handled.append(time.perf_counter() - message_started)
+	accepted = time.perf_counter() - started
+	while sum(len(channel.sent) for channel in channels) < len(messages):
+		await asyncio.sleep(0.005)
+	completed = time.perf_counter() - started
+
+	return {
+		'discord_messages_per_s': round(len(messages) / accepted, 1),
+		'discord_handle_p50_ms': round(percentile(handled, 0.5) * 1000, 3),
+		'discord_handle_p95_ms': round(percentile(handled, 0.95) * 1000, 3),
+		'discord_tasks_per_s': round(len(messages) / completed, 1),
+	}
+
+
+BENCHMARKS = {
+	'mission': bench_mission,
+	'steps': bench_steps,
+	'slack': bench_slack,
+	'discord': bench_discord,
+}
+
+
+async def run(args) -> Dict[str, Optional[float]]:
+	results: Dict[str, Optional[float]] = {}
+	with FixtureSite() as site:
+		for name in args.only:
+			try:
+				results.update(await BENCHMARKS[name](site, args))
+			except ImportError as e:
+				print(f'{name}: unavailable ({e})', file=sys.stderr)
+				results[name] = None
+	results.update(peak_rss_mb())
+	return results
+
+
+def previous_run(history: str, commit: str) -> Optional[Dict[str, Any]]:
+	"""The latest recorded run of a different commit."""
+	if not os.path.exists(history):
+		return None
+	previous = None
+	with open(history) as f:
+		for line in f:
+			if line.strip():
+				entry = json.loads(line)
+				if entry['commit'] != commit:
+					previous = entry
+	return previous
+
+
+def change(name: str, value: float, before: Optional[float]) -> str:
+	if not before or value is None:
+		return ''
+	delta = (value - before) / before * 100
+	better = delta < 0 if name.endswith(LOWER_IS_BETTER) else delta > 0
+	return f'  {delta:+6.1f}% {"✓" if better else "✗" if abs(delta) >= 5 else ""}'
+
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--only', nargs='+', choices=tuple(BENCHMARKS), default=list(BENCHMARKS))
+	parser.add_argument('--repeat', type=int, default=3, help='missions to run, the median is reported')
+	parser.add_argument('--llm-latency', type=float, default=0.05, help='seconds the scripted model waits before answering')
+	parser.add_argument('--chunk-delay', type=float, default=0.0, help='seconds between streamed chunks')
+	parser.add_argument('--steps', type=int, default=24, help='steps in the throughput benchmark')
+	parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 8], help='worker counts for the throughput benchmark')
+	parser.add_argument('--events', type=int, default=500, help='Slack events / Discord messages to send')
+	parser.add_argument('--agent-seconds', type=float, default=0.05, help='simulated agent run time in the bot benchmarks')
+	parser.add_argument('--bot-workers', type=int, default=4, help='concurrent agent tasks in the bot benchmarks')
+	parser.add_argument('--browser', action='store_true', help='run steps in real browser agents instead of the HTTP tier')
+	parser.add_argument('--json', help='also write the results to this file')
+	parser.add_argument('--history', help='append the results to this JSONL file and compare with the previous commit')
+	args = parser.parse_args()
+
+	commit = git_commit()
+	results = asyncio.run(run(args))
+	before = previous_run(args.history, commit) if args.history else None
+
+	print(f'commit {commit}' + (f' (compared with {before["commit"]})' if before else ''))
+	width = max(len(name) for name in results)
+	for name, value in results.items():
+		shown = 'unavailable' if value is None else f'{value:>10}'
+		print(f'{name:<{width}}  {shown}{change(name, value, (before or {}).get("results", {}).get(name))}')
+
+	entry = {
+		'commit': commit,
+		'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+		'python': sys.version.split()[0],
+		'options': {key: value for key, value in vars(args).items() if key not in ('json', 'history')},
+		'results': results,
+	}
+	if args.json:
+		with open(args.json, 'w') as f:
+			json.dump(entry, f, indent=2)
+	if args.history:
+		with open(args.history, 'a') as f:
+			f.write(json.dumps(entry) + '\n')
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,77 @@
+"""Cold-start import cost of the CLI and of each provider's stack.
+
+Every measurement runs in a fresh interpreter so nothing is cached between
+samples. Run from the repository root:
+
+    python benchmarks/startup.py --repeat 5 --json startup.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from cofounder.providers import PROVIDERS  # noqa: E402
+
+IMPORT_SNIPPET = 'import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)'
+
+
+def time_import(module: str) -> float:
+	"""Seconds spent importing `module` in a fresh interpreter."""
+	out = subprocess.run(
+		[sys.executable, '-c', IMPORT_SNIPPET.format(module=module)],
+		cwd=ROOT,
+		capture_output=True,
+		text=True,
+		check=True,
+	)
+	return float(out.stdout.strip().splitlines()[-1])
+
+
+def time_command(args) -> float:
+	"""Wall time of a whole interpreter run, including interpreter startup."""
+	start = time.perf_counter()
+	subprocess.run([sys.executable, *args], cwd=ROOT, capture_output=True, check=True)
+	return time.perf_counter() - start
+
+
+def measure(fn, repeat: int):
+	try:
+		samples = [fn() for _ in range(repeat)]
+	except (subprocess.CalledProcessError, ValueError):
+		return None
+	return round(statistics.median(samples) * 1000, 1)
+
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--repeat', type=int, default=3)
+	parser.add_argument('--json', help='also write the results to this file')
+	args = parser.parse_args()
+
+	results = {
+		'python -c pass': measure(lambda: time_command(['-c', 'pass']), args.repeat),
+		'cofounder --help': measure(lambda: time_command(['-m', 'cofounder', '--help']), args.repeat),
+		'cofounder --list-missions': measure(lambda: time_command(['-m', 'cofounder', '--list-missions']), args.repeat),
+		'import cofounder.pipeline': measure(lambda: time_import('cofounder.pipeline'), args.repeat),
+	}
+	for name, provider in PROVIDERS.items():
+		results[f'provider {name} ({provider.sdk_module})'] = measure(lambda: time_import(provider.sdk_module), args.repeat)
+
+	width = max(len(name) for name in results)
+	for name, ms in results.items():
+		print(f'{name:<{width}}  {"unavailable" if ms is None else f"{ms:>8.1f} ms"}')
+
+	if args.json:
+		with open(args.json, 'w') as f:
+			json.dump({'python': sys.version.split()[0], 'median_ms': results}, f, indent=2)
+
+
+if __name__ == '__main__':
+	main()
@@ -9,6 +9,11 @@ CYAN='\033[0;36m'
 NC='\033[0m' # No Color
 
 MODEL_TYPE="openai"
+COFOUNDER_SOCKET="${COFOUNDER_SOCKET:-$HOME/.cache/cofounder/daemon.sock}"
+
+daemon_running() {
+    [ -S "$COFOUNDER_SOCKET" ]
+}
 
 ensure_venv() {
     if [ -d "venv" ]; then
@@ -51,26 +56,35 @@ execute_task() {
     case $model in
         "deepseek")
             echo -e "${CYAN}DeepSeek systems online!${NC}"
-            script="main-deepseek.py"
             ;;
         "claude")
             echo -e "${CYAN}Claude systems online!${NC}"
-            script="main-claude.py"
+            ;;
+        "gemini")
+            echo -e "${CYAN}Gemini systems online!${NC}"
+            ;;
+        "ollama")
+            echo -e "${CYAN}Ollama systems online!${NC}"
             ;;
         *)
             echo -e "${CYAN}OpenAI systems online!${NC}"
-            script="main.py"
+            model="openai"
             ;;
     esac
     
     echo -e "\n${YELLOW}=== Mission Start! ====${NC}"
     show_loading_animation "Initializing AI systems"
     
-    python src/$script "$task"
+    python -m cofounder --provider "$model" "$task"
 }
 
 show_loading_animation() {
     local message="$1"
+    # The daemon already has everything warm, so don't make the user wait
+    if daemon_running; then
+        echo -e "${CYAN}${message} ⚡${NC}"
+        return
+    fi
     local chars="⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
     for (( i=0; i<15; i++ )); do
         for (( j=0; j<${#chars}; j++ )); do
@@ -130,32 +144,32 @@ read_actions() {
     echo "1. 🤖 OpenAI (Production Ready)"
     echo "2. 🚀 DeepSeek (Experimental)"
     echo "3. 🌌 Claude (Experimental)"
-    echo "4. 🦙 Ollama (Experimental) [Coming Soon]"
+    echo "4. 🦙 Ollama (Experimental)"
     read -p "Enter your choice (1-4): " model_choice
     
     show_loading_animation "Powering up AI systems"
     
-    # Set script based on model choice
+    # Set provider based on model choice
     case $model_choice in
         1)
             echo -e "${CYAN}OpenAI systems online!${NC}"
-            script="main.py"
+            provider="openai"
             ;;
         2)
             echo -e "${CYAN}DeepSeek systems online!${NC}"
-            script="main-deepseek.py"
+            provider="deepseek"
             ;;
         3)
             echo -e "${CYAN}Claude systems online!${NC}"
-            script="main-claude.py"
+            provider="claude"
             ;;
         4)
-            echo -e "${RED}Ollama support coming soon!${NC}"
-            exit 1
+            echo -e "${CYAN}Ollama systems online!${NC}"
+            provider="ollama"
             ;;
         *)
             echo -e "${RED}Invalid selection. Defaulting to OpenAI.${NC}"
-            script="main.py"
+            provider="openai"
             ;;
     esac
 
@@ -203,7 +217,7 @@ read_actions() {
     echo -e "\n${YELLOW}=== LEVEL 3: Mission Start! ====${NC}"
     show_loading_animation "Initializing AI systems"
     
-    python src/$script "$task"
+    python -m cofounder --provider "$provider" "$task"
 }
 
 setup_environment() {
@@ -243,6 +257,9 @@ show_welcome
 # Main execution logic
 if [ "$1" = "setup" ]; then
     setup_environment
+elif [ "$1" = "--daemon" ]; then
+    ensure_venv
+    python -m cofounder --serve --provider "${2:-$MODEL_TYPE}"
 elif [ "$1" = "--voyager" ]; then
     ensure_venv
     run_examples
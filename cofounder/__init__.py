@@ -0,0 +1 @@
+"""Shared building blocks for the cofounder.sh mission scripts."""
@@ -0,0 +1,5 @@
+import sys
+
+from cofounder.cli import main
+
+sys.exit(main())
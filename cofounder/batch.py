@@ -0,0 +1,105 @@
+"""Headless batch runner: many missions, a bounded number at a time, one JSON line each."""
+
+import asyncio
+import json
+import sys
+import time
+from typing import Any, Dict, List, Optional, TextIO
+
+from cofounder.missions import load_missions
+
+
+def load_batch(path: str) -> List[Dict[str, Any]]:
+	"""Read missions from a JSONL file or a prompts.md-style list.
+
+	JSONL lines are either a plain JSON string or an object with a `task` and an
+	optional `id`. Missions without an id are numbered in file order. Raises
+	ValueError naming the line of the first entry that isn't a mission.
+	"""
+	if path.endswith('.jsonl'):
+		missions = []
+		with open(path, encoding='utf-8') as f:
+			for number, line in enumerate(f, 1):
+				if not line.strip():
+					continue
+				try:
+					entry = json.loads(line)
+				except json.JSONDecodeError as e:
+					raise ValueError(f'{path}:{number}: invalid JSON ({e.msg})') from None
+				mission = entry if isinstance(entry, dict) else {'task': entry}
+				if not isinstance(mission.get('task'), str) or not mission['task'].strip():
+					raise ValueError(f'{path}:{number}: expected a task string or an object with a non-empty "task" string')
+				missions.append(mission)
+	else:
+		missions = [{'task': task} for task in load_missions(path)]
+
+	for i, mission in enumerate(missions, 1):
+		if not mission.get('task'):
+			raise ValueError(f'Mission {i} in {path} has no task')
+		mission.setdefault('id', i)
+	return missions
+
+
+async def run_batch(
+	missions: List[Dict[str, Any]],
+	llm,
+	concurrency: int = 2,
+	max_workers: int = 1,
+	report_style: str = 'trends',
+	out: Optional[TextIO] = None,
+	provider: Optional[str] = None,
+	model: Optional[str] = None,
+	**mission_options,
+) -> int:
+	"""Run missions with at most `concurrency` in flight and stream one JSON result line each.
+
+	Lines are written in completion order and carry the mission `id` and the
+	`run_id` of its journal, which records `provider` and `model` so a failed
+	mission can be resumed with --resume. Returns the number of missions that
+	failed.
+	"""
+	from rich.console import Console
+
+	from cofounder.journal import RunJournal
+	from cofounder.pipeline import run_mission
+	from cofounder.pool import BrowserPool
+
+	out = out or sys.stdout
+	pool = BrowserPool.from_env(max_concurrency=concurrency * max_workers)
+	semaphore = asyncio.Semaphore(max(1, concurrency))
+	failures = 0
+
+	async def run_one(mission: Dict[str, Any]):
+		nonlocal failures
+		async with semaphore:
+			started = time.perf_counter()
+			journal = RunJournal.create(mission['task'], provider=provider, model=model)
+			line: Dict[str, Any] = {'id': mission['id'], 'task': mission['task'], 'run_id': journal.run_id}
+			try:
+				result = await run_mission(
+					mission['task'],
+					llm,
+					console=Console(quiet=True),
+					max_workers=max_workers,
+					report_style=report_style,
+					pool=pool,
+					output=None,
+					journal=journal,
+					**mission_options,
+				)
+				line.update(result.model_dump(exclude={'task'}))
+				line['success'] = all(step['success'] for step in result.steps_completed)
+			except Exception as e:
+				line.update({'success': False, 'error': str(e), 'timings': {'total': time.perf_counter() - started}})
+			if not line['success']:
+				failures += 1
+			out.write(json.dumps(line, ensure_ascii=False, default=str) + '\n')
+			out.flush()
+			print(f'{"✅" if line["success"] else "❌"} [{mission["id"]}] {mission["task"]}', file=sys.stderr)
+
+	try:
+		await pool.start()
+		await asyncio.gather(*(run_one(mission) for mission in missions))
+	finally:
+		await pool.close()
+	return failures
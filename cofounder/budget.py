@@ -0,0 +1,119 @@
+"""Mission time and token budgets, split across plan steps as they start."""
+
+import math
+import os
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+# Rough tokens per browser agent round trip (state, screenshot text and action), until the mission has measured its own
+DEFAULT_TOKENS_PER_ACTION = 4000
+
+
+@dataclass
+class StepAllocation:
+	timeout: Optional[float]
+	max_steps: int
+
+	@property
+	def exhausted(self) -> bool:
+		return (self.timeout is not None and self.timeout <= 0) or self.max_steps <= 0
+
+
+class MissionBudget:
+	"""Wall-clock and token budget of one mission.
+
+	Each step is given its share when it starts: what is left of the budget,
+	minus `report_share` kept back for the report, divided by the rounds of
+	steps still to run (`workers` run side by side). Time or tokens a step
+	doesn't use are therefore available to the steps after it. A step's token
+	share becomes its agent's `max_steps`, using the tokens per LLM call the
+	mission has averaged so far.
+
+	Args:
+	    seconds (float, optional): Mission deadline, None for no time limit
+	    tokens (int, optional): Mission token budget, None for no token limit
+	    max_agent_steps (int): Upper bound on any agent's `max_steps`
+	    report_share (float): Fraction of the budget reserved for the report
+	    expected_steps (int): Steps assumed while the plan is still streaming in
+	    min_step_seconds (float): Steps that would get less than this are skipped
+	"""
+
+	def __init__(
+		self,
+		seconds: Optional[float] = None,
+		tokens: Optional[int] = None,
+		max_agent_steps: int = 100,
+		report_share: float = 0.15,
+		expected_steps: int = 3,
+		min_step_seconds: float = 10,
+	):
+		self.seconds = seconds
+		self.tokens = tokens
+		self.max_agent_steps = max_agent_steps
+		self.report_share = report_share
+		self.expected_steps = expected_steps
+		self.min_step_seconds = min_step_seconds
+		self.started = time.monotonic()
+
+	@classmethod
+	def from_env(cls, seconds: Optional[float] = None, tokens: Optional[int] = None, **kwargs) -> 'MissionBudget':
+		"""Budget from COFOUNDER_MISSION_BUDGET (seconds), COFOUNDER_MISSION_TOKEN_BUDGET and COFOUNDER_MAX_AGENT_STEPS."""
+		if seconds is None and os.getenv('COFOUNDER_MISSION_BUDGET'):
+			seconds = float(os.environ['COFOUNDER_MISSION_BUDGET'])
+		if tokens is None and os.getenv('COFOUNDER_MISSION_TOKEN_BUDGET'):
+			tokens = int(os.environ['COFOUNDER_MISSION_TOKEN_BUDGET'])
+		if os.getenv('COFOUNDER_MAX_AGENT_STEPS'):
+			kwargs.setdefault('max_agent_steps', int(os.environ['COFOUNDER_MAX_AGENT_STEPS']))
+		return cls(seconds=seconds or None, tokens=tokens or None, **kwargs)
+
+	def remaining_seconds(self) -> Optional[float]:
+		if self.seconds is None:
+			return None
+		return self.seconds * (1 - self.report_share) - (time.monotonic() - self.started)
+
+	def report_seconds(self) -> Optional[float]:
+		"""Time left for the report: the rest of the budget, its reserved share included."""
+		if self.seconds is None:
+			return None
+		return self.seconds - (time.monotonic() - self.started)
+
+	def _token_usage(self):
+		# Imported here so the budget arithmetic doesn't need langchain
+		from cofounder.metrics import current_metrics
+
+		metrics = current_metrics.get()
+		if metrics is None:
+			return 0, 0
+		total = metrics.total()
+		return total.input_tokens + total.output_tokens, total.llm_calls
+
+	def remaining_tokens(self) -> Optional[int]:
+		if self.tokens is None:
+			return None
+		used, _ = self._token_usage()
+		return int(self.tokens * (1 - self.report_share)) - used
+
+	def steps_left(self, planned: int, finished: int, planning: bool) -> int:
+		"""Unfinished steps, counting `expected_steps` only while the planner may still add some."""
+		return (max(planned, self.expected_steps) if planning else planned) - finished
+
+	def allocate(self, steps_left: int, workers: int = 1) -> StepAllocation:
+		"""Share of the remaining budget for a step starting now, with `steps_left` steps (this one included) unfinished."""
+		rounds = max(1, math.ceil(max(steps_left, 1) / max(1, workers)))
+
+		timeout = None
+		remaining = self.remaining_seconds()
+		if remaining is not None:
+			timeout = remaining / rounds
+			if timeout < self.min_step_seconds:
+				timeout = 0
+
+		max_steps = self.max_agent_steps
+		tokens = self.remaining_tokens()
+		if tokens is not None:
+			used, calls = self._token_usage()
+			per_action = used / calls if calls else DEFAULT_TOKENS_PER_ACTION
+			share = tokens / max(steps_left, 1)
+			max_steps = min(max_steps, int(share // per_action))
+		return StepAllocation(timeout=timeout, max_steps=max_steps)
@@ -0,0 +1,152 @@
+"""Persistent SQLite cache with TTL expiry and size-bounded LRU eviction.
+
+Values are stored as JSON. Several caches share one database file, each in its
+own namespace, and the database can be used from several processes at once.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+CACHE_DIR = os.getenv('COFOUNDER_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'cofounder'))
+CACHE_DB = os.path.join(CACHE_DIR, 'cache.sqlite3')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+	namespace TEXT NOT NULL,
+	key TEXT NOT NULL,
+	value TEXT NOT NULL,
+	created REAL NOT NULL,
+	expires REAL,
+	last_used REAL NOT NULL,
+	PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS entries_lru ON entries (namespace, last_used);
+"""
+
+
+def cache_key(*parts: Any) -> str:
+	"""Content address for a tuple of key parts."""
+	return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def normalize_text(text: str) -> str:
+	"""Collapse whitespace and case so trivially different strings share a key."""
+	return ' '.join(text.split()).lower()
+
+
+class SqliteCache:
+	"""One namespace of the on-disk cache.
+
+	Args:
+	    namespace (str): Name separating this cache's entries from others in the same file
+	    ttl (float, optional): Default lifetime of an entry in seconds, None to keep entries until evicted
+	    max_entries (int): Least recently used entries beyond this count are evicted
+	    path (str, optional): Database file. Defaults to COFOUNDER_CACHE_DIR/cache.sqlite3
+	"""
+
+	def __init__(self, namespace: str, ttl: Optional[float] = None, max_entries: int = 1000, path: Optional[str] = None):
+		self.namespace = namespace
+		self.ttl = ttl
+		self.max_entries = max_entries
+		self.path = path or CACHE_DB
+		self.hits = 0
+		self.misses = 0
+		self._lock = threading.Lock()
+		if self.path != ':memory:':
+			os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+		self._db = sqlite3.connect(self.path, timeout=10, check_same_thread=False, isolation_level=None)
+		self._db.execute('PRAGMA journal_mode=WAL')
+		self._db.executescript(_SCHEMA)
+
+	@classmethod
+	def from_env(cls, namespace: str, ttl: Optional[float] = None, max_entries: int = 1000, **kwargs) -> 'SqliteCache':
+		"""Build a cache whose limits can be overridden by COFOUNDER_<NAMESPACE>_CACHE_TTL and _SIZE."""
+		prefix = f'COFOUNDER_{namespace.upper()}_CACHE'
+		if os.getenv(f'{prefix}_TTL'):
+			ttl = float(os.environ[f'{prefix}_TTL'])
+		if os.getenv(f'{prefix}_SIZE'):
+			max_entries = int(os.environ[f'{prefix}_SIZE'])
+		return cls(namespace, ttl=ttl, max_entries=max_entries, **kwargs)
+
+	def get(self, key: str, default: Any = None) -> Any:
+		now = time.time()
+		with self._lock:
+			row = self._db.execute(
+				'SELECT value, expires FROM entries WHERE namespace = ? AND key = ?', (self.namespace, key)
+			).fetchone()
+			if row is None or (row[1] is not None and row[1] <= now):
+				self.misses += 1
+				if row is not None:
+					self._db.execute('DELETE FROM entries WHERE namespace = ? AND key = ?', (self.namespace, key))
+				return default
+			self._db.execute('UPDATE entries SET last_used = ? WHERE namespace = ? AND key = ?', (now, self.namespace, key))
+			self.hits += 1
+		return json.loads(row[0])
+
+	def set(self, key: str, value: Any, ttl: Optional[float] = None):
+		now = time.time()
+		ttl = self.ttl if ttl is None else ttl
+		expires = now + ttl if ttl is not None else None
+		with self._lock:
+			self._db.execute(
+				'INSERT OR REPLACE INTO entries (namespace, key, value, created, expires, last_used) VALUES (?, ?, ?, ?, ?, ?)',
+				(self.namespace, key, json.dumps(value), now, expires, now),
+			)
+			self._evict(now)
+
+	def incr(self, key: str, amount: int = 1) -> int:
+		"""Atomically add to an integer counter, across processes, and return the new value."""
+		now = time.time()
+		with self._lock:
+			self._db.execute(
+				"""
+				INSERT INTO entries (namespace, key, value, created, expires, last_used) VALUES (?, ?, ?, ?, NULL, ?)
+				ON CONFLICT (namespace, key) DO UPDATE SET value = CAST(value AS INTEGER) + ?, last_used = ?
+				""",
+				(self.namespace, key, str(amount), now, now, amount, now),
+			)
+			row = self._db.execute('SELECT value FROM entries WHERE namespace = ? AND key = ?', (self.namespace, key)).fetchone()
+		return int(row[0])
+
+	def items(self):
+		"""All unexpired entries as (key, value) pairs, most recently used first."""
+		with self._lock:
+			rows = self._db.execute(
+				'SELECT key, value FROM entries WHERE namespace = ? AND (expires IS NULL OR expires > ?) ORDER BY last_used DESC',
+				(self.namespace, time.time()),
+			).fetchall()
+		return [(key, json.loads(value)) for key, value in rows]
+
+	def delete(self, key: str):
+		with self._lock:
+			self._db.execute('DELETE FROM entries WHERE namespace = ? AND key = ?', (self.namespace, key))
+
+	def clear(self):
+		with self._lock:
+			self._db.execute('DELETE FROM entries WHERE namespace = ?', (self.namespace,))
+
+	def __len__(self) -> int:
+		with self._lock:
+			return self._db.execute('SELECT COUNT(*) FROM entries WHERE namespace = ?', (self.namespace,)).fetchone()[0]
+
+	def _evict(self, now: float):
+		self._db.execute(
+			'DELETE FROM entries WHERE namespace = ? AND expires IS NOT NULL AND expires <= ?',
+			(self.namespace, now),
+		)
+		self._db.execute(
+			"""
+			DELETE FROM entries WHERE namespace = ? AND key IN (
+				SELECT key FROM entries WHERE namespace = ? ORDER BY last_used DESC LIMIT -1 OFFSET ?
+			)
+			""",
+			(self.namespace, self.namespace, self.max_entries),
+		)
+
+	def close(self):
+		self._db.close()
@@ -0,0 +1,243 @@
+"""Record and replay chat model calls, for fast reruns and deterministic benchmarks.
+
+A cassette wraps any LangChain chat model. In `record` mode every call goes to
+the real model and the response, streamed chunks included, is stored under a
+hash of the normalized prompt. In `replay` mode the stored response is returned
+without touching the network, optionally with the recorded timing. `passthrough`
+leaves the model alone.
+
+    COFOUNDER_CASSETTE_MODE=record python -m cofounder "What's trending on HN?"
+    COFOUNDER_CASSETTE_MODE=replay python -m cofounder "What's trending on HN?"
+"""
+
+import asyncio
+import json
+import os
+import re
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage, message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from cofounder.cache import CACHE_DIR, SqliteCache, cache_key
+from cofounder.providers import model_id
+
+MODES = ('record', 'replay', 'passthrough')
+CASSETTE_FILE = os.path.join(CACHE_DIR, 'cassette.sqlite3')
+
+# Parts of prompts that change between otherwise identical runs
+_VOLATILE = (
+	(re.compile(r'\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}(:\d{2}(\.\d+)?)?'), '<time>'),
+	(re.compile(r'\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b'), '<uuid>'),
+)
+
+
+class CassetteMiss(KeyError):
+	"""A replayed call that was never recorded."""
+
+
+def normalize_message(message: BaseMessage) -> Dict[str, Any]:
+	"""The parts of a message that decide the model's answer, with volatile details masked."""
+	if isinstance(message.content, str):
+		text = message.content
+	else:
+		# Screenshots differ on every run; only the text of multimodal messages counts
+		text = ' '.join(
+			part.get('text', '') if isinstance(part, dict) and part.get('type') == 'text' else '<image>'
+			for part in message.content
+		)
+	for pattern, replacement in _VOLATILE:
+		text = pattern.sub(replacement, text)
+	normalized = {'type': message.type, 'text': ' '.join(text.split())}
+	tool_calls = getattr(message, 'tool_calls', None)
+	if tool_calls:
+		normalized['tool_calls'] = [{'name': call['name'], 'args': call['args']} for call in tool_calls]
+	return normalized
+
+
+def _final_message(message: BaseMessage) -> AIMessage:
+	"""Turn an accumulated stream into a plain AIMessage."""
+	return AIMessage(
+		content=message.content,
+		tool_calls=getattr(message, 'tool_calls', []) or [],
+		usage_metadata=getattr(message, 'usage_metadata', None),
+		response_metadata=getattr(message, 'response_metadata', {}) or {},
+	)
+
+
+class CassetteChatModel(BaseChatModel):
+	"""Chat model wrapper that records responses to, or replays them from, a cassette.
+
+	Args:
+	    inner (BaseChatModel): The real model, called when recording or passing through
+	    store (SqliteCache): Where responses are kept, keyed by the normalized prompt
+	    mode (str): `record`, `replay` or `passthrough`
+	    speed (float): Replay the recorded timing scaled by this factor; 0 replays instantly
+	"""
+
+	inner: BaseChatModel
+	store: Any = None
+	mode: str = 'replay'
+	speed: float = 0.0
+	model_name: Optional[str] = None
+
+	def __init__(self, **kwargs):
+		super().__init__(**kwargs)
+		if self.mode not in MODES:
+			raise ValueError(f'Unknown cassette mode {self.mode!r}, expected one of {", ".join(MODES)}')
+		# browser_use and the caches look at model_name
+		self.model_name = getattr(self.inner, 'model_name', None) or getattr(self.inner, 'model', None)
+
+	@property
+	def _llm_type(self) -> str:
+		return f'cassette-{self.inner._llm_type}'
+
+	@property
+	def _identifying_params(self) -> Dict[str, Any]:
+		return {'inner': model_id(self.inner), 'mode': self.mode}
+
+	def bind_tools(self, tools, **kwargs):
+		# Let the real model format the tools the way its API expects
+		return self.bind(**self.inner.bind_tools(tools, **kwargs).kwargs)
+
+	def with_structured_output(self, schema, *, method: Optional[str] = None, **kwargs):
+		# browser_use passes the method of the model inside; structured output here always goes through bind_tools,
+		# which is function calling, so the method is accepted rather than rejected by BaseChatModel
+		return super().with_structured_output(schema, **kwargs)
+
+	def key(self, messages: List[BaseMessage], stop: Optional[List[str]], **kwargs) -> str:
+		return cache_key(model_id(self.inner), [normalize_message(message) for message in messages], stop, kwargs)
+
+	def _lookup(self, key: str) -> Optional[Dict[str, Any]]:
+		if self.mode != 'replay':
+			return None
+		entry = self.store.get(key)
+		if entry is None:
+			raise CassetteMiss(
+				f'No recorded response for this prompt (key {key[:12]}); record it with COFOUNDER_CASSETTE_MODE=record'
+			)
+		return entry
+
+	def _record(
+		self,
+		key: str,
+		message: BaseMessage,
+		latency: float,
+		chunks: Optional[List[Any]] = None,
+		delays: Optional[List[float]] = None,
+	):
+		if self.mode == 'record':
+			entry = {'message': message_to_dict(_final_message(message)), 'latency': latency, 'chunks': chunks, 'delays': delays}
+			self.store.set(key, entry)
+
+	@staticmethod
+	def _message(entry: Dict[str, Any]) -> AIMessage:
+		return messages_from_dict([entry['message']])[0]
+
+	def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+		key = self.key(messages, stop, **kwargs)
+		entry = self._lookup(key)
+		if entry is not None:
+			time.sleep(entry['latency'] * self.speed)
+			return ChatResult(generations=[ChatGeneration(message=self._message(entry))])
+		started = time.perf_counter()
+		message = self.inner.invoke(messages, stop=stop, **kwargs)
+		self._record(key, message, time.perf_counter() - started)
+		return ChatResult(generations=[ChatGeneration(message=message)])
+
+	async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+		key = self.key(messages, stop, **kwargs)
+		entry = self._lookup(key)
+		if entry is not None:
+			await asyncio.sleep(entry['latency'] * self.speed)
+			return ChatResult(generations=[ChatGeneration(message=self._message(entry))])
+		started = time.perf_counter()
+		message = await self.inner.ainvoke(messages, stop=stop, **kwargs)
+		self._record(key, message, time.perf_counter() - started)
+		return ChatResult(generations=[ChatGeneration(message=message)])
+
+	def _replayed_chunks(self, entry: Dict[str, Any]) -> Iterator[tuple]:
+		"""(delay, chunk) pairs replaying a recorded response as a stream."""
+		message = self._message(entry)
+		chunks = entry.get('chunks') or [message.content]
+		delays = entry.get('delays') or [entry['latency']] + [0.0] * (len(chunks) - 1)
+		for i, (content, delay) in enumerate(zip(chunks, delays)):
+			last = i == len(chunks) - 1
+			chunk = AIMessageChunk(
+				content=content,
+				usage_metadata=message.usage_metadata if last else None,
+				tool_call_chunks=[
+					{'name': call['name'], 'args': json.dumps(call['args']), 'id': call['id'], 'index': index}
+					for index, call in enumerate(message.tool_calls)
+				]
+				if last
+				else [],
+			)
+			yield delay * self.speed, ChatGenerationChunk(message=chunk)
+
+	def _stream(self, messages, stop=None, run_manager=None, **kwargs) -> Iterator[ChatGenerationChunk]:
+		key = self.key(messages, stop, **kwargs)
+		entry = self._lookup(key)
+		if entry is not None:
+			for delay, chunk in self._replayed_chunks(entry):
+				time.sleep(delay)
+				if run_manager:
+					run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+				yield chunk
+			return
+
+		started = last = time.perf_counter()
+		message, chunks, delays = None, [], []
+		for part in self.inner.stream(messages, stop=stop, **kwargs):
+			now = time.perf_counter()
+			delays.append(now - last)
+			last = now
+			chunks.append(part.content)
+			message = part if message is None else message + part
+			chunk = ChatGenerationChunk(message=part)
+			if run_manager:
+				run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+			yield chunk
+		if message is not None:
+			self._record(key, message, time.perf_counter() - started, chunks, delays)
+
+	async def _astream(self, messages, stop=None, run_manager=None, **kwargs) -> AsyncIterator[ChatGenerationChunk]:
+		key = self.key(messages, stop, **kwargs)
+		entry = self._lookup(key)
+		if entry is not None:
+			for delay, chunk in self._replayed_chunks(entry):
+				await asyncio.sleep(delay)
+				if run_manager:
+					await run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+				yield chunk
+			return
+
+		started = last = time.perf_counter()
+		message, chunks, delays = None, [], []
+		async for part in self.inner.astream(messages, stop=stop, **kwargs):
+			now = time.perf_counter()
+			delays.append(now - last)
+			last = now
+			chunks.append(part.content)
+			message = part if message is None else message + part
+			chunk = ChatGenerationChunk(message=part)
+			if run_manager:
+				await run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+			yield chunk
+		if message is not None:
+			self._record(key, message, time.perf_counter() - started, chunks, delays)
+
+
+def open_cassette(path: Optional[str] = None) -> SqliteCache:
+	"""The cassette store: COFOUNDER_CASSETTE, default COFOUNDER_CACHE_DIR/cassette.sqlite3. Entries never expire."""
+	return SqliteCache('cassette', ttl=None, max_entries=1_000_000, path=path or os.getenv('COFOUNDER_CASSETTE') or CASSETTE_FILE)
+
+
+def cassette_from_env(llm: BaseChatModel) -> BaseChatModel:
+	"""Wrap `llm` according to COFOUNDER_CASSETTE_MODE and COFOUNDER_CASSETTE_SPEED; unchanged when unset or passthrough."""
+	mode = os.getenv('COFOUNDER_CASSETTE_MODE', 'passthrough')
+	if mode == 'passthrough':
+		return llm
+	return CassetteChatModel(inner=llm, store=open_cassette(), mode=mode, speed=float(os.getenv('COFOUNDER_CASSETTE_SPEED', '0')))
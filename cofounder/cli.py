@@ -0,0 +1,351 @@
+"""Command line entry point: `python -m cofounder "task"`.
+
+Only the standard library is imported at module level so that `--help`,
+listing missions and argument validation return without loading langchain,
+rich or browser_use.
+"""
+
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+from cofounder.missions import PROMPTS_FILE, load_missions
+from cofounder.providers import PROVIDERS, get_provider, provider_names
+
+
+def build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(prog='cofounder', description='Run a cofounder.sh mission with AI browser agents.')
+	parser.add_argument('task', nargs='*', help='mission to run; prompts for one when omitted')
+	parser.add_argument(
+		'-p',
+		'--provider',
+		default=os.getenv('COFOUNDER_PROVIDER', 'openai'),
+		help=f'LLM provider ({", ".join(provider_names())})',
+	)
+	parser.add_argument('-m', '--model', help="model name, overriding the provider's default")
+	parser.add_argument(
+		'-w',
+		'--workers',
+		type=int,
+		default=int(os.getenv('COFOUNDER_MAX_WORKERS', '1')),
+		help='plan steps to run at once',
+	)
+	parser.add_argument('--mission', type=int, metavar='N', help='run preset mission N from prompts.md')
+	parser.add_argument('--missions-file', default=PROMPTS_FILE, help=argparse.SUPPRESS)
+	parser.add_argument('--report', choices=('trends', 'dynamic'), help="report style, defaults to the provider's")
+	parser.add_argument('-o', '--output', default='execution_report.txt', help='file the report is saved to')
+	parser.add_argument('--no-plan-cache', action='store_true', help='always ask the model for a fresh task breakdown')
+	parser.add_argument(
+		'--step-cache-ttl',
+		type=float,
+		metavar='SECONDS',
+		help='reuse step results younger than this for this mission (0 disables the step cache)',
+	)
+	parser.add_argument(
+		'--browser-only',
+		action='store_true',
+		help='run every step in a browser agent instead of trying a plain HTTP fetch first',
+	)
+	parser.add_argument(
+		'--budget',
+		type=float,
+		metavar='SECONDS',
+		help='wall-clock budget for the mission; steps share it and return partial results when they run out',
+	)
+	parser.add_argument(
+		'--token-budget',
+		type=int,
+		metavar='TOKENS',
+		help='token budget for the mission, turned into a step limit for each browser agent',
+	)
+	parser.add_argument(
+		'--resume',
+		metavar='RUN_ID',
+		help='continue an interrupted run from its journal in runs/, skipping the steps it already finished',
+	)
+	parser.add_argument(
+		'--profile',
+		nargs='?',
+		const='profile.trace.json',
+		metavar='FILE',
+		help='write a Chrome trace of the run, viewable in chrome://tracing or ui.perfetto.dev (default: %(const)s)',
+	)
+	parser.add_argument('--list-missions', action='store_true', help='list preset missions and exit')
+	parser.add_argument('--list-providers', action='store_true', help='list LLM providers and exit')
+	parser.add_argument('--plan-stats', action='store_true', help='show how often each planning path was taken and exit')
+	parser.add_argument('--batch', metavar='FILE', help='run every mission in a .jsonl file or prompts.md-style list headlessly')
+	parser.add_argument('--concurrency', type=int, default=2, help='missions run at once in --batch mode')
+	parser.add_argument('--batch-output', default='-', metavar='FILE', help='JSONL file for --batch results (default: stdout)')
+	parser.add_argument('--serve', action='store_true', help='run the background daemon that keeps browsers and models warm')
+	parser.add_argument('--api', action='store_true', help='serve the local HTTP job API')
+	parser.add_argument('--port', type=int, default=8765, help='port for --api (default: 8765)')
+	parser.add_argument('--no-daemon', action='store_true', help='run in this process even if a daemon is running')
+	return parser
+
+
+def resolve_task(args, parser: argparse.ArgumentParser) -> str:
+	"""Pick the task from a preset mission, the command line, or stdin."""
+	if args.mission is not None:
+		missions = load_missions(args.missions_file)
+		if not 1 <= args.mission <= len(missions):
+			parser.error(f'--mission must be between 1 and {len(missions)}')
+		return missions[args.mission - 1]
+	if args.task:
+		return ' '.join(args.task)
+	print('\n🤖 Please enter your task:')
+	return input().strip()
+
+
+async def _run(task: str, provider, args, journal=None) -> None:
+	from rich.console import Console
+	from rich.panel import Panel
+
+	console = Console()
+	console.print(
+		Panel.fit(
+			'[bold blue]Welcome to Cofounder.sh AI Assistant[/]\n[cyan]Let me help you accomplish your task![/]',
+			border_style='blue',
+		)
+	)
+	if journal is not None:
+		console.print(f'🗂️  Run {journal.run_id}, journal and report in {journal.path}', style='blue')
+
+	from cofounder.pipeline import open_plan_cache, open_plan_stats, open_structure_cache, run_mission
+	from cofounder.step_cache import StepResultCache
+
+	tracer = None
+	if args.profile:
+		from cofounder.trace import Tracer, current_tracer
+
+		tracer = Tracer()
+		current_tracer.set(tracer)
+
+	llm = provider.create(args.model)
+	try:
+		await run_mission(
+			task,
+			llm,
+			console=console,
+			max_workers=args.workers,
+			report_style=args.report or provider.report_style,
+			output=args.output,
+			plan_cache=None if args.no_plan_cache else open_plan_cache(),
+			result_cache=StepResultCache.from_env(args.step_cache_ttl),
+			structure_cache=open_structure_cache(),
+			plan_stats=open_plan_stats(),
+			http_first=False if args.browser_only else None,
+			journal=journal,
+			time_budget=args.budget,
+			token_budget=args.token_budget,
+		)
+	finally:
+		# Also written for failed or interrupted runs, which are often the interesting ones
+		if tracer is not None:
+			tracer.write(args.profile)
+			console.print(f'⏱️  Trace saved to {args.profile} (open it in chrome://tracing or ui.perfetto.dev)', style='green')
+
+
+def serve(provider) -> int:
+	import asyncio
+
+	from cofounder.daemon import Daemon
+	from cofounder.runtime import Runtime
+
+	server = Daemon(runtime=Runtime(provider=provider.name))
+	if not provider.missing_env():
+		# Build the default model up front so the first mission finds it warm
+		server.runtime.model(provider.name)
+	try:
+		asyncio.run(server.serve())
+	except KeyboardInterrupt:
+		print('\n👋 Cofounder daemon stopped')
+	return 0
+
+
+def serve_api(provider, args) -> int:
+	import uvicorn
+
+	from cofounder import server
+
+	server.default_provider = provider.name
+	uvicorn.run(server.app, host='127.0.0.1', port=args.port)
+	return 0
+
+
+def batch(provider, args, parser) -> int:
+	import asyncio
+
+	from cofounder.batch import load_batch
+
+	if args.concurrency < 1:
+		parser.error('--concurrency must be at least 1')
+	try:
+		missions = load_batch(args.batch)
+	except (OSError, ValueError) as e:
+		parser.error(f'--batch: {e}')
+
+	missing = provider.missing_env()
+	if missing:
+		print(f'❌ {missing} must be set in .env file', file=sys.stderr)
+		return 1
+
+	from cofounder.batch import run_batch
+	from cofounder.pipeline import open_plan_cache, open_plan_stats, open_structure_cache
+	from cofounder.step_cache import StepResultCache
+
+	out = sys.stdout if args.batch_output == '-' else open(args.batch_output, 'a', encoding='utf-8')
+	try:
+		failures = asyncio.run(
+			run_batch(
+				missions,
+				provider.create(args.model),
+				concurrency=args.concurrency,
+				max_workers=args.workers,
+				report_style=args.report or provider.report_style,
+				out=out,
+				provider=provider.name,
+				model=args.model,
+				plan_cache=None if args.no_plan_cache else open_plan_cache(),
+				result_cache=StepResultCache.from_env(args.step_cache_ttl),
+				structure_cache=open_structure_cache(),
+				plan_stats=open_plan_stats(),
+				http_first=False if args.browser_only else None,
+				time_budget=args.budget,
+				token_budget=args.token_budget,
+			)
+		)
+	except KeyboardInterrupt:
+		print('\n\n❌ Batch cancelled by user', file=sys.stderr)
+		return 130
+	finally:
+		if out is not sys.stdout:
+			out.close()
+	print(f'\n📦 {len(missions) - failures}/{len(missions)} missions succeeded', file=sys.stderr)
+	return 1 if failures else 0
+
+
+def submit_to_daemon(task: str, provider, args, journal=None) -> int:
+	import shutil
+
+	from cofounder.daemon import submit
+
+	request = {
+		'task': task,
+		'provider': provider.name,
+		'model': args.model,
+		'workers': args.workers,
+		'report': args.report,
+		'output': os.path.abspath(args.output) if args.output else None,
+		'plan_cache': not args.no_plan_cache,
+		'step_cache_ttl': args.step_cache_ttl,
+		'http_first': False if args.browser_only else None,
+		'budget': args.budget,
+		'token_budget': args.token_budget,
+		# The daemon may run elsewhere, so the run is named by its directory
+		'resume': os.path.abspath(journal.path) if journal is not None else None,
+		'width': shutil.get_terminal_size().columns,
+		'color': sys.stdout.isatty(),
+	}
+	try:
+		return submit(request)
+	except KeyboardInterrupt:
+		print('\n\n❌ Operation cancelled by user')
+		return 130
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+	from dotenv import find_dotenv, load_dotenv
+
+	# Before the parser, whose defaults come from COFOUNDER_* variables that may be set in .env. The
+	# .env is looked up from the working directory, not from where the package happens to be installed
+	load_dotenv(find_dotenv(usecwd=True))
+	parser = build_parser()
+	args = parser.parse_args(argv)
+
+	if args.list_providers:
+		for name, provider in PROVIDERS.items():
+			print(f'{name:<12} {provider.default_model:<32} {provider.description}')
+		return 0
+
+	if args.list_missions:
+		for i, mission in enumerate(load_missions(args.missions_file), 1):
+			print(f'[{i}] {mission}')
+		return 0
+
+	if args.plan_stats:
+		from cofounder.pipeline import TaskPlanner, open_plan_stats
+
+		counts = dict(open_plan_stats().items())
+		total = sum(counts.values()) or 1
+		for source in TaskPlanner.SOURCES:
+			print(f'{source:<10} {counts.get(source, 0):>6}  {100 * counts.get(source, 0) / total:5.1f}%')
+		return 0
+
+	try:
+		provider = get_provider(args.provider)
+	except KeyError as e:
+		parser.error(e.args[0])
+	if args.workers < 1:
+		parser.error('--workers must be at least 1')
+
+	if args.serve:
+		return serve(provider)
+
+	if args.batch:
+		return batch(provider, args, parser)
+
+	if args.api:
+		return serve_api(provider, args)
+
+	journal = None
+	if args.resume:
+		from cofounder.journal import RunJournal
+
+		try:
+			journal = RunJournal.load(args.resume)
+		except FileNotFoundError:
+			print(f'❌ No run {args.resume} to resume', file=sys.stderr)
+			return 1
+		# A resumed run keeps the provider and model it started with
+		task = journal.task
+		provider = get_provider(journal.start.get('provider') or provider.name)
+		args.model = journal.start.get('model', args.model)
+	else:
+		task = resolve_task(args, parser)
+	if not task:
+		print('❌ No task given', file=sys.stderr)
+		return 1
+
+	from cofounder import daemon
+
+	# Profiling has to happen in this process, so it skips the daemon
+	if not args.no_daemon and not args.profile and daemon.is_running():
+		return submit_to_daemon(task, provider, args, journal)
+
+	missing = provider.missing_env()
+	if missing:
+		print(f'❌ {missing} must be set in .env file', file=sys.stderr)
+		return 1
+
+	import asyncio
+
+	if journal is None:
+		from cofounder.journal import RunJournal
+
+		journal = RunJournal.create(task, provider=provider.name, model=args.model)
+	else:
+		journal.append('resume', {})
+	try:
+		asyncio.run(_run(task, provider, args, journal))
+	except KeyboardInterrupt:
+		print('\n\n❌ Operation cancelled by user')
+		print(f'⏯️  Resume with: python -m cofounder --resume {journal.run_id}')
+		return 130
+	except Exception as e:
+		print(f'\n\n❌ Error: {str(e)}')
+		print(f'⏯️  Resume with: python -m cofounder --resume {journal.run_id}')
+		return 1
+	finally:
+		print('\n👋 Thank you for using Cofounder.sh!')
+	return 0
@@ -0,0 +1,138 @@
+"""Long-running local daemon that keeps browsers, LLM clients and missions warm.
+
+The daemon listens on a Unix socket. A client sends one JSON request line and
+receives JSON lines back: `{"out": text}` for rendered console output and a
+final `{"exit": code}`. Closing the connection cancels the mission.
+
+The client half only uses the standard library so that submitting a task does
+not import the browser or LLM stack.
+"""
+
+import json
+import os
+import socket
+import sys
+from typing import Any, Dict
+
+DEFAULT_SOCKET = os.getenv('COFOUNDER_SOCKET', os.path.join(os.path.expanduser('~'), '.cache', 'cofounder', 'daemon.sock'))
+
+
+def is_running(socket_path: str = DEFAULT_SOCKET) -> bool:
+	"""Whether a daemon is accepting connections on `socket_path`."""
+	if not os.path.exists(socket_path):
+		return False
+	with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+		try:
+			sock.connect(socket_path)
+		except OSError:
+			return False
+	return True
+
+
+def submit(request: Dict[str, Any], socket_path: str = DEFAULT_SOCKET, out=None) -> int:
+	"""Send a mission to the daemon, stream its output to `out` and return the exit code."""
+	out = out or sys.stdout
+	with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+		sock.connect(socket_path)
+		sock.sendall((json.dumps(request) + '\n').encode())
+		for line in sock.makefile('r', encoding='utf-8'):
+			message = json.loads(line)
+			if 'out' in message:
+				out.write(message['out'])
+				out.flush()
+			elif 'exit' in message:
+				return message['exit']
+	return 1
+
+
+class _SocketFile:
+	"""File-like object that forwards console writes to a client as JSON lines."""
+
+	def __init__(self, writer):
+		self.writer = writer
+
+	def write(self, text: str) -> int:
+		if text and not self.writer.is_closing():
+			self.writer.write((json.dumps({'out': text}) + '\n').encode())
+		return len(text)
+
+	def flush(self):
+		pass
+
+	def isatty(self) -> bool:
+		return True
+
+
+class Daemon:
+	"""Serves missions over a Unix socket from a warm Runtime."""
+
+	def __init__(self, socket_path: str = DEFAULT_SOCKET, runtime=None):
+		from cofounder.runtime import Runtime
+
+		self.socket_path = socket_path
+		self.runtime = runtime or Runtime()
+
+	async def run_request(self, request: Dict[str, Any], console) -> int:
+		try:
+			self.runtime.resolve_task(request)
+		except ValueError as e:
+			console.print(f'❌ {e}', style='red')
+			return 2
+		await self.runtime.run(request, console)
+		return 0
+
+	async def handle(self, reader, writer):
+		import asyncio
+
+		from rich.console import Console
+
+		try:
+			request = json.loads(await reader.readline())
+		except ValueError:
+			writer.close()
+			return
+
+		console = Console(file=_SocketFile(writer), force_terminal=request.get('color', True), width=request.get('width', 100))
+		mission = asyncio.create_task(self.run_request(request, console))
+		# The client sends nothing after its request, so EOF means it went away
+		disconnect = asyncio.create_task(reader.read())
+		await asyncio.wait({mission, disconnect}, return_when=asyncio.FIRST_COMPLETED)
+
+		if not mission.done():
+			mission.cancel()
+			await asyncio.gather(mission, return_exceptions=True)
+			writer.close()
+			return
+		disconnect.cancel()
+
+		try:
+			code = mission.result()
+		except Exception as e:
+			console.print(f'\n\n❌ Error: {str(e)}', style='red')
+			code = 1
+		writer.write((json.dumps({'exit': code}) + '\n').encode())
+		try:
+			await writer.drain()
+		finally:
+			writer.close()
+
+	async def serve(self):
+		import asyncio
+
+		if os.path.exists(self.socket_path):
+			if is_running(self.socket_path):
+				raise RuntimeError(f'A daemon is already listening on {self.socket_path}')
+			os.unlink(self.socket_path)
+		os.makedirs(os.path.dirname(self.socket_path), exist_ok=True)
+
+		await self.runtime.start()
+		server = await asyncio.start_unix_server(self.handle, path=self.socket_path)
+		os.chmod(self.socket_path, 0o600)
+		print(f'🚀 Cofounder daemon listening on {self.socket_path}')
+		try:
+			async with server:
+				await server.serve_forever()
+		finally:
+			await self.runtime.close()
+			if os.path.exists(self.socket_path):
+				os.unlink(self.socket_path)
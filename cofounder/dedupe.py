@@ -0,0 +1,98 @@
+"""Bounded stores that remember recently seen event ids."""
+
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional
+
+from cofounder.cache import CACHE_DB
+
+
+class DedupeStore(ABC):
+	"""Remembers event ids for `ttl` seconds."""
+
+	@abstractmethod
+	def seen(self, key: str) -> bool:
+		"""Record `key` and return whether it had already been recorded within the TTL."""
+
+
+class MemoryDedupeStore(DedupeStore):
+	"""Per-process store with TTL expiry, capped at `max_entries` by evicting the oldest ids."""
+
+	def __init__(self, ttl: float = 3600, max_entries: int = 10000):
+		self.ttl = ttl
+		self.max_entries = max_entries
+		self._entries: 'OrderedDict[str, float]' = OrderedDict()
+		self._lock = threading.Lock()
+
+	def seen(self, key: str) -> bool:
+		now = time.time()
+		with self._lock:
+			# Entries are in insertion order, so expired ones are always at the front
+			while self._entries and next(iter(self._entries.values())) <= now:
+				self._entries.popitem(last=False)
+			if key in self._entries:
+				return True
+			self._entries[key] = now + self.ttl
+			if len(self._entries) > self.max_entries:
+				self._entries.popitem(last=False)
+			return False
+
+	def __len__(self) -> int:
+		return len(self._entries)
+
+
+class SqliteDedupeStore(DedupeStore):
+	"""Store shared by every process on the host through one SQLite file.
+
+	The check and the insert happen in a single statement, so two uvicorn
+	workers receiving the same retried event cannot both process it.
+	"""
+
+	CLEANUP_EVERY = 500
+
+	def __init__(self, path: Optional[str] = None, ttl: float = 3600, namespace: str = 'default'):
+		self.path = path or CACHE_DB
+		self.ttl = ttl
+		self.namespace = namespace
+		self._inserts = 0
+		self._lock = threading.Lock()
+		if self.path != ':memory:':
+			os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+		self._db = sqlite3.connect(self.path, timeout=10, check_same_thread=False, isolation_level=None)
+		self._db.execute('PRAGMA journal_mode=WAL')
+		self._db.execute(
+			'CREATE TABLE IF NOT EXISTS seen_events (namespace TEXT NOT NULL, key TEXT NOT NULL, expires REAL NOT NULL, '
+			'PRIMARY KEY (namespace, key))'
+		)
+		self._db.execute('CREATE INDEX IF NOT EXISTS seen_events_expires ON seen_events (expires)')
+
+	def seen(self, key: str) -> bool:
+		now = time.time()
+		with self._lock:
+			cursor = self._db.execute(
+				"""
+				INSERT INTO seen_events (namespace, key, expires) VALUES (?, ?, ?)
+				ON CONFLICT (namespace, key) DO UPDATE SET expires = excluded.expires WHERE seen_events.expires <= ?
+				""",
+				(self.namespace, key, now + self.ttl, now),
+			)
+			inserted = cursor.rowcount == 1
+			self._inserts += 1
+			if self._inserts % self.CLEANUP_EVERY == 0:
+				self._db.execute('DELETE FROM seen_events WHERE expires <= ?', (now,))
+		return not inserted
+
+	def close(self):
+		self._db.close()
+
+
+def dedupe_store_from_env(prefix: str = 'COFOUNDER', namespace: str = 'default') -> DedupeStore:
+	"""Pick a backend with <PREFIX>_DEDUPE_BACKEND (`memory` or `sqlite`) and <PREFIX>_DEDUPE_TTL."""
+	ttl = float(os.getenv(f'{prefix}_DEDUPE_TTL', '3600'))
+	if os.getenv(f'{prefix}_DEDUPE_BACKEND', 'memory') == 'sqlite':
+		return SqliteDedupeStore(path=os.getenv(f'{prefix}_DEDUPE_PATH'), ttl=ttl, namespace=namespace)
+	return MemoryDedupeStore(ttl=ttl)
@@ -0,0 +1,217 @@
+import asyncio
+import os
+import time
+from typing import Any, AsyncIterable, Callable, Dict, Iterable, List, Optional, Union
+
+from cofounder.budget import MissionBudget
+from cofounder.fetch import http_client, http_step
+from cofounder.pool import BrowserPool
+from cofounder.providers import tool_calling_method
+from cofounder.step_cache import StepResultCache
+from cofounder.trace import agent_step_callback, span
+
+StepCallback = Callable[[int, Any], None]
+
+
+async def run_step(
+	step: str,
+	llm,
+	controller,
+	pool: BrowserPool,
+	client=None,
+	timeout: Optional[float] = None,
+	max_steps: int = 100,
+	extract_llm=None,
+) -> Dict[str, Any]:
+	"""Run a single plan step, in its own browser context if it needs one.
+
+	With an HTTP `client`, read-only steps are first answered from a plain page
+	fetch and a single LLM call; only steps that need JavaScript, a login or
+	interaction escalate to a browser agent. `tier` records which one answered.
+	The page is read by `extract_llm` when given, the agent always uses `llm`.
+
+	`timeout` bounds the whole step and `max_steps` the agent's actions. An agent
+	that runs out of time is cancelled and whatever it had extracted so far is
+	returned as a `partial` result.
+	"""
+	from browser_use import Agent
+
+	deadline = None if timeout is None else time.monotonic() + timeout
+
+	if client is not None:
+		try:
+			result = await asyncio.wait_for(http_step(step, extract_llm or llm, client), timeout)
+		except Exception:
+			# Anything going wrong on the fast path, running out of time included, just falls back to the browser
+			result = None
+		if result is not None:
+			return {'step': step, 'result': result, 'success': True, 'tier': 'http'}
+
+	agent = None
+	try:
+		async with pool.context() as context:
+			agent = Agent(
+				task=step,
+				llm=llm,
+				controller=controller,
+				browser_context=context,
+				register_new_step_callback=agent_step_callback(),
+				tool_calling_method=tool_calling_method(llm),
+			)
+			with span('agent.run', cat='agent'):
+				remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+				history = await asyncio.wait_for(agent.run(max_steps=max_steps), remaining)
+	except asyncio.TimeoutError as e:
+		if deadline is None or time.monotonic() < deadline:
+			# Raised inside the step, by a browser launch or page load, rather than by its budget
+			return {'step': step, 'result': None, 'success': False, 'error': str(e) or 'Timed out', 'tier': 'browser'}
+		history = agent.history if agent is not None else None
+		found = [content for content in history.extracted_content() if content] if history else []
+		return {
+			'step': step,
+			'result': '\n'.join(found) or None,
+			'success': bool(found),
+			'partial': True,
+			'error': f'Step timed out after {timeout:.0f}s',
+			'tier': 'browser',
+			'actions': len(history.history) if history else 0,
+		}
+	except Exception as e:
+		return {'step': step, 'result': None, 'success': False, 'error': str(e), 'tier': 'browser'}
+
+	result = history.final_result()
+	return {'step': step, 'result': result, 'success': result is not None, 'tier': 'browser', 'actions': len(history.history)}
+
+
+async def _aiter(steps: Iterable[str]):
+	for step in steps:
+		yield step
+
+
+async def execute_steps(
+	steps: Union[Iterable[str], AsyncIterable[str]],
+	llm,
+	controller,
+	max_workers: int = 1,
+	on_start: Optional[StepCallback] = None,
+	on_done: Optional[StepCallback] = None,
+	pool: Optional[BrowserPool] = None,
+	result_cache: Optional[StepResultCache] = None,
+	http_first: Optional[bool] = None,
+	completed: Optional[Dict[int, Dict[str, Any]]] = None,
+	budget: Optional[MissionBudget] = None,
+	extract_llm=None,
+) -> List[Dict[str, Any]]:
+	"""Execute plan steps with at most `max_workers` agents running at once.
+
+	Every step gets a fresh context from the browser pool, so steps stay isolated
+	from each other. Results are returned in plan order regardless of which step
+	finished first. Callbacks receive the 1-based step number. When no pool is
+	given a temporary one is created and closed again afterwards.
+
+	`steps` may be an async iterable, such as a plan that is still streaming in;
+	each step is dispatched as soon as it arrives.
+
+	Steps with a fresh entry in `result_cache` are answered from it without
+	launching an agent; successful results are written back to it. Steps in
+	`completed`, results of an earlier attempt keyed by step number, are returned
+	as they are, marked `resumed`.
+
+	`http_first` (default: COFOUNDER_HTTP_FIRST, on unless set to 0) tries a
+	plain HTTP fetch before launching a browser for each step, with
+	`extract_llm` (default: `llm`) reading the fetched page.
+
+	With a `budget`, each step starting gets its share of the mission's
+	remaining time and tokens as a timeout and an agent step limit. Steps that
+	would start after the budget ran out are skipped.
+	"""
+	semaphore = asyncio.Semaphore(max(1, max_workers))
+	results: List[Dict[str, Any]] = []
+	owns_pool = pool is None
+	if owns_pool:
+		pool = BrowserPool.from_env(max_concurrency=max_workers)
+	if http_first is None:
+		http_first = os.getenv('COFOUNDER_HTTP_FIRST', '1') != '0'
+	client = http_client() if http_first else None
+	finished = 0
+	planning = True
+
+	def allocate():
+		if budget is None:
+			return None
+		# Steps still streaming in from the planner are not in `results` yet
+		return budget.allocate(budget.steps_left(len(results), finished, planning), max_workers)
+
+	async def worker(i: int, step: str):
+		nonlocal finished
+		if completed and i in completed:
+			if on_start:
+				on_start(i, step)
+			results[i - 1] = {**completed[i], 'resumed': True}
+			finished += 1
+			if on_done:
+				on_done(i, results[i - 1])
+			return
+
+		cached = result_cache.get(step, llm, extract_llm) if result_cache else None
+		if cached is not None:
+			if on_start:
+				on_start(i, step)
+			results[i - 1] = {'step': step, 'result': cached, 'success': True, 'cached': True}
+			finished += 1
+			if on_done:
+				on_done(i, results[i - 1])
+			return
+
+		async with semaphore:
+			if on_start:
+				on_start(i, step)
+			allocation = allocate()
+			if allocation is None:
+				results[i - 1] = await run_step(step, llm, controller, pool, client=client, extract_llm=extract_llm)
+			elif allocation.exhausted:
+				results[i - 1] = {
+					'step': step,
+					'result': None,
+					'success': False,
+					'skipped': True,
+					'error': 'Mission budget exhausted',
+				}
+			else:
+				results[i - 1] = await run_step(
+					step,
+					llm,
+					controller,
+					pool,
+					client=client,
+					timeout=allocation.timeout,
+					max_steps=allocation.max_steps,
+					extract_llm=extract_llm,
+				)
+			finished += 1
+			# Partial results are not worth reusing on the next run
+			if result_cache and results[i - 1]['success'] and not results[i - 1].get('partial'):
+				result_cache.set(step, llm, results[i - 1]['result'], tier=results[i - 1]['tier'], extract_llm=extract_llm)
+			if on_done:
+				on_done(i, results[i - 1])
+
+	if not hasattr(steps, '__aiter__'):
+		steps = _aiter(steps)
+
+	workers = []
+	try:
+		async for step in steps:
+			results.append(None)
+			workers.append(asyncio.create_task(worker(len(results), step)))
+		planning = False
+		await asyncio.gather(*workers)
+	finally:
+		for task in workers:
+			task.cancel()
+		await asyncio.gather(*workers, return_exceptions=True)
+		if client is not None:
+			await client.aclose()
+		if owns_pool:
+			await pool.close()
+
+	return results
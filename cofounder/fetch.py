@@ -0,0 +1,142 @@
+"""Plain HTTP page fetching with main-content extraction, no browser involved."""
+
+import hashlib
+import logging
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Steps mentioning any of these need a real browser, not a page fetch
+INTERACTION_KEYWORDS = (
+	'click',
+	'log in',
+	'login',
+	'sign in',
+	'sign up',
+	'fill',
+	'submit',
+	'search',
+	'post',
+	'scroll',
+	'upload',
+	'download',
+	'book',
+	'buy',
+)
+JS_HINTS = ('enable javascript', 'javascript is required', 'javascript is disabled', 'requires javascript')
+MIN_CONTENT_CHARS = 200
+MAX_CONTENT_CHARS = 30000
+ESCALATE = 'ESCALATE'
+
+URL_PATTERN = re.compile(r'https?://[^\s\'"<>)]+|\b(?:[a-z0-9-]+\.)+[a-z]{2,}(?:/[^\s\'"<>)]*)?', re.IGNORECASE)
+
+EXTRACT_PROMPT = """You are completing one step of a research task using the text content of a web page.
+
+Step: {step}
+Page: {url}
+
+Page content:
+{content}
+
+If the content above is enough to complete the step, reply with the result only.
+If it is not (the page needs JavaScript, a login, clicking or other interaction, or the data is missing),
+reply with exactly {escalate}."""
+
+USER_AGENT = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0 Safari/537.36'
+
+
+@dataclass
+class Page:
+	url: str
+	status: int
+	html: str
+	text: str
+
+	@property
+	def content_hash(self) -> str:
+		"""Hash of the extracted main content, stable across changing markup, ads or nonces."""
+		return hashlib.sha256(self.text.encode()).hexdigest()
+
+
+def http_client(timeout: float = 15):
+	import httpx
+
+	return httpx.AsyncClient(follow_redirects=True, timeout=timeout, headers={'User-Agent': USER_AGENT})
+
+
+def extract_main_content(html: str) -> str:
+	"""Main content of a page as markdown, falling back to its visible text."""
+	try:
+		from main_content_extractor import MainContentExtractor
+
+		text = MainContentExtractor.extract(html, output_format='markdown')
+		if text and text.strip():
+			return text.strip()
+	except Exception as e:
+		logger.debug(f'MainContentExtractor failed, using plain text: {e}')
+
+	from bs4 import BeautifulSoup
+
+	soup = BeautifulSoup(html, 'html.parser')
+	for tag in soup(['script', 'style', 'noscript']):
+		tag.decompose()
+	return soup.get_text(' ', strip=True)
+
+
+async def fetch_page(client, url: str) -> Optional[Page]:
+	"""Fetch a URL over plain HTTP; returns None when it fails or is not HTML."""
+	if '://' not in url:
+		url = f'https://{url}'
+	try:
+		response = await client.get(url)
+	except Exception as e:
+		logger.debug(f'Fetching {url} failed: {e}')
+		return None
+	if response.status_code >= 400 or 'html' not in response.headers.get('content-type', ''):
+		return None
+	return Page(url=str(response.url), status=response.status_code, html=response.text, text=extract_main_content(response.text))
+
+
+def needs_browser(step: str) -> bool:
+	"""Whether a step asks for interaction that only a browser agent can perform."""
+	words = step.lower()
+	return any(re.search(rf'\b{re.escape(keyword)}\b', words) for keyword in INTERACTION_KEYWORDS)
+
+
+def step_url(step: str) -> Optional[str]:
+	"""The first URL or bare domain a step mentions."""
+	match = URL_PATTERN.search(step)
+	return match.group(0).rstrip('.,;:') if match else None
+
+
+def looks_js_rendered(page: Page) -> bool:
+	"""Pages with next to no text, or that ask for JavaScript, were meant for a browser."""
+	text = page.text.lower()
+	return len(text) < MIN_CONTENT_CHARS or (len(text) < 10 * MIN_CONTENT_CHARS and any(hint in text for hint in JS_HINTS))
+
+
+async def http_step(step: str, llm, client) -> Optional[str]:
+	"""Try to answer a read-only step from a plain page fetch and one LLM call.
+
+	Returns None whenever the step should be escalated to a browser agent: it
+	needs interaction, names no page, the page can't be fetched or needs
+	JavaScript, or the model answers ESCALATE.
+	"""
+	url = step_url(step)
+	if url is None or needs_browser(step):
+		return None
+	from cofounder.trace import span
+
+	with span('fetch', cat='http', url=url):
+		page = await fetch_page(client, url)
+	if page is None or looks_js_rendered(page):
+		return None
+
+	prompt = EXTRACT_PROMPT.format(step=step, url=page.url, content=page.text[:MAX_CONTENT_CHARS], escalate=ESCALATE)
+	response = await llm.ainvoke(prompt)
+	result = response.content.strip() if isinstance(response.content, str) else ''
+	if not result or result.upper().startswith(ESCALATE):
+		return None
+	return result
@@ -0,0 +1,186 @@
+"""In-process job queue drained by a fixed pool of async workers."""
+
+import asyncio
+import logging
+import os
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Job:
+	"""A unit of work and its lifecycle: queued -> running -> done / failed / timeout / cancelled."""
+
+	def __init__(self, fn: Callable[..., Awaitable[Any]], args: tuple, timeout: Optional[float], name: str, on_finish=None):
+		self.id = uuid.uuid4().hex[:12]
+		self.fn = fn
+		self.args = args
+		self.timeout = timeout
+		self.name = name
+		self.on_finish = on_finish
+		self.status = 'queued'
+		self.result: Any = None
+		self.error: Optional[str] = None
+		self.enqueued_at = time.time()
+		self.started_at: Optional[float] = None
+		self.finished_at: Optional[float] = None
+		self._finished = asyncio.Event()
+
+	@property
+	def wait_time(self) -> float:
+		"""Seconds spent in the queue so far, or before a worker picked the job up."""
+		return (self.started_at or time.time()) - self.enqueued_at
+
+	async def wait(self) -> 'Job':
+		await self._finished.wait()
+		return self
+
+	def to_dict(self) -> Dict[str, Any]:
+		return {
+			'id': self.id,
+			'name': self.name,
+			'status': self.status,
+			'error': self.error,
+			'enqueued_at': self.enqueued_at,
+			'started_at': self.started_at,
+			'finished_at': self.finished_at,
+			'wait_time': self.wait_time,
+		}
+
+
+class JobQueue:
+	"""Bounded in-process queue with `workers` concurrent consumers and per-job timeouts.
+
+	Workers start on the first `submit`, so the queue can be created outside of a
+	running event loop.
+
+	Args:
+	    workers (int): Jobs run at once
+	    timeout (float, optional): Default per-job timeout in seconds
+	    maxsize (int): Queued jobs accepted before `submit` raises asyncio.QueueFull; 0 for unbounded
+	"""
+
+	def __init__(self, workers: int = 2, timeout: Optional[float] = None, maxsize: int = 0):
+		self.workers = max(1, workers)
+		self.timeout = timeout
+		self.maxsize = maxsize
+		self.running = 0
+		self.processed = 0
+		self.failed = 0
+		self.timed_out = 0
+		self.total_wait = 0.0
+		self.max_wait = 0.0
+		self._queue: Optional[asyncio.Queue] = None
+		self._tasks = []
+
+	@classmethod
+	def from_env(cls, prefix: str = 'COFOUNDER', **defaults) -> 'JobQueue':
+		"""Build a queue configured by <PREFIX>_WORKERS, <PREFIX>_TASK_TIMEOUT and <PREFIX>_QUEUE_SIZE."""
+		timeout = os.getenv(f'{prefix}_TASK_TIMEOUT')
+		return cls(
+			workers=int(os.getenv(f'{prefix}_WORKERS', defaults.get('workers', 2))),
+			timeout=float(timeout) if timeout else defaults.get('timeout'),
+			maxsize=int(os.getenv(f'{prefix}_QUEUE_SIZE', defaults.get('maxsize', 0))),
+		)
+
+	def _ensure_started(self):
+		if self._queue is None:
+			self._queue = asyncio.Queue(self.maxsize)
+			self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+	def submit(
+		self,
+		fn: Callable[..., Awaitable[Any]],
+		*args,
+		timeout: Optional[float] = None,
+		name: str = '',
+		on_finish: Optional[Callable[[Job], Awaitable[None]]] = None,
+	) -> Job:
+		"""Queue `fn(*args)` and return its Job without waiting for it to run.
+
+		`on_finish` is awaited with the finished job whatever its outcome.
+		"""
+		self._ensure_started()
+		job = Job(fn, args, timeout if timeout is not None else self.timeout, name or getattr(fn, '__name__', 'job'), on_finish)
+		self._queue.put_nowait(job)
+		return job
+
+	@property
+	def depth(self) -> int:
+		return self._queue.qsize() if self._queue is not None else 0
+
+	def stats(self) -> Dict[str, Any]:
+		started = self.processed + self.running
+		return {
+			'depth': self.depth,
+			'running': self.running,
+			'workers': self.workers,
+			'processed': self.processed,
+			'failed': self.failed,
+			'timed_out': self.timed_out,
+			'avg_wait': self.total_wait / started if started else 0.0,
+			'max_wait': self.max_wait,
+		}
+
+	async def _worker(self):
+		while True:
+			job = await self._queue.get()
+			try:
+				await self._run(job)
+			finally:
+				self._queue.task_done()
+
+	async def _run(self, job: Job):
+		job.started_at = time.time()
+		self.total_wait += job.wait_time
+		self.max_wait = max(self.max_wait, job.wait_time)
+		job.status = 'running'
+		self.running += 1
+		deadline = None if job.timeout is None else time.monotonic() + job.timeout
+		try:
+			job.result = await asyncio.wait_for(job.fn(*job.args), job.timeout)
+			job.status = 'done'
+		except asyncio.TimeoutError as e:
+			if deadline is not None and time.monotonic() >= deadline:
+				job.status = 'timeout'
+				job.error = f'Timed out after {job.timeout:.0f}s'
+				self.timed_out += 1
+			else:
+				# Raised inside the job, by something it waited on, rather than by the queue's timeout
+				job.status = 'failed'
+				job.error = str(e) or 'Timed out'
+				self.failed += 1
+				logger.error(f'Job {job.name} ({job.id}) failed: {job.error}')
+		except asyncio.CancelledError:
+			job.status = 'cancelled'
+			raise
+		except Exception as e:
+			job.status = 'failed'
+			job.error = str(e)
+			self.failed += 1
+			logger.error(f'Job {job.name} ({job.id}) failed: {e}')
+		finally:
+			self.running -= 1
+			self.processed += 1
+			job.finished_at = time.time()
+			job._finished.set()
+			if job.on_finish:
+				try:
+					await job.on_finish(job)
+				except Exception as e:
+					logger.error(f'on_finish for job {job.id} failed: {e}')
+
+	async def join(self):
+		"""Wait until every queued job has finished."""
+		if self._queue is not None:
+			await self._queue.join()
+
+	async def stop(self):
+		"""Cancel the workers; jobs still queued are dropped."""
+		for task in self._tasks:
+			task.cancel()
+		await asyncio.gather(*self._tasks, return_exceptions=True)
+		self._tasks = []
+		self._queue = None
@@ -0,0 +1,128 @@
+"""Append-only journal of a mission run, so an interrupted run can be resumed.
+
+Every run gets its own directory, COFOUNDER_RUNS_DIR/<run id> (default
+./runs), holding `journal.jsonl` and the run's report. Each pipeline event is
+appended and fsynced as it happens. A crash loses at most the line being
+written, and a torn last line is ignored when the journal is read back.
+"""
+
+import json
+import os
+import secrets
+import time
+from typing import Any, Dict, List, Optional
+
+RUNS_DIR = os.getenv('COFOUNDER_RUNS_DIR', 'runs')
+JOURNAL_FILE = 'journal.jsonl'
+REPORT_FILE = 'report.txt'
+
+# Pipeline events worth keeping; report_chunk and plan_step are superseded by report and plan_done
+JOURNALED_EVENTS = ('plan_done', 'step_started', 'step_finished', 'report')
+
+
+def new_run_id() -> str:
+	"""Sortable, unique enough for concurrent runs: 20250131-142501-3fa9c2."""
+	return f'{time.strftime("%Y%m%d-%H%M%S")}-{secrets.token_hex(3)}'
+
+
+class RunJournal:
+	"""The journal of one run.
+
+	Args:
+	    path (str): The run's directory
+	    events (list): Events already in the journal, when reopening it
+	"""
+
+	def __init__(self, path: str, events: Optional[List[Dict[str, Any]]] = None):
+		self.path = path
+		self.run_id = os.path.basename(os.path.normpath(path))
+		self.events = events or []
+
+	@classmethod
+	def create(cls, task: str, runs_dir: Optional[str] = None, **meta) -> 'RunJournal':
+		"""Start a new run directory; `meta` (provider, model, ...) is kept for resuming."""
+		path = os.path.join(runs_dir or RUNS_DIR, new_run_id())
+		os.makedirs(path)
+		journal = cls(path)
+		journal.append('start', {'task': task, **meta})
+		return journal
+
+	@classmethod
+	def load(cls, run_id: str, runs_dir: Optional[str] = None) -> 'RunJournal':
+		"""Read a run's journal, a run id or its directory; raises FileNotFoundError for an unknown run."""
+		path = run_id if os.path.isdir(run_id) else os.path.join(runs_dir or RUNS_DIR, run_id)
+		events = []
+		intact = 0
+		with open(os.path.join(path, JOURNAL_FILE), 'rb+') as f:
+			for line in f:
+				try:
+					events.append(json.loads(line))
+				except json.JSONDecodeError:
+					# Torn write from a crash; drop it so new records start on a clean line
+					f.truncate(intact)
+					break
+				intact += len(line)
+		journal = cls(path, events)
+		if journal.start is None:
+			raise FileNotFoundError(f'{path} has no journal start record')
+		return journal
+
+	@classmethod
+	def open(cls, run_id: str, runs_dir: Optional[str] = None) -> 'RunJournal':
+		"""Reopen a run to resume it; raises FileNotFoundError for an unknown run."""
+		journal = cls.load(run_id, runs_dir)
+		journal.append('resume', {})
+		return journal
+
+	@property
+	def journal_path(self) -> str:
+		return os.path.join(self.path, JOURNAL_FILE)
+
+	@property
+	def report_path(self) -> str:
+		return os.path.join(self.path, REPORT_FILE)
+
+	def append(self, event: str, payload: Dict[str, Any]):
+		record = {'event': event, 'time': time.time(), **payload}
+		with open(self.journal_path, 'a', encoding='utf-8') as f:
+			f.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+			f.flush()
+			os.fsync(f.fileno())
+		self.events.append(record)
+
+	def record(self, kind: str, payload: Dict[str, Any]):
+		"""Pipeline event callback (see pipeline.EventCallback) journaling the events that matter for resuming."""
+		if kind in JOURNALED_EVENTS:
+			self.append(kind, payload)
+
+	def _last(self, event: str) -> Optional[Dict[str, Any]]:
+		return next((record for record in reversed(self.events) if record['event'] == event), None)
+
+	@property
+	def start(self) -> Optional[Dict[str, Any]]:
+		return self._last('start')
+
+	@property
+	def task(self) -> str:
+		return self.start['task']
+
+	@property
+	def plan(self) -> Optional[List[str]]:
+		"""The recorded plan, None if planning never finished."""
+		record = self._last('plan_done')
+		return record['steps'] if record else None
+
+	@property
+	def completed(self) -> Dict[int, Dict[str, Any]]:
+		"""Successful step results by 1-based step index; partial results of timed out steps are run again."""
+		completed = {}
+		for record in self.events:
+			if record['event'] == 'step_finished' and record.get('success') and not record.get('partial'):
+				completed[record['index']] = {
+					key: record[key] for key in ('step', 'result', 'success', 'tier', 'actions') if key in record
+				}
+		return completed
+
+	@property
+	def finished(self) -> bool:
+		return self._last('report') is not None
@@ -0,0 +1,65 @@
+import json
+from typing import Any, List
+
+
+class StepStreamParser:
+	"""Incrementally parses a streamed JSON array of plan steps.
+
+	`feed` returns every element completed by the new chunk, so callers can act on
+	the first step while the model is still writing the rest. Text before the
+	first opening bracket (prose, code fences, a `{"steps":` wrapper) and after
+	the array is ignored.
+	String elements are emitted as-is; object elements are reduced to their
+	`step` field like the non-streaming parser does.
+	"""
+
+	def __init__(self):
+		self.buffer = ''
+		self.pos = 0
+		self.depth = 0
+		self.in_string = False
+		self.escape = False
+		self.element_start = None
+		self.done = False
+
+	def feed(self, chunk: str) -> List[str]:
+		self.buffer += chunk
+		steps = []
+		while self.pos < len(self.buffer) and not self.done:
+			char = self.buffer[self.pos]
+			if self.in_string:
+				if self.escape:
+					self.escape = False
+				elif char == '\\':
+					self.escape = True
+				elif char == '"':
+					self.in_string = False
+					if self.depth == 1:
+						steps.append(self._element(self.pos + 1))
+			elif char == '"' and self.depth >= 1:
+				self.in_string = True
+				if self.depth == 1:
+					self.element_start = self.pos
+			elif char == '[' or (char == '{' and self.depth >= 1):
+				if self.depth == 1:
+					self.element_start = self.pos
+				self.depth += 1
+			elif char in ']}' and self.depth:
+				self.depth -= 1
+				if self.depth == 1:
+					steps.append(self._element(self.pos + 1))
+				elif self.depth == 0:
+					self.done = True
+			self.pos += 1
+		return [step for step in steps if step is not None]
+
+	def _element(self, end: int):
+		try:
+			value: Any = json.loads(self.buffer[self.element_start : end])
+		except ValueError:
+			return None
+		if isinstance(value, str):
+			return value
+		if isinstance(value, dict):
+			return str(value.get('step', value))
+		return str(value)
@@ -0,0 +1,240 @@
+"""Per-mission accounting of wall time, tokens, cost and browser actions."""
+
+import json
+import time
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import AsyncCallbackHandler
+
+# The mission being measured and the stage (plan, step N, report) LLM calls are
+# attributed to. Both are context variables so concurrent missions and steps,
+# each running in their own asyncio task, are accounted separately.
+current_metrics: ContextVar[Optional['RunMetrics']] = ContextVar('cofounder_metrics', default=None)
+current_stage: ContextVar[str] = ContextVar('cofounder_stage', default='other')
+
+
+def _token_cost(tokens: int, model: Optional[str], token_type: str) -> Optional[float]:
+	"""Estimated USD cost via tokencost (an optional dev dependency); None when unknown."""
+	if not model:
+		return None
+	if not tokens:
+		return 0.0
+	try:
+		from tokencost import calculate_cost_by_tokens
+
+		return float(calculate_cost_by_tokens(tokens, model, token_type))
+	except Exception:
+		return None
+
+
+def _count_tokens(text: str, model: Optional[str]) -> int:
+	try:
+		from tokencost import count_string_tokens
+
+		return count_string_tokens(text, model or 'gpt-4o')
+	except Exception:
+		# Roughly four characters per token for English text
+		return len(text) // 4
+
+
+@dataclass
+class StageMetrics:
+	wall: Optional[float] = None
+	llm_calls: int = 0
+	llm_seconds: float = 0.0
+	input_tokens: int = 0
+	output_tokens: int = 0
+	cost: Optional[float] = 0.0
+	estimated: bool = False
+	actions: Optional[int] = None
+
+	def add(self, other: 'StageMetrics'):
+		self.llm_calls += other.llm_calls
+		self.llm_seconds += other.llm_seconds
+		self.input_tokens += other.input_tokens
+		self.output_tokens += other.output_tokens
+		self.cost = None if self.cost is None or other.cost is None else self.cost + other.cost
+		self.estimated = self.estimated or other.estimated
+		if other.actions is not None:
+			self.actions = (self.actions or 0) + other.actions
+
+
+class RunMetrics:
+	"""Wall time, LLM calls, tokens, cost and browser actions of one mission, per stage.
+
+	Token counts come from the provider's usage metadata when it reports any and
+	are otherwise estimated from the prompt and response text (`estimated`).
+	Cost is None when tokencost isn't installed or doesn't know the model.
+	"""
+
+	def __init__(self):
+		self.stages: Dict[str, StageMetrics] = {}
+		self.models: Dict[str, int] = {}
+
+	def stage(self, name: str) -> StageMetrics:
+		if name not in self.stages:
+			self.stages[name] = StageMetrics()
+		return self.stages[name]
+
+	def record_llm(
+		self, stage: str, model: Optional[str], input_tokens: int, output_tokens: int, seconds: float, estimated: bool
+	):
+		metrics = self.stage(stage)
+		metrics.llm_calls += 1
+		metrics.llm_seconds += seconds
+		metrics.input_tokens += input_tokens
+		metrics.output_tokens += output_tokens
+		metrics.estimated = metrics.estimated or estimated
+		input_cost = _token_cost(input_tokens, model, 'input')
+		output_cost = _token_cost(output_tokens, model, 'output')
+		if metrics.cost is None or input_cost is None or output_cost is None:
+			metrics.cost = None
+		else:
+			metrics.cost += input_cost + output_cost
+		if model:
+			self.models[model] = self.models.get(model, 0) + 1
+
+	def ordered(self):
+		"""Stages in mission order: plan, step 1..N, report, then anything else."""
+
+		def position(name: str):
+			if name == 'plan':
+				return (0, 0)
+			if name.startswith('step '):
+				return (1, int(name.split()[1]))
+			return (2, 0) if name == 'report' else (3, 0)
+
+		return sorted(self.stages.items(), key=lambda item: position(item[0]))
+
+	def total(self, wall: Optional[float] = None) -> StageMetrics:
+		total = StageMetrics(wall=wall)
+		for metrics in self.stages.values():
+			total.add(metrics)
+		return total
+
+	def to_dict(self, wall: Optional[float] = None) -> Dict[str, Any]:
+		return {
+			'stages': {name: asdict(metrics) for name, metrics in self.ordered()},
+			'total': asdict(self.total(wall)),
+			'models': self.models,
+		}
+
+	def table(self, wall: Optional[float] = None):
+		"""A rich table with one row per stage and a total row."""
+		from rich.table import Table
+
+		table = Table(title='📈 Mission metrics', show_footer=False)
+		for column in ('Stage', 'Wall (s)', 'LLM calls', 'LLM (s)', 'Input tok', 'Output tok', 'Cost ($)', 'Actions'):
+			table.add_column(column, justify='left' if column == 'Stage' else 'right')
+
+		def row(name: str, metrics: StageMetrics, style: Optional[str] = None):
+			approx = '~' if metrics.estimated else ''
+			table.add_row(
+				name,
+				f'{metrics.wall:.1f}' if metrics.wall is not None else '-',
+				str(metrics.llm_calls),
+				f'{metrics.llm_seconds:.1f}',
+				f'{approx}{metrics.input_tokens:,}',
+				f'{approx}{metrics.output_tokens:,}',
+				f'{metrics.cost:.4f}' if metrics.cost is not None else '?',
+				str(metrics.actions) if metrics.actions is not None else '-',
+				style=style,
+			)
+
+		for name, metrics in self.ordered():
+			row(name, metrics)
+		row('total', self.total(wall), style='bold')
+		return table
+
+	def write(self, path: str, wall: Optional[float] = None):
+		with open(path, 'w') as f:
+			json.dump(self.to_dict(wall), f, indent=2)
+
+
+def set_stage(name: str):
+	"""Attribute the current task's LLM calls to `name`. Call from inside the task."""
+	current_stage.set(name)
+
+
+async def in_stage(name: str, awaitable):
+	"""Await `awaitable` with its LLM calls attributed to `name`; meant for asyncio.create_task."""
+	set_stage(name)
+	return await awaitable
+
+
+def _message_text(message) -> str:
+	# Multimodal messages (browser_use sends screenshots) only count their text parts
+	if isinstance(message.content, str):
+		return message.content
+	return ' '.join(part.get('text', '') for part in message.content if isinstance(part, dict))
+
+
+def _model_name(metadata: Optional[Dict[str, Any]], invocation_params: Optional[Dict[str, Any]]) -> Optional[str]:
+	metadata = metadata or {}
+	invocation_params = invocation_params or {}
+	return metadata.get('ls_model_name') or invocation_params.get('model_name') or invocation_params.get('model')
+
+
+class MetricsCallback(AsyncCallbackHandler):
+	"""Times every chat model call and records its token usage into `current_metrics`."""
+
+	def __init__(self):
+		self._runs: Dict[UUID, tuple] = {}
+
+	async def on_chat_model_start(self, serialized, messages, *, run_id: UUID, metadata=None, invocation_params=None, **kwargs):
+		prompt = '\n'.join(_message_text(message) for batch in messages for message in batch)
+		self._runs[run_id] = (time.perf_counter(), _model_name(metadata, invocation_params), prompt)
+
+	async def on_llm_error(self, error, *, run_id: UUID, **kwargs):
+		self._runs.pop(run_id, None)
+
+	async def on_llm_end(self, response, *, run_id: UUID, **kwargs):
+		started, model, prompt = self._runs.pop(run_id, (None, None, ''))
+		metrics = current_metrics.get()
+		if started is None or metrics is None:
+			return
+
+		input_tokens = output_tokens = 0
+		text = ''
+		for generations in response.generations:
+			for generation in generations:
+				text += generation.text or ''
+				usage = getattr(getattr(generation, 'message', None), 'usage_metadata', None)
+				if usage:
+					input_tokens += usage.get('input_tokens', 0)
+					output_tokens += usage.get('output_tokens', 0)
+		if not input_tokens and response.llm_output:
+			usage = response.llm_output.get('token_usage') or response.llm_output.get('usage') or {}
+			input_tokens = usage.get('prompt_tokens', 0) or usage.get('input_tokens', 0)
+			output_tokens = usage.get('completion_tokens', 0) or usage.get('output_tokens', 0)
+
+		estimated = not input_tokens
+		if estimated:
+			input_tokens = _count_tokens(prompt, model)
+			output_tokens = _count_tokens(text, model)
+		metrics.record_llm(current_stage.get(), model, input_tokens, output_tokens, time.perf_counter() - started, estimated)
+
+
+_callback = MetricsCallback()
+
+
+def instrument(llm, callback: Optional[AsyncCallbackHandler] = None):
+	"""Attach a shared callback (by default the metrics one) to a chat model, once."""
+	callback = callback or _callback
+	if hasattr(llm, 'fallbacks'):
+		# A routed model with fallbacks: every model in it reports its own calls
+		for model in (llm.runnable, *llm.fallbacks):
+			instrument(model, callback)
+		return llm
+	callbacks = llm.callbacks
+	if callbacks is None:
+		llm.callbacks = [callback]
+	elif isinstance(callbacks, list):
+		if callback not in callbacks:
+			callbacks.append(callback)
+	elif callback not in callbacks.handlers:
+		callbacks.add_handler(callback, inherit=False)
+	return llm
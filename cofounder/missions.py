@@ -0,0 +1,11 @@
+import os
+from typing import List
+
+PROMPTS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'prompts.md')
+
+
+def load_missions(path: str = PROMPTS_FILE) -> List[str]:
+	"""Read preset missions, skipping blank lines and `#` comments like cofounder.sh does."""
+	with open(path, encoding='utf-8') as f:
+		lines = [line.strip() for line in f]
+	return [line for line in lines if line and not line.startswith('#')]
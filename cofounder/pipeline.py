@@ -0,0 +1,641 @@
+"""The mission pipeline shared by every provider: plan, execute, report."""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from browser_use import Controller
+from pydantic import BaseModel
+from rich.console import Console
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.text import Text
+
+from cofounder.budget import MissionBudget
+from cofounder.cache import SqliteCache, cache_key, normalize_text
+from cofounder.executor import execute_steps
+from cofounder.journal import RunJournal
+from cofounder.jsonstream import StepStreamParser
+from cofounder.metrics import RunMetrics, current_metrics, in_stage, instrument, set_stage
+from cofounder.pool import BrowserPool
+from cofounder.providers import model_id
+from cofounder.reporter import StreamingReporter
+from cofounder.routing import ModelRouter
+from cofounder.startup import warm_up
+from cofounder.step_cache import StepResultCache
+from cofounder.trace import begin_step, end_step, span, trace_callback
+
+REPORT_FILE = 'execution_report.txt'
+# Per-mission metrics are written next to the report, e.g. execution_report.metrics.json
+METRICS_SUFFIX = '.metrics.json'
+
+# Receives pipeline progress as (kind, payload): plan_step, plan_done, step_started,
+# step_finished, report_chunk and report
+EventCallback = Callable[[str, Dict[str, Any]], None]
+
+PLAN_PROMPT = """
+TASK ANALYSIS FRAMEWORK:
+Analyze and break down: "{task}"
+
+RULES FOR BREAKING DOWN TASKS:
+1. Each step must target ONE website and visit it ONLY ONCE
+2. Combine ALL actions for a website into single step (navigation, clicks, etc.)
+3. If task can be completed on one website, use SINGLE STEP
+4. Never split actions for same website across multiple steps
+5. Include all necessary actions for target site in one step
+6. Remove redundant navigation (assume browser is already open)
+7. Maximum 3 steps unless absolutely necessary
+
+GOOD EXAMPLE for "What's trending on Hacker News today":
+["Navigate to news.ycombinator.com, click 'newest' link, collect first 10 headlines"]
+
+BAD EXAMPLE (multiple site visits):
+["Go to Hacker News", "Return to Google", "Check Reddit"]
+
+OUTPUT FORMAT:
+["step 1", "step 2", ...]
+"""
+
+TRENDS_REPORT_PROMPT = """
+TASK: {task}
+RAW_DATA: {data}
+
+CREATE 3-PART REPORT THAT IS 1000 WORDS MINIMIUM:
+
+1. TRENDS SUMMARY:
+- Bullet list of key findings
+- Top 3-5 notable items
+
+2. STARTUP RELEVANCE:
+- 1 paragraph: Why this matters for cofounder.sh
+- Potential opportunities/threats
+
+3. MARKETING STRATEGIES:
+- 3 actionable tactics to leverage trends
+- 2 conversation starters for social media
+- 1 quick win implementation idea
+
+FORMATTING RULES:
+- No markdown or section headers
+- Maximum 15 lines total
+- Plain text with • bullets
+- Startup context: We automate technical tasks
+- Keep language casual but professional
+"""
+
+STRUCTURE_PROMPT = """
+TASK TYPE: {task_type}
+EXAMPLE TASK: {task}
+
+1. What type of analysis is needed for this kind of task?
+2. What are the most important aspects to focus on?
+3. How should the information be structured for maximum value?
+
+Provide a reporting framework for tasks of this type that can be reused for similar tasks.
+Include section headers and what each section should contain.
+"""
+
+DYNAMIC_REPORT_PROMPT = """
+TASK: {task}
+DATA: {data}
+STRUCTURE: {structure}
+
+Generate a detailed report following this exact structure.
+Focus on concrete findings and actual data.
+Use → for bullet points, no markdown formatting.
+Include real numbers and specific examples.
+"""
+
+REPAIR_PROMPT = """
+The response below was supposed to break down the task "{task}" into steps, but it is not a valid JSON array of strings.
+
+RESPONSE:
+{response}
+
+Return the same plan as a list of step strings. Follow the original rules: one website per step, maximum 3 steps.
+"""
+
+REPORT_STYLES = ('trends', 'dynamic')
+
+# Keywords that classify a task for reusing report structures; the best-scoring type wins. Keywords match
+# whole words, plurals included, so 'hot' doesn't match "photo" nor 'post' "postgres"
+TASK_TYPES = {
+	'trends': ('trend', 'trending', 'hot', 'news', 'popular', 'latest', 'today'),
+	'market_research': (
+		'research',
+		'company',
+		'companies',
+		'startup',
+		'competitor',
+		'market',
+		'yc',
+		'funding',
+		'invest',
+		'investor',
+		'investment',
+	),
+	'outreach': ('influencer', 'influcner', 'outreach', 'campaign', 'marketing', 'twitter', 'social', 'post'),
+	'recruiting': ('job', 'hire', 'hiring', 'candidate', 'recruit', 'recruiter', 'recruiting', 'apply'),
+}
+_TASK_TYPE_PATTERNS = {
+	task_type: [re.compile(rf'\b{re.escape(keyword)}s?\b') for keyword in keywords] for task_type, keywords in TASK_TYPES.items()
+}
+
+# Part of every plan cache key, so editing the prompt invalidates old plans
+PLAN_PROMPT_HASH = hashlib.sha256(PLAN_PROMPT.encode()).hexdigest()[:16]
+STRUCTURE_PROMPT_HASH = hashlib.sha256(STRUCTURE_PROMPT.encode()).hexdigest()[:16]
+
+
+class TaskBreakdown(BaseModel):
+	steps: List[str]
+
+
+class ExecutionReport(BaseModel):
+	task: str
+	steps_completed: List[Dict[str, Any]]
+	summary: str
+	success: bool
+	recommendations: List[str]
+
+
+class MissionResult(BaseModel):
+	task: str
+	plan: List[str]
+	plan_source: Optional[str] = None
+	steps_completed: List[Dict[str, Any]]
+	report: str
+	timings: Dict[str, Any]
+	metrics: Dict[str, Any] = {}
+
+
+class UniversalController(Controller):
+	def __init__(self):
+		super().__init__(output_model=None)
+
+
+async def stream_to_panel(
+	llm, prompt: str, title: str, console: Console, refresh_per_second: int = 4, on_chunk: Optional[Callable[[str], None]] = None
+) -> str:
+	"""Stream an LLM response into a live panel and return the full text."""
+	panel = Panel('', title=title, border_style='blue')
+	response = ''
+	with Live(panel, refresh_per_second=refresh_per_second, console=console):
+		async for chunk in llm.astream(prompt):
+			response += chunk.content
+			panel.renderable = Text(response, style='cyan')
+			if on_chunk:
+				on_chunk(chunk.content)
+	return response
+
+
+def open_plan_cache() -> SqliteCache:
+	"""Plan cache sized by COFOUNDER_PLANS_CACHE_TTL and COFOUNDER_PLANS_CACHE_SIZE (default one week, 500 plans)."""
+	return SqliteCache.from_env('plans', ttl=7 * 24 * 3600, max_entries=500)
+
+
+def open_plan_stats() -> SqliteCache:
+	"""Persistent counters of how task breakdowns were obtained, see TaskPlanner.SOURCES."""
+	return SqliteCache('plan_sources')
+
+
+class TaskPlanner:
+	"""Breaks a task down into steps and records which path produced the plan.
+
+	Steps are yielded as soon as the model finishes writing each one. The plan is
+	validated against TaskBreakdown; when the streamed response cannot be parsed
+	the planner asks the model to repair it with structured output, and only
+	falls back to running the whole task as one step after REPAIR_ATTEMPTS.
+
+	`source` ends up as one of SOURCES: `cache`, `stream` (valid streamed plan),
+	`partial` (response cut off after some steps), `repaired` or `fallback`.
+	"""
+
+	SOURCES = ('cache', 'stream', 'partial', 'repaired', 'fallback')
+	REPAIR_ATTEMPTS = 2
+
+	def __init__(
+		self,
+		task: str,
+		llm,
+		console: Console,
+		cache: Optional[SqliteCache] = None,
+		stats: Optional[SqliteCache] = None,
+	):
+		self.task = task
+		self.llm = llm
+		self.console = console
+		self.cache = cache
+		self.stats = stats
+		self.source: Optional[str] = None
+		self.response = ''
+
+	async def steps(self) -> AsyncIterator[str]:
+		key = cache_key(normalize_text(self.task), model_id(self.llm), PLAN_PROMPT_HASH)
+		cached = self.cache.get(key) if self.cache is not None else None
+		if cached is not None:
+			self.console.print('🧠 Reusing cached task breakdown', style='blue')
+			self._record('cache')
+			for step in cached:
+				yield step
+			return
+
+		parser = StepStreamParser()
+		steps = []
+		async for chunk in self.llm.astream(PLAN_PROMPT.format(task=self.task)):
+			self.response += chunk.content
+			for step in parser.feed(chunk.content):
+				steps.append(step)
+				yield step
+
+		if steps:
+			self._record('stream' if parser.done else 'partial')
+		else:
+			steps = await self._repair()
+			if steps:
+				self._record('repaired')
+			else:
+				self._record('fallback')
+				yield self.task
+				return
+			for step in steps:
+				yield step
+
+		if self.cache is not None and self.source != 'partial':
+			self.cache.set(key, TaskBreakdown(steps=steps).steps)
+
+	async def _repair(self) -> List[str]:
+		prompt = REPAIR_PROMPT.format(task=self.task, response=self.response)
+		for attempt in range(1, self.REPAIR_ATTEMPTS + 1):
+			self.console.print(f'🔧 Task breakdown was not valid JSON, asking for a repaired plan ({attempt})', style='yellow')
+			try:
+				try:
+					breakdown = await self.llm.with_structured_output(TaskBreakdown).ainvoke(prompt)
+				except NotImplementedError:
+					response = await self.llm.ainvoke(prompt)
+					breakdown = TaskBreakdown(steps=StepStreamParser().feed(response.content))
+			except Exception as e:
+				self.console.print(f'❌ Repair failed: {e}', style='red')
+				continue
+			steps = [step for step in breakdown.steps if step.strip()]
+			if steps:
+				return steps
+		return []
+
+	def _record(self, source: str):
+		self.source = source
+		if source in ('partial', 'fallback'):
+			self.console.print(f'⚠️  Task breakdown source: {source}', style='yellow')
+		if self.stats is not None:
+			self.stats.incr(source)
+
+
+async def break_down_task(task: str, llm, console: Console, cache: Optional[SqliteCache] = None) -> List[str]:
+	"""Use AI to break down the main task into smaller steps."""
+	return [step async for step in TaskPlanner(task, llm, console, cache=cache).steps()]
+
+
+def classify_task(task: str) -> str:
+	"""Map a task onto one of TASK_TYPES, or `general` when no keyword matches."""
+	text = task.lower()
+	scores = {
+		task_type: sum(bool(pattern.search(text)) for pattern in patterns) for task_type, patterns in _TASK_TYPE_PATTERNS.items()
+	}
+	best = max(scores, key=scores.get)
+	return best if scores[best] else 'general'
+
+
+def open_structure_cache() -> SqliteCache:
+	"""Report structure cache sized by COFOUNDER_REPORTS_CACHE_TTL and _SIZE (default 30 days)."""
+	return SqliteCache.from_env('reports', ttl=30 * 24 * 3600, max_entries=100)
+
+
+async def report_structure(task: str, llm, cache: Optional[SqliteCache] = None) -> str:
+	"""Reporting framework for the task's type, generated once per type and model."""
+	task_type = classify_task(task)
+	key = cache_key(task_type, model_id(llm), STRUCTURE_PROMPT_HASH)
+	if cache is not None:
+		structure = cache.get(key)
+		if structure is not None:
+			return structure
+
+	response = await llm.ainvoke(STRUCTURE_PROMPT.format(task_type=task_type.replace('_', ' '), task=task))
+	if cache is not None:
+		cache.set(key, response.content)
+	return response.content
+
+
+async def generate_report(
+	task: str,
+	steps_completed: List[Dict[str, Any]],
+	llm,
+	console: Console,
+	style: str = 'trends',
+	structure_cache: Optional[SqliteCache] = None,
+	structure: Optional[str] = None,
+	on_chunk: Optional[Callable[[str], None]] = None,
+) -> str:
+	"""Generate the final report.
+
+	The `trends` style writes a focused 3-part report with actionable insights.
+	The `dynamic` style follows a report structure for the task's type, which is
+	taken from `structure_cache` when possible so only the report itself needs a
+	model call. A `structure` fetched ahead of time skips that lookup.
+	"""
+	data = json.dumps(steps_completed, separators=(',', ':'), ensure_ascii=False)
+	if style == 'trends':
+		prompt = TRENDS_REPORT_PROMPT.format(task=task, data=data)
+	else:
+		if structure is None:
+			structure = await report_structure(task, llm, cache=structure_cache)
+		prompt = DYNAMIC_REPORT_PROMPT.format(task=task, data=data, structure=structure)
+
+	return await stream_to_panel(llm, prompt, '🔍 Trend Analysis', console, refresh_per_second=10, on_chunk=on_chunk)
+
+
+def raw_report(task: str, steps_completed: List[Dict[str, Any]]) -> str:
+	"""The step results as they came back, for a mission whose budget ran out before its report."""
+	lines = [f'# {task}', '', '⏱️ The mission budget ran out before the report was written; these are the raw step results.']
+	for i, step_result in enumerate(steps_completed, 1):
+		lines += ['', f'## {i}. {step_result["step"]}', str(step_result.get('result') or 'No result')]
+	return '\n'.join(lines)
+
+
+async def plan_within_budget(plan: AsyncIterator[str], budget: MissionBudget, console: Console) -> AsyncIterator[str]:
+	"""Pass planned steps through until the time for steps runs out, then stop planning with the steps so far."""
+	while True:
+		remaining = budget.remaining_seconds()
+		try:
+			step = await asyncio.wait_for(anext(plan), remaining)
+		except StopAsyncIteration:
+			return
+		except asyncio.TimeoutError:
+			remaining = budget.remaining_seconds()
+			# A timeout of the planner's own doesn't mean the mission is out of time
+			if remaining is None or remaining > 0:
+				raise
+			console.print('⏱️  Mission budget exhausted while planning, keeping the steps planned so far', style='bold red')
+			await plan.aclose()
+			return
+		yield step
+
+
+async def run_mission(
+	task: str,
+	llm,
+	console: Optional[Console] = None,
+	max_workers: int = 1,
+	report_style: str = 'trends',
+	pool: Optional[BrowserPool] = None,
+	output: Optional[str] = REPORT_FILE,
+	plan_cache: Optional[SqliteCache] = None,
+	result_cache: Optional[StepResultCache] = None,
+	structure_cache: Optional[SqliteCache] = None,
+	plan_stats: Optional[SqliteCache] = None,
+	http_first: Optional[bool] = None,
+	on_event: Optional[EventCallback] = None,
+	journal: Optional[RunJournal] = None,
+	time_budget: Optional[float] = None,
+	token_budget: Optional[int] = None,
+	models: Optional[ModelRouter] = None,
+) -> MissionResult:
+	"""Plan a mission, execute its steps and write the report.
+
+	`on_event` receives machine-readable progress alongside the console output.
+	Wall time, tokens, cost and browser actions per stage are printed as a table
+	at the end and, when `output` is set, written to METRICS_SUFFIX next to it.
+
+	With a `journal` progress is also appended to the run's journal and the
+	report is saved in the run's directory. A journal that already holds a plan
+	is resumed: the recorded plan is reused and only unfinished steps run.
+
+	`time_budget` (seconds) and `token_budget` (default: COFOUNDER_MISSION_BUDGET
+	and COFOUNDER_MISSION_TOKEN_BUDGET) bound the whole mission. Each step gets
+	its share of what is left when it starts, with room kept for the report;
+	steps that run out of time contribute what they found so far. Planning stops
+	once the steps' share is spent, and a report that can't be written in the
+	rest of the budget is replaced by the raw step results.
+
+	`models` routes planning, browser agents, page extraction and the report to
+	their own models (default: ModelRouter.from_env); `llm` serves every stage
+	without a route.
+
+	Browsers are launched and model connections opened while the task is being
+	planned, unless COFOUNDER_PREWARM is 0. Without a `pool` the mission uses
+	its own, closed once the steps are done.
+	"""
+	console = console or Console()
+	budget = MissionBudget.from_env(seconds=time_budget, tokens=token_budget)
+
+	def emit(kind: str, payload: Dict[str, Any]):
+		if journal is not None:
+			journal.record(kind, payload)
+		if on_event is not None:
+			on_event(kind, payload)
+
+	recorded = journal.plan if journal is not None else None
+	completed = journal.completed if recorded is not None else None
+	if recorded is not None:
+		console.print(f'⏯️  Resuming run {journal.run_id}: {len(completed)}/{len(recorded)} steps already done', style='bold blue')
+	controller = UniversalController()
+	started = time.perf_counter()
+	timings: Dict[str, Any] = {'steps': {}}
+	metrics = RunMetrics()
+	current_metrics.set(metrics)
+	models = models or ModelRouter.from_env(llm)
+	for model in models.models():
+		instrument(model)
+		instrument(model, trace_callback)
+	plan_llm, agent_llm, extract_llm, report_llm = (models.model(stage) for stage in ('plan', 'agent', 'extract', 'report'))
+	for stage, specs in models.routes.items():
+		console.print(f'🔀 {stage}: {" → ".join(specs)}', style='blue')
+
+	# Launch browsers and open model connections while the planner works, so the
+	# first step doesn't wait for them
+	owns_pool = pool is None
+	if owns_pool:
+		pool = BrowserPool.from_env(max_concurrency=max_workers)
+	startup = None
+	if os.getenv('COFOUNDER_PREWARM', '1') != '0':
+		startup = asyncio.create_task(warm_up(pool, models.models()))
+
+	# Execute steps, running up to max_workers of them at once. Each step is
+	# dispatched as soon as the planner finishes writing it, finished steps are
+	# summarized and the report structure is prepared while the others still run.
+	reporter = StreamingReporter(task, report_llm)
+	structure = None
+	if report_style != 'trends':
+		structure = asyncio.create_task(in_stage('report', report_structure(task, report_llm, cache=structure_cache)))
+
+	try:
+		with Progress(
+			SpinnerColumn(),
+			TextColumn('[progress.description]{task.description}'),
+			BarColumn(),
+			TimeElapsedColumn(),
+			console=console,
+		) as progress:
+			progress_tasks = {}
+			steps = []
+			planner = TaskPlanner(task, plan_llm, console, cache=plan_cache, stats=plan_stats)
+
+			def plan_source() -> Optional[str]:
+				return 'journal' if recorded is not None else planner.source
+
+			async def planned_steps():
+				set_stage('plan')
+				planning = progress.add_task('🧠 Breaking down task...', total=None)
+				console.print('\n📋 Task Breakdown (⚡ steps start as soon as they are planned):', style='bold blue')
+				if recorded is not None:
+
+					async def replay():
+						for step in recorded:
+							yield step
+
+					plan = replay()
+				else:
+					plan = planner.steps()
+				with span('break_down_task', track='plan') as planned:
+					async for step in plan_within_budget(plan, budget, console):
+						steps.append(step)
+						console.print(f'{len(steps)}. {step}', style='cyan')
+						emit('plan_step', {'index': len(steps), 'step': step})
+						yield step
+					if planned is not None:
+						planned.args.update(steps=len(steps), source=plan_source())
+				progress.update(planning, completed=True, visible=False)
+				timings['plan'] = time.perf_counter() - started
+				emit('plan_done', {'steps': steps, 'source': plan_source()})
+				console.print(f'📋 Task breakdown complete: {len(steps)} steps', style='bold blue')
+
+			def on_start(i, step):
+				# Runs inside the step's own task, so only its LLM calls are attributed to it
+				set_stage(f'step {i}')
+				begin_step(i, step)
+				console.print(f'\n▶️ Step {i}: {step}', style='yellow')
+				progress_tasks[i] = progress.add_task(f'Executing step {i}...', total=None)
+				timings['steps'][i] = time.perf_counter()
+				emit('step_started', {'index': i, 'step': step})
+
+			def on_done(i, step_result):
+				progress.update(progress_tasks[i], completed=True, visible=False)
+				timings['steps'][i] = time.perf_counter() - timings['steps'][i]
+				end_step(success=step_result['success'], tier=step_result.get('tier'), cached=step_result.get('cached', False))
+				# Show immediate feedback with emoji
+				status = '✅' if step_result['success'] else '❌'
+				style = 'green' if step_result['success'] else 'red'
+				if step_result.get('resumed'):
+					source = ' (from the interrupted run)'
+				elif step_result.get('skipped'):
+					source = ' (skipped, mission budget exhausted)'
+				elif step_result.get('partial'):
+					source = ' (⏱️ out of time, partial result)'
+				elif step_result.get('cached'):
+					source = ' (cached)'
+				elif step_result.get('tier') == 'http':
+					source = ' (⚡ no browser needed)'
+				else:
+					source = ''
+				console.print(f'{status} Step {i} completed{source}', style=style)
+				reporter.submit(i, step_result)
+				emit('step_finished', {'index': i, 'duration': timings['steps'][i], **step_result})
+
+			try:
+				steps_completed = await execute_steps(
+					planned_steps(),
+					agent_llm,
+					controller,
+					max_workers=max_workers,
+					on_start=on_start,
+					on_done=on_done,
+					pool=pool,
+					result_cache=result_cache,
+					http_first=http_first,
+					completed=completed,
+					budget=budget,
+					extract_llm=extract_llm,
+				)
+			finally:
+				if startup is not None:
+					await startup
+				if owns_pool:
+					await pool.close()
+
+		if result_cache is not None:
+			console.print(f'♻️  Step cache: {result_cache.hits} hits, {result_cache.misses} misses', style='blue')
+		fetched = sum(1 for step_result in steps_completed if step_result.get('tier') == 'http')
+		if fetched:
+			console.print(f'⚡ {fetched}/{len(steps_completed)} steps answered with a plain HTTP fetch', style='blue')
+
+		timings['execute'] = time.perf_counter() - started - timings.get('plan', 0)
+
+		# Generate report
+		console.print('\n📊 Final Report', style='bold blue')
+		set_stage('report')
+		report_started = time.perf_counter()
+
+		async def write_report() -> str:
+			report_data = await reporter.collect(steps_completed)
+			return await generate_report(
+				task,
+				report_data,
+				report_llm,
+				console,
+				style=report_style,
+				structure=await structure if structure is not None else None,
+				on_chunk=lambda text: emit('report_chunk', {'text': text}),
+			)
+
+		with span('generate_report', track='report'):
+			try:
+				report = await asyncio.wait_for(write_report(), budget.report_seconds())
+			except asyncio.TimeoutError:
+				remaining = budget.report_seconds()
+				if remaining is None or remaining > 0:
+					raise
+				console.print('⏱️  Mission budget exhausted, reporting the raw step results', style='bold red')
+				report = raw_report(task, steps_completed)
+				console.print(report)
+		emit('report', {'report': report})
+	finally:
+		# Only still running when the mission failed or was cancelled before its report
+		await reporter.aclose()
+		if structure is not None and not structure.done():
+			structure.cancel()
+			await asyncio.gather(structure, return_exceptions=True)
+
+	timings['report'] = time.perf_counter() - report_started
+	timings['total'] = time.perf_counter() - started
+
+	# The run directory keeps this run's own copy, safe from concurrent runs
+	report_files = [path for path in (journal.report_path if journal is not None else None, output) if path]
+	for path in report_files:
+		with open(path, 'w') as f:
+			f.write(report)
+		console.print(f'\n✅ Report saved to {path}', style='green')
+
+	metrics.stage('plan').wall = timings.get('plan')
+	for i, duration in timings['steps'].items():
+		metrics.stage(f'step {i}').wall = duration
+	for i, step_result in enumerate(steps_completed, 1):
+		metrics.stage(f'step {i}').actions = step_result.get('actions')
+	metrics.stage('report').wall = timings['report']
+	console.print(metrics.table(wall=timings['total']))
+	for path in report_files:
+		metrics_file = os.path.splitext(path)[0] + METRICS_SUFFIX
+		metrics.write(metrics_file, wall=timings['total'])
+		console.print(f'📈 Metrics saved to {metrics_file}', style='green')
+
+	return MissionResult(
+		task=task,
+		plan=steps,
+		plan_source=plan_source(),
+		steps_completed=steps_completed,
+		report=report,
+		timings=timings,
+		metrics=metrics.to_dict(wall=timings['total']),
+	)
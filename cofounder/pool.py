@@ -0,0 +1,174 @@
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def process_tree_rss_mb(pid: Optional[int] = None) -> Optional[float]:
+	"""Resident memory of a process and all its descendants, in MB.
+
+	Chromium runs as grandchildren of the Python process (via the Playwright
+	driver), so this walks /proc. Returns None where /proc is unavailable.
+	"""
+	if not os.path.isdir('/proc'):
+		return None
+	pid = pid or os.getpid()
+	children = {}
+	rss = {}
+	for entry in os.listdir('/proc'):
+		if not entry.isdigit():
+			continue
+		try:
+			with open(f'/proc/{entry}/stat') as f:
+				fields = f.read().rsplit(')', 1)[1].split()
+		except OSError:
+			continue
+		# fields[1] is the ppid and fields[21] the rss in pages (after pid/comm)
+		children.setdefault(int(fields[1]), []).append(int(entry))
+		rss[int(entry)] = int(fields[21])
+
+	total = 0
+	stack = [pid]
+	while stack:
+		current = stack.pop()
+		total += rss.get(current, 0)
+		stack.extend(children.get(current, []))
+	return total * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+
+
+class _PooledBrowser:
+	def __init__(self, browser):
+		self.browser = browser
+		self.uses = 0
+		self.active = 0
+		self.retiring = False
+		self._launch: Optional[asyncio.Future] = None
+
+	async def ready(self):
+		"""Launch Chromium if it isn't running yet; concurrent callers share one launch."""
+		if self._launch is None or (self._launch.done() and (self._launch.cancelled() or self._launch.exception())):
+			self._launch = asyncio.ensure_future(self.browser.get_playwright_browser())
+		# A caller giving up must not abort the launch others are waiting for
+		await asyncio.shield(self._launch)
+
+
+class BrowserPool:
+	"""Pre-launched Chromium instances that hand out fresh, isolated contexts.
+
+	Args:
+	    size (int): Number of browsers kept warm
+	    max_concurrency (int, optional): Maximum contexts open at once. Defaults to `size`
+	    max_uses (int): Contexts a browser serves before it is replaced
+	    max_rss_mb (float, optional): Replace browsers once the process tree uses more memory than this
+	    browser_config (BrowserConfig, optional): Configuration for launched browsers
+
+	Usage:
+	    ```python
+	    pool = BrowserPool(size=2)
+	    await pool.start()
+	    async with pool.context() as context:
+	        agent = Agent(task=task, llm=llm, browser_context=context)
+	        await agent.run()
+	    await pool.close()
+	    ```
+	"""
+
+	def __init__(
+		self,
+		size: int = 1,
+		max_concurrency: Optional[int] = None,
+		max_uses: int = 20,
+		max_rss_mb: Optional[float] = None,
+		browser_config=None,
+	):
+		self.size = max(1, size)
+		self.max_concurrency = max(1, max_concurrency or self.size)
+		self.max_uses = max_uses
+		self.max_rss_mb = max_rss_mb
+		self.browser_config = browser_config
+		self._browsers: List[_PooledBrowser] = []
+		self._semaphore = asyncio.Semaphore(self.max_concurrency)
+		self._lock = asyncio.Lock()
+
+	@classmethod
+	def from_env(cls, browser_config=None, **overrides) -> 'BrowserPool':
+		"""Build a pool sized by the COFOUNDER_POOL_* environment variables."""
+		max_rss_mb = os.getenv('COFOUNDER_POOL_MAX_RSS_MB')
+		options = {
+			'size': int(os.getenv('COFOUNDER_POOL_SIZE', '1')),
+			'max_uses': int(os.getenv('COFOUNDER_POOL_MAX_USES', '20')),
+			'max_rss_mb': float(max_rss_mb) if max_rss_mb else None,
+			'browser_config': browser_config,
+		}
+		options.update(overrides)
+		return cls(**options)
+
+	def _new_browser(self) -> _PooledBrowser:
+		from browser_use import Browser, BrowserConfig
+
+		return _PooledBrowser(Browser(config=self.browser_config or BrowserConfig()))
+
+	async def start(self):
+		"""Launch the pool's browsers ahead of the first request."""
+		async with self._lock:
+			while len(self._browsers) < self.size:
+				self._browsers.append(self._new_browser())
+			idle = [entry for entry in self._browsers if not entry.retiring]
+		await asyncio.gather(*(entry.ready() for entry in idle))
+
+	async def _checkout(self) -> _PooledBrowser:
+		async with self._lock:
+			available = [entry for entry in self._browsers if not entry.retiring]
+			if len(available) < self.size:
+				entry = self._new_browser()
+				self._browsers.append(entry)
+				available.append(entry)
+			entry = min(available, key=lambda candidate: candidate.active)
+			entry.active += 1
+			entry.uses += 1
+			if entry.uses >= self.max_uses:
+				entry.retiring = True
+			return entry
+
+	async def _checkin(self, entry: _PooledBrowser):
+		async with self._lock:
+			entry.active -= 1
+			if self.max_rss_mb is not None:
+				rss = process_tree_rss_mb()
+				if rss is not None and rss > self.max_rss_mb:
+					logger.info(f'Browser pool using {rss:.0f} MB, recycling browser')
+					entry.retiring = True
+			if not (entry.retiring and entry.active == 0):
+				return
+			self._browsers.remove(entry)
+		await entry.browser.close()
+
+	@asynccontextmanager
+	async def context(self, config=None):
+		"""Yield a fresh browser context, waiting while the pool is at capacity."""
+		async with self._semaphore:
+			entry = await self._checkout()
+			try:
+				# Possibly still launching from start(), which may run alongside the first checkout
+				await entry.ready()
+				if config is None:
+					context = await entry.browser.new_context()
+				else:
+					context = await entry.browser.new_context(config)
+				try:
+					yield context
+				finally:
+					await context.close()
+			finally:
+				await self._checkin(entry)
+
+	async def close(self):
+		"""Close every browser in the pool."""
+		async with self._lock:
+			browsers, self._browsers = self._browsers, []
+		# Let launches still in flight finish, or their Chromium would outlive the pool
+		await asyncio.gather(*(entry._launch for entry in browsers if entry._launch is not None), return_exceptions=True)
+		await asyncio.gather(*(entry.browser.close() for entry in browsers), return_exceptions=True)
@@ -0,0 +1,181 @@
+"""Registry of LLM providers.
+
+Provider SDKs are imported inside the factories, so looking up or validating a
+provider never pays for importing langchain.
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+OPENROUTER_HEADERS = {
+	'HTTP-Referer': 'http://cofounder.sh',
+	'X-Title': 'Cofounder.sh',
+}
+
+
+@dataclass(frozen=True)
+class Provider:
+	name: str
+	description: str
+	default_model: str
+	factory: Callable[..., object]
+	sdk_module: str
+	env_key: Optional[str] = None
+	report_style: str = 'dynamic'
+	aliases: List[str] = field(default_factory=list)
+
+	def missing_env(self) -> Optional[str]:
+		"""Name of the required environment variable if it is not set."""
+		if self.env_key and not os.getenv(self.env_key):
+			return self.env_key
+		return None
+
+	def create(self, model: Optional[str] = None, timeout: Optional[float] = None, max_retries: Optional[int] = None):
+		"""Import the provider SDK and build a chat model, wrapped in a cassette if COFOUNDER_CASSETTE_MODE asks for one.
+
+		`timeout` (seconds per request) and `max_retries` override the SDK defaults.
+		"""
+		missing = self.missing_env()
+		if missing:
+			raise ValueError(f'{missing} must be set in .env file')
+		options = {key: value for key, value in (('timeout', timeout), ('max_retries', max_retries)) if value is not None}
+		llm = self.factory(model or self.default_model, **options)
+		if os.getenv('COFOUNDER_CASSETTE_MODE', 'passthrough') != 'passthrough':
+			from cofounder.cassette import cassette_from_env
+
+			llm = cassette_from_env(llm)
+		return llm
+
+
+PROVIDERS: Dict[str, Provider] = {}
+_ALIASES: Dict[str, str] = {}
+
+
+def register_provider(provider: Provider) -> Provider:
+	PROVIDERS[provider.name] = provider
+	for alias in provider.aliases:
+		_ALIASES[alias] = provider.name
+	return provider
+
+
+def get_provider(name: str) -> Provider:
+	"""Look up a provider by name or alias."""
+	key = _ALIASES.get(name, name)
+	if key not in PROVIDERS:
+		raise KeyError(f"Unknown provider '{name}'. Available: {', '.join(provider_names())}")
+	return PROVIDERS[key]
+
+
+def provider_names() -> List[str]:
+	return sorted(list(PROVIDERS) + list(_ALIASES))
+
+
+def model_id(llm) -> str:
+	"""Stable identifier of a chat model instance, used in cache keys."""
+	name = getattr(llm, 'model_name', None) or getattr(llm, 'model', None)
+	return f'{type(llm).__name__}:{name}'
+
+
+def tool_calling_method(llm) -> Optional[str]:
+	"""The `tool_calling_method` browser_use's `auto` picks for the model that actually answers.
+
+	browser_use goes by the chat model's class name, so a model behind fallbacks
+	or a cassette would otherwise get no method and the wrapper's default kind of
+	structured output. Pass this to `Agent` instead of relying on `auto`.
+	"""
+	while hasattr(llm, 'fallbacks') or hasattr(llm, 'inner'):
+		llm = llm.runnable if hasattr(llm, 'fallbacks') else llm.inner
+	return 'function_calling' if type(llm).__name__ in ('ChatOpenAI', 'AzureChatOpenAI') else None
+
+
+def _openai(model: str, **options):
+	from langchain_openai import ChatOpenAI
+
+	# stream_usage makes streamed responses report their token counts for the mission metrics
+	return ChatOpenAI(model=model, streaming=True, stream_usage=True, temperature=0.7, **options)
+
+
+def _openrouter(model: str, **options):
+	from langchain_openai import ChatOpenAI
+	from pydantic import SecretStr
+
+	return ChatOpenAI(
+		base_url='https://openrouter.ai/api/v1',
+		model=model,
+		api_key=SecretStr(os.environ['OPENROUTER_API_KEY']),
+		temperature=0.7,
+		max_tokens=2048,
+		default_headers=OPENROUTER_HEADERS,
+		**options,
+	)
+
+
+def _gemini(model: str, **options):
+	from langchain_google_genai import ChatGoogleGenerativeAI
+	from pydantic import SecretStr
+
+	return ChatGoogleGenerativeAI(model=model, api_key=SecretStr(os.environ['GEMINI_API_KEY']), temperature=0.7, **options)
+
+
+def _ollama(model: str, timeout: Optional[float] = None, max_retries: Optional[int] = None):
+	# Optional: Disable telemetry
+	os.environ['ANONYMIZED_TELEMETRY'] = 'false'
+
+	from langchain_ollama import ChatOllama
+
+	# A local server is not retried; the timeout goes to its HTTP client
+	return ChatOllama(model=model, num_ctx=32000, temperature=0.7, client_kwargs={'timeout': timeout} if timeout else {})
+
+
+register_provider(
+	Provider(
+		name='openai',
+		description='OpenAI (Production Ready)',
+		default_model='gpt-4o',
+		factory=_openai,
+		sdk_module='langchain_openai',
+		env_key='OPENAI_API_KEY',
+		report_style='trends',
+	)
+)
+register_provider(
+	Provider(
+		name='openrouter',
+		description='Claude via OpenRouter (Experimental)',
+		default_model='anthropic/claude-3.5-sonnet',
+		factory=_openrouter,
+		sdk_module='langchain_openai',
+		env_key='OPENROUTER_API_KEY',
+		aliases=['claude'],
+	)
+)
+register_provider(
+	Provider(
+		name='deepseek',
+		description='DeepSeek R1 via OpenRouter (Experimental)',
+		default_model='deepseek/deepseek-r1:nitro',
+		factory=_openrouter,
+		sdk_module='langchain_openai',
+		env_key='OPENROUTER_API_KEY',
+	)
+)
+register_provider(
+	Provider(
+		name='gemini',
+		description='Google Gemini (Experimental)',
+		default_model='gemini-2.0-flash-exp',
+		factory=_gemini,
+		sdk_module='langchain_google_genai',
+		env_key='GEMINI_API_KEY',
+	)
+)
+register_provider(
+	Provider(
+		name='ollama',
+		description='Local models through Ollama (Experimental)',
+		default_model='qwen2.5:32b-instruct-q4_K_M',
+		factory=_ollama,
+		sdk_module='langchain_ollama',
+	)
+)
@@ -0,0 +1,63 @@
+import asyncio
+import logging
+import os
+from typing import Any, Dict, List
+
+from cofounder.metrics import in_stage
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_PROMPT = """
+TASK: {task}
+STEP: {step}
+RESULT: {result}
+
+Summarize what this step found that matters for the task in at most 10 short bullet points.
+Keep concrete names, numbers and links. Plain text only.
+"""
+
+
+class StreamingReporter:
+	"""Map stage of the report: summarizes each step result as soon as the step finishes.
+
+	Summaries run while later steps are still browsing, so the final report call
+	only has to merge short summaries. Results shorter than `min_chars` are passed
+	through unchanged since summarizing them would not save anything.
+	"""
+
+	def __init__(self, task: str, llm, min_chars: int = None):
+		self.task = task
+		self.llm = llm
+		self.min_chars = min_chars if min_chars is not None else int(os.getenv('COFOUNDER_SUMMARY_MIN_CHARS', '1500'))
+		self._summaries: Dict[int, asyncio.Task] = {}
+
+	def submit(self, i: int, step_result: Dict[str, Any]):
+		"""Start summarizing a finished step. Must be called from the running event loop."""
+		result = step_result.get('result')
+		if result and len(str(result)) >= self.min_chars:
+			self._summaries[i] = asyncio.create_task(in_stage('report', self._summarize(step_result['step'], str(result))))
+
+	async def _summarize(self, step: str, result: str) -> str:
+		response = await self.llm.ainvoke(SUMMARY_PROMPT.format(task=self.task, step=step, result=result))
+		return response.content
+
+	async def collect(self, steps_completed: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+		"""Step results in plan order, with long results replaced by their summaries."""
+		merged = []
+		for i, step_result in enumerate(steps_completed, 1):
+			summary = self._summaries.get(i)
+			if summary is None:
+				merged.append(step_result)
+				continue
+			try:
+				merged.append({**step_result, 'result': await summary})
+			except Exception as e:
+				logger.warning(f'Could not summarize step {i}, using the full result: {e}')
+				merged.append(step_result)
+		return merged
+
+	async def aclose(self):
+		"""Cancel summaries still running and collect the rest, so none outlives a failed or cancelled mission."""
+		for summary in self._summaries.values():
+			summary.cancel()
+		await asyncio.gather(*self._summaries.values(), return_exceptions=True)
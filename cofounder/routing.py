@@ -0,0 +1,121 @@
+"""Per-stage model routing: a cheap, fast model where it is enough, a strong one where it matters.
+
+A mission calls its model in four stages: `plan` (task breakdown), `agent`
+(every browser action), `extract` (answering a step from a fetched page) and
+`report` (step summaries, report structure and the report itself). Each stage
+can be routed to its own models, the first one preferred and the rest used in
+turn when it fails, is rate limited or times out:
+
+    COFOUNDER_MODEL_PLAN=openai:gpt-4o-mini,gemini
+    COFOUNDER_MODEL_REPORT=openai:gpt-4o-mini,default
+
+or all at once in a JSON file or string, COFOUNDER_ROUTING:
+
+    {"plan": "openai:gpt-4o-mini", "agent": ["openai:gpt-4o", "openrouter"]}
+
+Models are written `provider[:model]` (the provider's default model when
+omitted); `default` is the model the mission was started with. Stages without
+a route use that model.
+"""
+
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from cofounder.providers import get_provider
+
+logger = logging.getLogger(__name__)
+
+STAGES = ('plan', 'agent', 'extract', 'report')
+DEFAULT = 'default'
+
+# Built models are shared by every mission in the process, so routed models stay warm in the daemon too
+_models: Dict[Tuple[str, str, Optional[float]], Any] = {}
+
+
+def parse_spec(spec: str) -> Tuple[str, Optional[str]]:
+	"""`openai:gpt-4o-mini` -> ('openai', 'gpt-4o-mini'); `ollama:qwen2.5:7b` keeps the model's own colons."""
+	provider, _, model = spec.strip().partition(':')
+	return get_provider(provider).name, model or None
+
+
+def _build(spec: str, timeout: Optional[float]):
+	provider_name, model = parse_spec(spec)
+	provider = get_provider(provider_name)
+	model = model or provider.default_model
+	key = (provider.name, model, timeout)
+	if key not in _models:
+		# A model with a fallback gives up quickly instead of retrying a slow or rate limited provider
+		_models[key] = provider.create(model, timeout=timeout, max_retries=0 if timeout else None)
+	return _models[key]
+
+
+class ModelRouter:
+	"""Chat models for each stage of a mission.
+
+	Args:
+	    default: The mission's own model, used by stages without a route
+	    routes (dict): Stage -> model spec or list of specs, preferred first
+	    timeout (float): Seconds before a routed model with fallbacks gives way to the next one
+	"""
+
+	def __init__(self, default, routes: Optional[Dict[str, Union[str, Sequence[str]]]] = None, timeout: Optional[float] = 60):
+		self.default = default
+		self.timeout = timeout
+		self.routes: Dict[str, List[str]] = {}
+		for stage, specs in (routes or {}).items():
+			if stage not in STAGES:
+				raise ValueError(f"Unknown stage '{stage}' in model routing. Stages: {', '.join(STAGES)}")
+			specs = [specs] if isinstance(specs, str) else list(specs)
+			for spec in specs:
+				if spec.strip() != DEFAULT:
+					# Fail on a misspelled provider now rather than halfway through a mission
+					parse_spec(spec)
+			if specs:
+				self.routes[stage] = specs
+		self._stages: Dict[str, Any] = {}
+
+	@classmethod
+	def from_env(cls, default) -> 'ModelRouter':
+		"""Routes from COFOUNDER_ROUTING (JSON, or a path to a JSON file) overridden by COFOUNDER_MODEL_<STAGE>."""
+		routes: Dict[str, Any] = {}
+		config = os.getenv('COFOUNDER_ROUTING', '').strip()
+		if config:
+			if not config.startswith('{'):
+				with open(config, encoding='utf-8') as f:
+					config = f.read()
+			routes.update(json.loads(config))
+		for stage in STAGES:
+			specs = os.getenv(f'COFOUNDER_MODEL_{stage.upper()}')
+			if specs:
+				routes[stage] = [spec.strip() for spec in specs.split(',') if spec.strip()]
+		timeout = os.getenv('COFOUNDER_ROUTING_TIMEOUT')
+		return cls(default, routes, timeout=float(timeout) if timeout else 60)
+
+	def _resolve(self, spec: str, timeout: Optional[float]):
+		return self.default if spec.strip() == DEFAULT else _build(spec, timeout)
+
+	def model(self, stage: str):
+		"""The model for `stage`, with its fallbacks attached."""
+		if stage not in STAGES:
+			raise ValueError(f"Unknown stage '{stage}'. Stages: {', '.join(STAGES)}")
+		if stage not in self.routes:
+			return self.default
+		if stage not in self._stages:
+			specs = self.routes[stage]
+			primary = self._resolve(specs[0], self.timeout if len(specs) > 1 else None)
+			# Only the last fallback may wait as long as its provider likes
+			fallbacks = [self._resolve(spec, self.timeout if i < len(specs) - 1 else None) for i, spec in enumerate(specs[1:], 1)]
+			self._stages[stage] = primary.with_fallbacks(fallbacks) if fallbacks else primary
+			logger.debug(f'{stage} stage routed to {" -> ".join(specs)}')
+		return self._stages[stage]
+
+	def models(self) -> List[Any]:
+		"""Every distinct model the stages use."""
+		distinct = []
+		for stage in STAGES:
+			llm = self.model(stage)
+			if all(llm is not other for other in distinct):
+				distinct.append(llm)
+		return distinct
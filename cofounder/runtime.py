@@ -0,0 +1,121 @@
+"""Warm state shared by the long-running services (daemon and HTTP API)."""
+
+import os
+from typing import Any, Dict, Optional
+
+from cofounder.journal import RunJournal
+from cofounder.missions import PROMPTS_FILE, load_missions
+from cofounder.pipeline import EventCallback, MissionResult, open_plan_cache, open_plan_stats, open_structure_cache, run_mission
+from cofounder.pool import BrowserPool
+from cofounder.providers import get_provider
+from cofounder.step_cache import StepResultCache, open_step_store
+
+
+class Runtime:
+	"""Keeps a browser pool, chat models, caches and the parsed prompts.md alive between missions.
+
+	Missions are described by request dicts with the keys `task` or `mission`
+	(1-based index into prompts.md), `provider`, `model`, `workers`, `report`,
+	`output`, `plan_cache`, `step_cache_ttl`, `http_first`, `budget` (seconds) and
+	`token_budget`; all but the task are optional. A request with `resume` (a run
+	id or run directory) instead continues that run with its task, provider and
+	model.
+
+	Every mission is journaled in its own run directory, announced with a `run`
+	event, so a failed one can be resumed.
+
+	Without a `pool`, the browser pool opens enough contexts for `missions`
+	running at once, unless COFOUNDER_POOL_MAX_CONCURRENCY says otherwise.
+	Requests without a `provider` use `provider`.
+	"""
+
+	def __init__(self, pool: Optional[BrowserPool] = None, missions: int = 1, provider: str = 'openai'):
+		if pool is None:
+			# Enough contexts for `missions` running at once with COFOUNDER_MAX_WORKERS steps each
+			step_workers = int(os.getenv('COFOUNDER_MAX_WORKERS', '1'))
+			concurrency = os.getenv('COFOUNDER_POOL_MAX_CONCURRENCY')
+			pool = BrowserPool.from_env(max_concurrency=int(concurrency) if concurrency else missions * step_workers)
+		self.pool = pool
+		self.provider = get_provider(provider).name
+		self.plan_cache = open_plan_cache()
+		self.structure_cache = open_structure_cache()
+		self.plan_stats = open_plan_stats()
+		# Each mission gets its own StepResultCache (TTL and hit counts) over this one connection
+		self.step_store = open_step_store()
+		self._models: Dict[tuple, Any] = {}
+		self._missions = None
+		self._missions_mtime = None
+
+	def model(self, provider_name: str, model: Optional[str] = None):
+		"""Return a cached chat model so its HTTP connections stay open between missions."""
+		provider = get_provider(provider_name)
+		key = (provider.name, model or provider.default_model)
+		if key not in self._models:
+			self._models[key] = provider.create(model)
+		return self._models[key]
+
+	def missions(self):
+		"""Preset missions, re-read only when prompts.md changes."""
+		mtime = os.path.getmtime(PROMPTS_FILE)
+		if mtime != self._missions_mtime:
+			self._missions = load_missions(PROMPTS_FILE)
+			self._missions_mtime = mtime
+		return self._missions
+
+	def resolve_task(self, request: Dict[str, Any]) -> str:
+		"""The task a request asks for; raises ValueError for an invalid request."""
+		if request.get('resume'):
+			try:
+				return RunJournal.load(request['resume']).task
+			except FileNotFoundError:
+				raise ValueError(f'No run {request["resume"]} to resume') from None
+		if request.get('mission') is not None:
+			missions = self.missions()
+			if not 1 <= request['mission'] <= len(missions):
+				raise ValueError(f'Mission must be between 1 and {len(missions)}')
+			return missions[request['mission'] - 1]
+		if not request.get('task'):
+			raise ValueError('No task given')
+		return request['task']
+
+	async def run(self, request: Dict[str, Any], console, on_event: Optional[EventCallback] = None) -> MissionResult:
+		task = self.resolve_task(request)
+		if request.get('resume'):
+			journal = RunJournal.open(request['resume'])
+			# A resumed run keeps the provider and model it started with
+			provider = get_provider(journal.start.get('provider') or self.provider)
+			model = journal.start.get('model')
+		else:
+			provider = get_provider(request.get('provider') or self.provider)
+			model = request.get('model')
+			journal = RunJournal.create(task, provider=provider.name, model=model)
+		console.print(f'🗂️  Run {journal.run_id}, journal and report in {os.path.abspath(journal.path)}', style='blue')
+		if on_event is not None:
+			on_event('run', {'run_id': journal.run_id})
+		return await run_mission(
+			task,
+			self.model(provider.name, model),
+			console=console,
+			max_workers=request.get('workers') or 1,
+			report_style=request.get('report') or provider.report_style,
+			pool=self.pool,
+			output=request.get('output'),
+			plan_cache=self.plan_cache if request.get('plan_cache', True) else None,
+			result_cache=StepResultCache.from_env(request.get('step_cache_ttl'), cache=self.step_store),
+			structure_cache=self.structure_cache,
+			plan_stats=self.plan_stats,
+			http_first=request.get('http_first'),
+			time_budget=request.get('budget'),
+			token_budget=request.get('token_budget'),
+			journal=journal,
+			on_event=on_event,
+		)
+
+	async def start(self):
+		await self.pool.start()
+		self.missions()
+
+	async def close(self):
+		await self.pool.close()
+		for cache in (self.plan_cache, self.structure_cache, self.plan_stats, self.step_store):
+			cache.close()
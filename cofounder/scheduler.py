@@ -0,0 +1,126 @@
+"""Fair scheduling of chat bot tasks across users and channels."""
+
+import asyncio
+import logging
+from collections import Counter, deque
+from typing import Awaitable, Callable, Deque, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class QueuedTask:
+	"""A browser task waiting for, or holding, a scheduler slot."""
+
+	def __init__(self, user_id: int, channel_id: int, task: str, message=None):
+		self.user_id = user_id
+		self.channel_id = channel_id
+		self.task = task
+		self.message = message
+
+
+class QuotaExceeded(Exception):
+	pass
+
+
+class FairScheduler:
+	"""Runs tasks under a global concurrency cap with per-user and per-channel quotas.
+
+	Each user has their own FIFO queue, and free slots are handed out round-robin
+	across users, so one user's burst cannot starve everyone else. A task whose
+	channel is at its quota is skipped for now without losing its user's turn
+	order.
+
+	Args:
+	    run (Callable): Coroutine function executing a QueuedTask
+	    max_concurrency (int): Tasks running at once across all users
+	    max_per_user (int): Tasks running at once for one user
+	    max_per_channel (int): Tasks running at once in one channel
+	    max_queued_per_user (int): Tasks one user may have waiting; more raise QuotaExceeded
+	"""
+
+	def __init__(
+		self,
+		run: Callable[[QueuedTask], Awaitable[None]],
+		max_concurrency: int = 4,
+		max_per_user: int = 1,
+		max_per_channel: int = 2,
+		max_queued_per_user: int = 5,
+	):
+		self.run = run
+		self.max_concurrency = max_concurrency
+		self.max_per_user = max_per_user
+		self.max_per_channel = max_per_channel
+		self.max_queued_per_user = max_queued_per_user
+		self.pending: Dict[int, Deque[QueuedTask]] = {}
+		self.rotation: Deque[int] = deque()
+		self.running_by_user: Counter = Counter()
+		self.running_by_channel: Counter = Counter()
+		self.running = 0
+		self._tasks = set()
+
+	def submit(self, entry: QueuedTask) -> int:
+		"""Queue a task and return its queue position, 0 if it started right away."""
+		queue = self.pending.setdefault(entry.user_id, deque())
+		if len(queue) >= self.max_queued_per_user:
+			raise QuotaExceeded(f'You already have {len(queue)} tasks queued')
+		if entry.user_id not in self.rotation:
+			self.rotation.append(entry.user_id)
+		queue.append(entry)
+		self._dispatch()
+		return self.position(entry)
+
+	def cancel(self, user_id: int) -> int:
+		"""Drop a user's queued tasks (running ones are left alone) and return how many were dropped."""
+		dropped = len(self.pending.pop(user_id, ()))
+		if user_id in self.rotation:
+			self.rotation.remove(user_id)
+		return dropped
+
+	def position(self, entry: QueuedTask) -> int:
+		"""1-based position in the round-robin order, 0 if the task is not waiting."""
+		queue = self.pending.get(entry.user_id, ())
+		if entry not in queue:
+			return 0
+		depth = list(queue).index(entry)
+		position = 0
+		for user_id in self.rotation:
+			# Users ahead in the rotation get one more turn at the same depth
+			turns = depth + 1 if self.rotation.index(user_id) <= self.rotation.index(entry.user_id) else depth
+			position += min(len(self.pending[user_id]), turns)
+		return position
+
+	def _eligible(self, user_id: int) -> bool:
+		if self.running_by_user[user_id] >= self.max_per_user:
+			return False
+		return self.running_by_channel[self.pending[user_id][0].channel_id] < self.max_per_channel
+
+	def _dispatch(self):
+		while self.running < self.max_concurrency:
+			user_id = next((user_id for user_id in self.rotation if self._eligible(user_id)), None)
+			if user_id is None:
+				return
+			entry = self.pending[user_id].popleft()
+			# Move the user to the back of the line for fairness
+			self.rotation.remove(user_id)
+			if self.pending[user_id]:
+				self.rotation.append(user_id)
+			else:
+				del self.pending[user_id]
+
+			self.running += 1
+			self.running_by_user[entry.user_id] += 1
+			self.running_by_channel[entry.channel_id] += 1
+			task = asyncio.create_task(self._run(entry))
+			self._tasks.add(task)
+			task.add_done_callback(self._tasks.discard)
+
+	async def _run(self, entry: QueuedTask):
+		try:
+			await self.run(entry)
+		except Exception:
+			logger.exception(f'Scheduled task of user {entry.user_id} in channel {entry.channel_id} failed')
+		finally:
+			self.running -= 1
+			self.running_by_user[entry.user_id] -= 1
+			self.running_by_channel[entry.channel_id] -= 1
+			self._dispatch()
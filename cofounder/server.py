@@ -0,0 +1,172 @@
+"""Local HTTP job API for running missions programmatically.
+
+    POST /jobs                 submit a mission, returns its job id
+    GET  /jobs                 queue statistics and recent jobs
+    GET  /jobs/{id}            job status, and the result once finished
+    GET  /jobs/{id}/events     Server-Sent Events: plan, step and report progress
+
+Jobs run on a shared JobQueue against one warm Runtime, so submitting a
+mission does not spawn a process or re-import the stack. Requests without a
+`provider` use COFOUNDER_PROVIDER (`python -m cofounder --api --provider ...`).
+"""
+
+import asyncio
+import bisect
+import json
+import os
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from rich.console import Console
+
+from cofounder.jobs import Job, JobQueue
+from cofounder.runtime import Runtime
+
+# Finished jobs beyond this many are forgotten, oldest first
+MAX_JOBS = int(os.getenv('COFOUNDER_API_MAX_JOBS', '1000'))
+
+# Provider of requests that don't name one; the CLI sets it from --provider
+default_provider = os.getenv('COFOUNDER_PROVIDER', 'openai')
+
+
+class JobRequest(BaseModel):
+	task: Optional[str] = None
+	mission: Optional[int] = None
+	provider: Optional[str] = None
+	model: Optional[str] = None
+	workers: int = 1
+	report: Optional[str] = None
+	plan_cache: bool = True
+	step_cache_ttl: Optional[float] = None
+	http_first: Optional[bool] = None
+	budget: Optional[float] = None
+	token_budget: Optional[int] = None
+	resume: Optional[str] = None
+
+
+class MissionJob:
+	"""A submitted mission, its event log and the subscribers following it.
+
+	`report_chunk` events, one per streamed token, are only kept while the job
+	runs; once it is finished the `report` event carries the whole text.
+	"""
+
+	def __init__(self, request: JobRequest):
+		self.request = request
+		self.job: Optional[Job] = None
+		self.events: List[Dict[str, Any]] = []
+		self.result: Optional[Dict[str, Any]] = None
+		self.finished = False
+		self._changed = asyncio.Event()
+		self._next_id = 0
+
+	def emit(self, kind: str, payload: Dict[str, Any]):
+		self.events.append({'id': self._next_id, 'event': kind, 'data': payload})
+		self._next_id += 1
+		# Wake current followers and hand later ones a fresh event to wait on
+		changed, self._changed = self._changed, asyncio.Event()
+		changed.set()
+
+	async def finish(self, job: Job):
+		self.finished = True
+		self.events = [event for event in self.events if event['event'] != 'report_chunk']
+		self.emit('done' if job.status == 'done' else 'error', {'status': job.status, 'error': job.error})
+
+	async def follow(self):
+		"""Yield every event so far, then new ones as they arrive, until the job finishes."""
+		# Followers remember the id of the last event they got, which stays valid when chunks are dropped
+		sent = -1
+		while True:
+			changed = self._changed
+			for event in self.events[bisect.bisect_right(self.events, sent, key=lambda event: event['id']) :]:
+				yield event
+				sent = event['id']
+			if self.finished:
+				return
+			await changed.wait()
+
+	def to_dict(self) -> Dict[str, Any]:
+		status = self.job.to_dict() if self.job else {'status': 'queued'}
+		return {**status, 'request': self.request.model_dump(), 'events': len(self.events), 'result': self.result}
+
+
+runtime: Optional[Runtime] = None
+queue = JobQueue.from_env(prefix='COFOUNDER_API', timeout=1800)
+jobs: 'OrderedDict[str, MissionJob]' = OrderedDict()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+	global runtime
+	runtime = Runtime(missions=queue.workers, provider=default_provider)
+	await runtime.start()
+	try:
+		yield
+	finally:
+		await queue.stop()
+		await runtime.close()
+
+
+app = FastAPI(title='Cofounder.sh jobs', lifespan=lifespan)
+
+
+async def _run(mission: MissionJob):
+	result = await runtime.run(mission.request.model_dump(exclude_none=True), Console(quiet=True), on_event=mission.emit)
+	mission.result = result.model_dump()
+
+
+def _forget_old_jobs():
+	while len(jobs) > MAX_JOBS:
+		oldest = next((job_id for job_id, mission in jobs.items() if mission.finished), None)
+		if oldest is None:
+			return
+		del jobs[oldest]
+
+
+@app.post('/jobs', status_code=202)
+async def submit_job(request: JobRequest):
+	try:
+		runtime.resolve_task(request.model_dump())
+	except ValueError as e:
+		raise HTTPException(status_code=400, detail=str(e))
+
+	mission = MissionJob(request)
+	try:
+		mission.job = queue.submit(_run, mission, name=request.task or f'mission {request.mission}', on_finish=mission.finish)
+	except asyncio.QueueFull:
+		raise HTTPException(status_code=503, detail='Job queue is full')
+	jobs[mission.job.id] = mission
+	_forget_old_jobs()
+	return {'id': mission.job.id, 'status': mission.job.status, 'queue_depth': queue.depth}
+
+
+@app.get('/jobs')
+async def list_jobs(limit: int = 50):
+	recent = list(jobs.values())[-limit:]
+	return {'queue': queue.stats(), 'jobs': [mission.job.to_dict() for mission in reversed(recent)]}
+
+
+def _get(job_id: str) -> MissionJob:
+	if job_id not in jobs:
+		raise HTTPException(status_code=404, detail='Unknown job')
+	return jobs[job_id]
+
+
+@app.get('/jobs/{job_id}')
+async def get_job(job_id: str):
+	return _get(job_id).to_dict()
+
+
+@app.get('/jobs/{job_id}/events')
+async def job_events(job_id: str):
+	mission = _get(job_id)
+
+	async def stream():
+		async for event in mission.follow():
+			yield f'id: {event["id"]}\nevent: {event["event"]}\ndata: {json.dumps(event["data"], default=str)}\n\n'
+
+	return StreamingResponse(stream(), media_type='text/event-stream', headers={'Cache-Control': 'no-cache'})
@@ -0,0 +1,67 @@
+"""Mission startup work that runs alongside planning instead of before or after it.
+
+Launching Chromium and opening each model's connection (or loading a local
+Ollama model into memory) take a few seconds that used to be paid in series:
+build the model, plan, then launch a browser for the first step. `warm_up`
+starts all of them while the planner is still thinking, so the first step
+finds a running browser and warm connections.
+"""
+
+import asyncio
+import logging
+from typing import Any, Iterable, Iterator, Optional
+
+from cofounder.pool import BrowserPool
+from cofounder.providers import model_id
+from cofounder.trace import span
+
+logger = logging.getLogger(__name__)
+
+
+def _unwrap(llm) -> Iterator[Any]:
+	"""The chat models that actually talk to a provider: fallbacks are expanded, replaying cassettes skipped."""
+	if hasattr(llm, 'fallbacks'):
+		for model in (llm.runnable, *llm.fallbacks):
+			yield from _unwrap(model)
+	elif hasattr(llm, 'inner'):
+		if llm.mode != 'replay':
+			yield from _unwrap(llm.inner)
+	else:
+		yield llm
+
+
+async def warm_model(llm) -> bool:
+	"""Open a model's connection without generating anything; False when there is no cheap way to."""
+	client = getattr(llm, 'root_async_client', None)
+	if client is not None:
+		# OpenAI and OpenAI-compatible APIs (OpenRouter): listing models sets up TLS and the connection pool
+		await client.models.list()
+		return True
+	if type(llm).__name__ == 'ChatOllama':
+		# An empty prompt makes Ollama load the model into memory and return
+		await llm._async_client.generate(model=llm.model, keep_alive=llm.keep_alive)
+		return True
+	return False
+
+
+async def _warm(name: str, work) -> None:
+	with span(name, cat='startup', track='startup'):
+		try:
+			await work
+		except Exception as e:
+			# Only a head start: whatever failed here is tried again, and reported, when it is needed
+			logger.warning(f'Warming up {name} failed: {e}')
+
+
+async def warm_up(pool: Optional[BrowserPool], models: Iterable[Any]) -> None:
+	"""Launch the pool's browsers and warm every distinct model at the same time."""
+	jobs = []
+	if pool is not None:
+		jobs.append(_warm('browser.launch', pool.start()))
+	seen = set()
+	for llm in models:
+		for model in _unwrap(llm):
+			if id(model) not in seen:
+				seen.add(id(model))
+				jobs.append(_warm(f'model.connect {model_id(model)}', warm_model(model)))
+	await asyncio.gather(*jobs)
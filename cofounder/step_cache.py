@@ -0,0 +1,92 @@
+import os
+import re
+import time
+from typing import Dict, Optional
+
+from cofounder.cache import SqliteCache, cache_key, normalize_text
+from cofounder.providers import model_id
+
+DOMAIN_PATTERN = re.compile(r'\b((?:[a-z0-9-]+\.)+[a-z]{2,})\b', re.IGNORECASE)
+
+# Entries are dropped from disk after this long whatever the freshness window
+MAX_AGE = 7 * 24 * 3600
+
+
+def parse_domain_ttls(spec: str) -> Dict[str, float]:
+	"""Parse `news.ycombinator.com=900,twitter.com=0` into a domain -> seconds mapping."""
+	ttls = {}
+	for item in filter(None, (part.strip() for part in spec.split(','))):
+		domain, _, seconds = item.partition('=')
+		ttls[domain.strip().lower()] = float(seconds)
+	return ttls
+
+
+def step_domains(step: str):
+	return [domain.lower() for domain in DOMAIN_PATTERN.findall(step)]
+
+
+def open_step_store() -> SqliteCache:
+	"""Backing store of StepResultCache, sized by COFOUNDER_STEPS_CACHE_SIZE (default 2000 results)."""
+	return SqliteCache.from_env('steps', ttl=MAX_AGE, max_entries=2000)
+
+
+class StepResultCache:
+	"""Stores `history.final_result()` per step so reruns within the freshness window skip the browser.
+
+	Results are kept per tier and per model that produced them: the agent model
+	for browser answers, the extraction model for answers read from a plain
+	HTTP fetch. Changing either model's routing therefore starts afresh.
+
+	Args:
+	    cache (SqliteCache): Backing store
+	    ttl (float): Default freshness window in seconds; 0 disables the cache
+	    domain_ttls (dict, optional): Freshness windows for steps mentioning a domain.
+	        A domain also matches its subdomains, and the shortest matching window wins
+	"""
+
+	def __init__(self, cache: SqliteCache, ttl: float = 3600, domain_ttls: Optional[Dict[str, float]] = None):
+		self.cache = cache
+		self.ttl = ttl
+		self.domain_ttls = domain_ttls or {}
+		self.hits = 0
+		self.misses = 0
+
+	@classmethod
+	def from_env(cls, ttl: Optional[float] = None, cache: Optional[SqliteCache] = None) -> 'StepResultCache':
+		"""Configure from COFOUNDER_STEP_CACHE_TTL and COFOUNDER_STEP_CACHE_DOMAIN_TTLS, with `ttl` taking precedence.
+
+		Long-running services pass the `cache` they keep open, see open_step_store.
+		"""
+		if ttl is None:
+			ttl = float(os.getenv('COFOUNDER_STEP_CACHE_TTL', '3600'))
+		domain_ttls = parse_domain_ttls(os.getenv('COFOUNDER_STEP_CACHE_DOMAIN_TTLS', ''))
+		return cls(cache if cache is not None else open_step_store(), ttl=ttl, domain_ttls=domain_ttls)
+
+	def ttl_for(self, step: str) -> float:
+		windows = [
+			seconds
+			for domain in step_domains(step)
+			for suffix, seconds in self.domain_ttls.items()
+			if domain == suffix or domain.endswith('.' + suffix)
+		]
+		return min(windows) if windows else self.ttl
+
+	def key(self, step: str, tier: str, llm) -> str:
+		return cache_key(normalize_text(step), tier, model_id(llm))
+
+	def get(self, step: str, llm, extract_llm=None) -> Optional[str]:
+		"""A fresh result from either tier: read by `extract_llm` (default `llm`) or browsed by `llm`."""
+		ttl = self.ttl_for(step)
+		if ttl > 0:
+			for tier, model in (('http', extract_llm or llm), ('browser', llm)):
+				entry = self.cache.get(self.key(step, tier, model))
+				if entry is not None and time.time() - entry['stored'] <= ttl:
+					self.hits += 1
+					return entry['result']
+		self.misses += 1
+		return None
+
+	def set(self, step: str, llm, result: str, tier: str = 'browser', extract_llm=None):
+		if self.ttl_for(step) > 0:
+			model = (extract_llm or llm) if tier == 'http' else llm
+			self.cache.set(self.key(step, tier, model), {'result': result, 'stored': time.time()})
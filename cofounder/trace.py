@@ -0,0 +1,211 @@
+"""Chrome Trace Event timelines of a mission, viewable in chrome://tracing or Perfetto."""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import AsyncCallbackHandler
+
+from cofounder.metrics import current_stage
+
+# The active tracer and the span opened by the current task. Both are context
+# variables, so concurrent steps each see their own span and nothing is
+# recorded unless a tracer was installed with `current_tracer.set()`.
+current_tracer: ContextVar[Optional['Tracer']] = ContextVar('cofounder_tracer', default=None)
+current_span: ContextVar[Optional['Span']] = ContextVar('cofounder_span', default=None)
+
+
+@dataclass
+class Span:
+	name: str
+	cat: str
+	track: str
+	lane: int
+	start: float
+	args: Dict[str, Any] = field(default_factory=dict)
+
+
+class Tracer:
+	"""Collects spans and lays them out as Chrome Trace Event complete ("X") events.
+
+	Every track (plan, step N, report) is shown as a thread. A span nests inside
+	its parent when the parent is the innermost open span of its lane; spans
+	that overlap without nesting, such as concurrent LLM calls of one step, get
+	an extra lane ("step 1 (2)") so the timeline stays readable.
+	"""
+
+	def __init__(self):
+		self.origin = time.perf_counter()
+		self.events: List[Dict[str, Any]] = []
+		self._lanes: Dict[tuple, List[Span]] = {}
+		self._tids: Dict[tuple, int] = {}
+		self._navigation: Dict[int, Span] = {}
+
+	def _tid(self, track: str, lane: int) -> int:
+		key = (track, lane)
+		if key not in self._tids:
+			self._tids[key] = len(self._tids) + 1
+			name = track if lane == 0 else f'{track} ({lane + 1})'
+			ids = {'pid': os.getpid(), 'tid': self._tids[key]}
+			self.events.append({'ph': 'M', 'name': 'thread_name', **ids, 'args': {'name': name}})
+			self.events.append({'ph': 'M', 'name': 'thread_sort_index', **ids, 'args': {'sort_index': _sort_index(track, lane)}})
+		return self._tids[key]
+
+	def begin(self, name: str, cat: str, track: Optional[str] = None, parent: Optional[Span] = None, **args) -> Span:
+		"""Open a span; roots pass a `track`, children a `parent` to nest under."""
+		if parent is not None:
+			track = parent.track
+			stack = self._lanes.get((track, parent.lane))
+			if stack and stack[-1] is parent:
+				return self._push(Span(name, cat, track, parent.lane, time.perf_counter(), args))
+		track = track or 'other'
+		lane = 0
+		while self._lanes.get((track, lane)):
+			lane += 1
+		return self._push(Span(name, cat, track, lane, time.perf_counter(), args))
+
+	def _push(self, span: Span) -> Span:
+		self._lanes.setdefault((span.track, span.lane), []).append(span)
+		return span
+
+	def end(self, span: Span, **args):
+		stack = self._lanes.get((span.track, span.lane), [])
+		if span in stack:
+			stack.remove(span)
+		end = time.perf_counter()
+		self.events.append(
+			{
+				'ph': 'X',
+				'name': span.name,
+				'cat': span.cat,
+				'pid': os.getpid(),
+				'tid': self._tid(span.track, span.lane),
+				'ts': (span.start - self.origin) * 1e6,
+				'dur': (end - span.start) * 1e6,
+				'args': {**span.args, **args},
+			}
+		)
+
+	def begin_navigation(self, parent: Optional[Span], name: str, **args):
+		"""Browser actions of an agent step last until its next LLM call or the end of the step."""
+		self.end_navigation(parent)
+		if parent is not None:
+			self._navigation[id(parent)] = self.begin(name, 'browser', parent=parent, **args)
+
+	def end_navigation(self, parent: Optional[Span]):
+		if parent is not None and id(parent) in self._navigation:
+			self.end(self._navigation.pop(id(parent)))
+
+	def write(self, path: str):
+		with open(path, 'w') as f:
+			json.dump(
+				{
+					'traceEvents': [
+						{'ph': 'M', 'name': 'process_name', 'pid': os.getpid(), 'args': {'name': 'cofounder mission'}},
+						*self.events,
+					],
+					'displayTimeUnit': 'ms',
+				},
+				f,
+			)
+
+
+def _sort_index(track: str, lane: int) -> int:
+	if track == 'plan':
+		order = 0
+	elif track.startswith('step '):
+		order = int(track.split()[1])
+	elif track == 'report':
+		order = 10_000
+	else:
+		order = 20_000
+	return order * 100 + lane
+
+
+@contextmanager
+def span(name: str, cat: str = 'mission', track: Optional[str] = None, **args):
+	"""Record a span of the current task; a no-op when no tracer is installed.
+
+	Without a `track` the span nests under the task's current span, or goes on
+	the track of the current metrics stage.
+	"""
+	tracer = current_tracer.get()
+	if tracer is None:
+		yield None
+		return
+	parent = None if track else current_span.get()
+	opened = tracer.begin(name, cat, track=track or (None if parent else current_stage.get()), parent=parent, **args)
+	token = current_span.set(opened)
+	try:
+		yield opened
+	finally:
+		current_span.reset(token)
+		tracer.end_navigation(opened)
+		tracer.end(opened)
+
+
+def begin_step(i: int, step: str):
+	"""Open step `i`'s root span in the step's own task, to be closed by `end_step`."""
+	tracer = current_tracer.get()
+	if tracer is not None:
+		current_span.set(tracer.begin(f'step {i}', 'step', track=f'step {i}', step=step))
+
+
+def end_step(**args):
+	tracer = current_tracer.get()
+	opened = current_span.get()
+	if tracer is not None and opened is not None:
+		tracer.end_navigation(opened)
+		tracer.end(opened, **args)
+		current_span.set(None)
+
+
+def agent_step_callback():
+	"""An Agent `register_new_step_callback` marking the browser actions it chose, or None when not tracing."""
+	tracer = current_tracer.get()
+	if tracer is None:
+		return None
+
+	def on_step(state, model_output, n_steps: int):
+		# Called from inside agent.run(), so the current span is the agent's
+		parent = current_span.get()
+		actions = [action.model_dump(exclude_unset=True) for action in getattr(model_output, 'action', None) or []]
+		name = ', '.join(name for action in actions for name in action) or 'browser'
+		tracer.begin_navigation(parent, name, agent_step=n_steps, url=getattr(state, 'url', None), actions=actions)
+
+	return on_step
+
+
+class TraceCallback(AsyncCallbackHandler):
+	"""Records every chat model call as an `llm` span under the calling task's span."""
+
+	def __init__(self):
+		self._runs: Dict[UUID, tuple] = {}
+
+	async def on_chat_model_start(self, serialized, messages, *, run_id: UUID, metadata=None, **kwargs):
+		tracer = current_tracer.get()
+		if tracer is None:
+			return
+		parent = current_span.get()
+		tracer.end_navigation(parent)
+		model = (metadata or {}).get('ls_model_name')
+		track = None if parent else current_stage.get()
+		self._runs[run_id] = (tracer, tracer.begin('llm', 'llm', track=track, parent=parent, model=model))
+
+	async def on_llm_end(self, response, *, run_id: UUID, **kwargs):
+		if run_id in self._runs:
+			tracer, opened = self._runs.pop(run_id)
+			tracer.end(opened)
+
+	async def on_llm_error(self, error, *, run_id: UUID, **kwargs):
+		if run_id in self._runs:
+			tracer, opened = self._runs.pop(run_id)
+			tracer.end(opened, error=str(error))
+
+
+trace_callback = TraceCallback()
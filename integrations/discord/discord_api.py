@@ -1,10 +1,13 @@
 import discord
+from browser_use import BrowserConfig
+from browser_use.agent.service import Agent
 from discord.ext import commands
 from dotenv import load_dotenv
 from langchain_core.language_models.chat_models import BaseChatModel
 
-from browser_use import BrowserConfig
-from browser_use.agent.service import Agent, Browser
+from cofounder.pool import BrowserPool
+from cofounder.providers import tool_calling_method
+from cofounder.scheduler import FairScheduler, QueuedTask, QuotaExceeded
 
 load_dotenv()
 
@@ -22,6 +25,13 @@ class DiscordBot(commands.Bot):
 	    ack (bool, optional): Whether to acknowledge task receipt with a message. Defaults to False
 	    browser_config (BrowserConfig, optional): Browser configuration settings.
 	        Defaults to headless mode
+	    browser_pool (BrowserPool, optional): Warm browsers shared across tasks.
+	        Defaults to a pool built from the COFOUNDER_POOL_* environment variables,
+	        allowing `max_concurrency` contexts at once
+	    max_concurrency (int, optional): Browser tasks running at once. Defaults to 4
+	    max_per_user (int, optional): Browser tasks running at once per user. Defaults to 1
+	    max_per_channel (int, optional): Browser tasks running at once per channel. Defaults to 2
+	    max_queued_per_user (int, optional): Tasks a user may have waiting. Defaults to 5
 
 	Usage:
 	    ```python
@@ -35,6 +45,8 @@ class DiscordBot(commands.Bot):
 	Discord Usage:
 	    Send messages starting with the prefix:
 	    "$bu search for python tutorials"
+	    Cancel your own queued tasks with:
+	    "$bu cancel"
 	"""
 
 	def __init__(
@@ -43,11 +55,24 @@ class DiscordBot(commands.Bot):
 		prefix: str = '$bu',
 		ack: bool = False,
 		browser_config: BrowserConfig = BrowserConfig(headless=True),
+		browser_pool: BrowserPool = None,
+		max_concurrency: int = 4,
+		max_per_user: int = 1,
+		max_per_channel: int = 2,
+		max_queued_per_user: int = 5,
 	):
 		self.llm = llm
 		self.prefix = prefix.strip()
 		self.ack = ack
 		self.browser_config = browser_config
+		self.browser_pool = browser_pool or BrowserPool.from_env(browser_config=browser_config, max_concurrency=max_concurrency)
+		self.scheduler = FairScheduler(
+			self.execute_task,
+			max_concurrency=max_concurrency,
+			max_per_user=max_per_user,
+			max_per_channel=max_per_channel,
+			max_queued_per_user=max_queued_per_user,
+		)
 
 		# Define intents.
 		intents = discord.Intents.default()
@@ -65,18 +90,39 @@ class DiscordBot(commands.Bot):
 		"""Called when the bot is ready."""
 		try:
 			print(f'We have logged in as {self.user}')
+			await self.browser_pool.start()
 			cmds = await self.tree.sync()  # Sync the command tree with discord
 
 		except Exception as e:
 			print(f'Error during bot startup: {e}')
 
+	async def close(self):
+		"""Close the browser pool along with the Discord connection."""
+		await self.browser_pool.close()
+		await super().close()
+
 	async def on_message(self, message):
 		"""Called when a message is received."""
 		try:
 			if message.author == self.user:  # Ignore the bot's messages
 				return
 			if message.content.strip().startswith(f'{self.prefix} '):
-				if self.ack:
+				task = message.content.replace(f'{self.prefix} ', '').strip()
+				if task == 'cancel':
+					dropped = self.scheduler.cancel(message.author.id)
+					await message.reply(f'Cancelled {dropped} queued task(s).', mention_author=True)
+					return
+
+				entry = QueuedTask(message.author.id, message.channel.id, task, message)
+				try:
+					position = self.scheduler.submit(entry)
+				except QuotaExceeded as e:
+					await message.reply(f'{e}. Wait for them to finish or send "{self.prefix} cancel".', mention_author=True)
+					return
+
+				if position:
+					await message.reply(f'Task queued at position {position}.', mention_author=True)
+				elif self.ack:
 					try:
 						await message.reply(
 							'Starting browser use task...',
@@ -85,30 +131,31 @@ class DiscordBot(commands.Bot):
 					except Exception as e:
 						print(f'Error sending start message: {e}')
 
-				try:
-					agent_message = await self.run_agent(
-						message.content.replace(f'{self.prefix} ', '').strip()
-					)
-					await message.channel.send(
-						content=f'{agent_message}', reference=message, mention_author=True
-					)
-				except Exception as e:
-					await message.channel.send(
-						content=f'Error during task execution: {str(e)}',
-						reference=message,
-						mention_author=True,
-					)
-
 		except Exception as e:
 			print(f'Error in message handling: {e}')
 
 	#    await self.process_commands(message)  # Needed to process bot commands
 
+	async def execute_task(self, entry: QueuedTask):
+		"""Run a scheduled task and reply with its result."""
+		message = entry.message
+		try:
+			agent_message = await self.run_agent(entry.task)
+			await message.channel.send(content=f'{agent_message}', reference=message, mention_author=True)
+		except Exception as e:
+			await message.channel.send(
+				content=f'Error during task execution: {str(e)}',
+				reference=message,
+				mention_author=True,
+			)
+
 	async def run_agent(self, task: str) -> str:
 		try:
-			browser = Browser(config=self.browser_config)
-			agent = Agent(task=(task), llm=self.llm, browser=browser)
-			result = await agent.run()
+			async with self.browser_pool.context() as context:
+				agent = Agent(
+					task=(task), llm=self.llm, browser_context=context, tool_calling_method=tool_calling_method(self.llm)
+				)
+				result = await agent.run()
 
 			agent_message = None
 			if result.is_done():
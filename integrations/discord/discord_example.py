@@ -39,6 +39,7 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from pydantic import SecretStr
 
 from browser_use import BrowserConfig
+from cofounder.cassette import cassette_from_env
 from examples.integrations.discord.discord_api import DiscordBot
 
 load_dotenv()
@@ -52,7 +53,7 @@ api_key = os.getenv('GEMINI_API_KEY')
 if not api_key:
 	raise ValueError('GEMINI_API_KEY is not set')
 
-llm = ChatGoogleGenerativeAI(model='gemini-2.0-flash-exp', api_key=SecretStr(api_key))
+llm = cassette_from_env(ChatGoogleGenerativeAI(model='gemini-2.0-flash-exp', api_key=SecretStr(api_key)))
 
 bot = DiscordBot(
 	llm=llm,  # required; instance of BaseChatModel
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from browser_use import BrowserConfig
 from fastapi import FastAPI, Request, HTTPException, Depends
@@ -5,9 +6,13 @@ from dotenv import load_dotenv
 from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.errors import SlackApiError
 from slack_sdk.signature import SignatureVerifier
-from browser_use.agent.service import Agent, Browser
+from browser_use.agent.service import Agent
 from langchain_core.language_models.chat_models import BaseChatModel
 from browser_use.logging_config import setup_logging
+from cofounder.dedupe import DedupeStore, dedupe_store_from_env
+from cofounder.jobs import JobQueue
+from cofounder.pool import BrowserPool
+from cofounder.providers import tool_calling_method
 
 load_dotenv()
 
@@ -17,16 +22,34 @@ logger = logging.getLogger('slack')
 app = FastAPI()
 
 class SlackBot:
-    def __init__(self, llm: BaseChatModel, bot_token: str, signing_secret: str, ack: bool = False, browser_config: BrowserConfig = BrowserConfig(headless=True)):
+    def __init__(
+        self,
+        llm: BaseChatModel,
+        bot_token: str,
+        signing_secret: str,
+        ack: bool = False,
+        browser_config: BrowserConfig = BrowserConfig(headless=True),
+        browser_pool: BrowserPool = None,
+        job_queue: JobQueue = None,
+        dedupe_store: DedupeStore = None,
+    ):
         if not bot_token or not signing_secret:
             raise ValueError("Bot token and signing secret must be provided")
         
         self.llm = llm
         self.ack = ack
         self.browser_config = browser_config
+        # Agents run on background workers so the events endpoint can ack Slack within 3 seconds
+        self.job_queue = job_queue or JobQueue.from_env(prefix='SLACK', timeout=600)
+        # One browser context per worker, or extra workers would only wait for the pool inside their job timeout
+        self.browser_pool = browser_pool or BrowserPool.from_env(
+            browser_config=browser_config, max_concurrency=self.job_queue.workers
+        )
         self.client = AsyncWebClient(token=bot_token)
         self.signature_verifier = SignatureVerifier(signing_secret)
-        self.processed_events = set()
+        # Slack retries events it did not get a timely ack for; the store must be shared when running several workers
+        self.dedupe_store = dedupe_store or dedupe_store_from_env(prefix='SLACK', namespace='slack')
+        self.background_tasks = set()
         logger.info("SlackBot initialized")
 
     async def handle_event(self, event, event_id):
@@ -36,10 +59,9 @@ class SlackBot:
                 logger.warning("Event ID missing in event data")
                 return
 
-            if event_id in self.processed_events:
+            if self.dedupe_store.seen(event_id):
                 logger.info(f"Event {event_id} already processed")
                 return
-            self.processed_events.add(event_id)
 
             if 'subtype' in event and event['subtype'] == 'bot_message':
                 return
@@ -48,25 +70,38 @@ class SlackBot:
             user_id = event.get('user')
             if text and text.startswith('$bu '):
                 task = text[len('$bu '):].strip()
-                if self.ack:
-                    try:
-                        await self.send_message(event['channel'], f'<@{user_id}> Starting browser use task...', thread_ts=event.get('ts'))
-                    except Exception as e:
-                        logger.error(f"Error sending start message: {e}")
+                channel, thread_ts = event['channel'], event.get('ts')
+
+                async def post_result(job):
+                    if job.status == 'done':
+                        await self.send_message(channel, f'<@{user_id}> {job.result}', thread_ts=thread_ts)
+                    else:
+                        await self.send_message(channel, f'Error during task execution: {job.error}', thread_ts=thread_ts)
 
                 try:
-                    agent_message = await self.run_agent(task)
-                    await self.send_message(event['channel'], f'<@{user_id}> {agent_message}', thread_ts=event.get('ts'))
-                except Exception as e:
-                    await self.send_message(event['channel'], f'Error during task execution: {str(e)}', thread_ts=event.get('ts'))
+                    self.job_queue.submit(self.run_agent, task, name=f'slack:{event_id}', on_finish=post_result)
+                except asyncio.QueueFull:
+                    await self.send_message(
+                        channel, f'<@{user_id}> Too many tasks queued, please try again later.', thread_ts=thread_ts
+                    )
+                    return
+
+                if self.ack:
+                    stats = self.job_queue.stats()
+                    position = stats['depth'] - (stats['workers'] - stats['running'])
+                    ack = 'Starting browser use task...' if position <= 0 else f'Task queued at position {position}...'
+                    # Don't hold up the HTTP response on Slack's API
+                    ack_task = asyncio.create_task(self.send_message(channel, f'<@{user_id}> {ack}', thread_ts=thread_ts))
+                    self.background_tasks.add(ack_task)
+                    ack_task.add_done_callback(self.background_tasks.discard)
         except Exception as e:
             logger.error(f"Error in handle_event: {str(e)}")
 
     async def run_agent(self, task: str) -> str:
         try:
-            browser = Browser(config=self.browser_config)
-            agent = Agent(task=task, llm=self.llm, browser=browser)
-            result = await agent.run()
+            async with self.browser_pool.context() as context:
+                agent = Agent(task=task, llm=self.llm, browser_context=context, tool_calling_method=tool_calling_method(self.llm))
+                result = await agent.run()
 
             agent_message = None
             if result.is_done():
@@ -101,6 +136,7 @@ async def slack_events(request: Request, slack_bot: SlackBot = Depends()):
 
         if 'event' in event_data:
             try:
+                # Only dedupes and enqueues; the agent runs on a job queue worker
                 await slack_bot.handle_event(event_data.get('event'), event_data.get('event_id'))
             except Exception as e:
                 logger.error(f"Error handling event: {str(e)}")
@@ -108,4 +144,9 @@ async def slack_events(request: Request, slack_bot: SlackBot = Depends()):
         return {}
     except Exception as e:
         logger.error(f"Error in slack_events: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal Server Error")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Internal Server Error")
+
+@app.get("/slack/queue")
+async def slack_queue(slack_bot: SlackBot = Depends()):
+    """Queue depth, running tasks and wait times of the agent workers."""
+    return slack_bot.job_queue.stats()
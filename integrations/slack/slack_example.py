@@ -5,6 +5,7 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from pydantic import SecretStr
 
 from browser_use import BrowserConfig
+from cofounder.cassette import cassette_from_env
 from examples.integrations.slack.slack_api import SlackBot, app
 
 load_dotenv()
@@ -22,7 +23,7 @@ api_key = os.getenv('GEMINI_API_KEY')
 if not api_key:
 	raise ValueError('GEMINI_API_KEY is not set')
 
-llm = ChatGoogleGenerativeAI(model='gemini-2.0-flash-exp', api_key=SecretStr(api_key))
+llm = cassette_from_env(ChatGoogleGenerativeAI(model='gemini-2.0-flash-exp', api_key=SecretStr(api_key)))
 
 slack_bot = SlackBot(
 	llm=llm,  # required; instance of BaseChatModel
@@ -35,6 +36,9 @@ slack_bot = SlackBot(
 )
 
 app.dependency_overrides[SlackBot] = lambda: slack_bot
+app.add_event_handler('startup', slack_bot.browser_pool.start)  # launch browsers before the first event
+app.add_event_handler('shutdown', slack_bot.job_queue.stop)
+app.add_event_handler('shutdown', slack_bot.browser_pool.close)
 
 if __name__ == '__main__':
 	import uvicorn
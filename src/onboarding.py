@@ -1,24 +1,21 @@
 import asyncio
 import os
-from typing import List
+import sys
+from typing import List, Optional, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from browser_use import Agent, Controller
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
-from browser_use import Agent, Controller
 
-async def analyze_startup(urls: List[str], llm: ChatOpenAI) -> str:
-    """Analyze startup based on webpage content."""
-    
-    controller = Controller(output_model=None)
-    content = []
-    
-    for url in urls.split(','):
-        task = f"Visit {url.strip()} and extract key information about the company"
-        agent = Agent(task=task, llm=llm, controller=controller)
-        history = await agent.run()
-        if history.final_result():
-            content.append(history.final_result())
-    
-    prompt = """
+from cofounder.cache import SqliteCache, cache_key
+from cofounder.cassette import cassette_from_env
+from cofounder.fetch import fetch_page, http_client, looks_js_rendered
+from cofounder.pool import BrowserPool
+from cofounder.providers import model_id, tool_calling_method
+
+ANALYSIS_PROMPT = """
     You are an experienced Venture Capitalist analyzing a startup.
     Based on the following information, create a detailed analysis in markdown format:
     
@@ -35,9 +32,74 @@ async def analyze_startup(urls: List[str], llm: ChatOpenAI) -> str:
     
     Format as a professional VC analysis document with clear sections and bullet points.
     """
-    
-    response = await llm.ainvoke(prompt.format(content="\n".join(content)))
-    return response.content
+
+async def extract_url(
+    url: str, llm: ChatOpenAI, controller: Controller, pool: BrowserPool, cache: SqliteCache, client
+) -> Optional[str]:
+    """Extract company information from one page, reusing the last extraction if the page is unchanged."""
+    # A cheap HTTP fetch tells us whether the page changed. Pages that can't be fetched are always re-visited,
+    # and so are JavaScript-rendered ones, whose fetched HTML is the same empty shell whatever the page shows
+    page = await fetch_page(client, url)
+    key = cache_key(url, page.content_hash, model_id(llm)) if page and not looks_js_rendered(page) else None
+    if key and (cached := cache.get(key)) is not None:
+        print(f"♻️  {url} unchanged, reusing previous extraction")
+        return cached
+
+    print(f"🔍 Visiting {url}")
+    task = f"Visit {url} and extract key information about the company"
+    async with pool.context() as context:
+        agent = Agent(
+            task=task,
+            llm=llm,
+            controller=controller,
+            browser_context=context,
+            tool_calling_method=tool_calling_method(llm),
+        )
+        history = await agent.run()
+
+    result = history.final_result()
+    if key and result:
+        cache.set(key, result)
+    return result
+
+async def analyze_startup(urls: str, llm: ChatOpenAI, max_workers: int = 4) -> Tuple[str, bool]:
+    """Analyze startup based on webpage content.
+
+    URLs are processed concurrently, at most `max_workers` at a time. Returns the
+    analysis and whether it changed since the last onboarding.
+    """
+    cache = SqliteCache.from_env('onboarding', ttl=30 * 24 * 3600)
+    controller = Controller(output_model=None)
+    pool = BrowserPool.from_env(max_concurrency=max_workers)
+    url_list = [url.strip() for url in urls.split(',') if url.strip()]
+
+    try:
+        async with http_client() as client:
+            results = await asyncio.gather(
+                *(extract_url(url, llm, controller, pool, cache, client) for url in url_list), return_exceptions=True
+            )
+    finally:
+        await pool.close()
+
+    # One unreachable URL shouldn't sink the whole onboarding
+    extractions: List[Optional[str]] = []
+    for url, result in zip(url_list, results):
+        if isinstance(result, Exception):
+            print(f"⚠️  Could not extract {url}: {result}")
+            result = None
+        extractions.append(result)
+    content = [result for result in extractions if result]
+
+    # Only re-run the VC analysis when some page's extraction changed
+    prompt = ANALYSIS_PROMPT.format(content="\n".join(content))
+    key = cache_key(prompt, model_id(llm))
+    analysis = cache.get(key)
+    if analysis is not None:
+        return analysis, False
+
+    response = await llm.ainvoke(prompt)
+    cache.set(key, response.content)
+    return response.content, True
 
 async def main():
     load_dotenv()
@@ -46,21 +108,24 @@ async def main():
     print("\nPlease enter the URLs related to the startup (comma-separated):")
     urls = input("> ")
     
-    model = ChatOpenAI(
+    model = cassette_from_env(ChatOpenAI(
         model='gpt-4o',
         streaming=True,
         temperature=0.7
-    )
+    ))
     
     print("\n📊 Analyzing startup data...")
-    analysis = await analyze_startup(urls, model)
-    
-    # Save analysis to startup.md
-    with open('startup.md', 'w') as f:
-        f.write(analysis)
+    analysis, changed = await analyze_startup(urls, model, max_workers=int(os.getenv("COFOUNDER_ONBOARDING_WORKERS", "4")))
     
-    print("\n✅ Analysis complete! Saved to startup.md")
+    if not changed and os.path.exists('startup.md'):
+        # Keep any manual edits to startup.md when nothing changed
+        print("\n✅ Startup pages unchanged since the last analysis, startup.md left as is")
+    else:
+        # Save analysis to startup.md
+        with open('startup.md', 'w') as f:
+            f.write(analysis)
+        print("\n✅ Analysis complete! Saved to startup.md")
     print("\nNow you can use the main script to analyze trends and generate reports!")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
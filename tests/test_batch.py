@@ -0,0 +1,39 @@
+import json
+
+import pytest
+
+from cofounder.batch import load_batch
+
+
+def write_jsonl(tmp_path, *lines):
+	path = tmp_path / 'missions.jsonl'
+	path.write_text('\n'.join(line if isinstance(line, str) else json.dumps(line) for line in lines) + '\n')
+	return str(path)
+
+
+def test_jsonl_missions_are_numbered_in_file_order(tmp_path):
+	path = write_jsonl(tmp_path, '"first task"', '', {'id': 'nightly', 'task': 'second task'}, {'task': 'third task'})
+	assert load_batch(path) == [
+		{'task': 'first task', 'id': 1},
+		{'id': 'nightly', 'task': 'second task'},
+		{'task': 'third task', 'id': 3},
+	]
+
+
+def test_prompts_list(tmp_path):
+	path = tmp_path / 'prompts.md'
+	path.write_text('# Nightly\nfirst task\n\nsecond task\n')
+	assert load_batch(str(path)) == [{'task': 'first task', 'id': 1}, {'task': 'second task', 'id': 2}]
+
+
+@pytest.mark.parametrize('bad', ['5', 'null', '["a task"]', '{"id": 3}', '{"task": 7}', '{"task": "  "}', '""'])
+def test_entries_without_a_task_string_are_rejected_with_their_line(tmp_path, bad):
+	path = write_jsonl(tmp_path, '"fine"', '', bad)
+	with pytest.raises(ValueError, match=r'missions\.jsonl:3: expected a task string'):
+		load_batch(path)
+
+
+def test_invalid_json_names_the_line(tmp_path):
+	path = write_jsonl(tmp_path, '"fine"', '{"task": ')
+	with pytest.raises(ValueError, match=r'missions\.jsonl:2: invalid JSON'):
+		load_batch(path)
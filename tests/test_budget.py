@@ -0,0 +1,85 @@
+import pytest
+
+from cofounder import budget as budget_module
+from cofounder.budget import MissionBudget
+
+
+@pytest.fixture
+def clock(monkeypatch):
+	"""Mission clock in seconds, advanced by the test."""
+	now = [1000.0]
+	monkeypatch.setattr(budget_module.time, 'monotonic', lambda: now[0])
+	return now
+
+
+def run_plan(budget: MissionBudget, clock, steps: int, durations=None, workers: int = 1):
+	"""Timeouts given to each step of a fully planned mission run one step at a time, steps taking `durations`."""
+	timeouts = []
+	for finished in range(steps):
+		allocation = budget.allocate(budget.steps_left(steps, finished, planning=False), workers)
+		timeouts.append(allocation.timeout)
+		clock[0] += durations[finished] if durations else allocation.timeout
+	return timeouts
+
+
+@pytest.mark.parametrize('steps', [1, 2, 5])
+def test_planned_mission_spends_whole_step_budget(clock, steps):
+	budget = MissionBudget(seconds=300)
+	timeouts = run_plan(budget, clock, steps)
+	assert timeouts[0] == pytest.approx(255 / steps)
+	assert sum(timeouts) == pytest.approx(255)
+
+
+def test_one_step_plan_is_not_split_by_expected_steps(clock):
+	budget = MissionBudget(seconds=300)
+	assert budget.allocate(budget.steps_left(1, 0, planning=False)).timeout == pytest.approx(255)
+	# While the plan streams in, the first step assumes there are more to come
+	assert budget.allocate(budget.steps_left(1, 0, planning=True)).timeout == pytest.approx(85)
+
+
+def test_unused_time_goes_to_later_steps(clock):
+	budget = MissionBudget(seconds=300)
+	timeouts = run_plan(budget, clock, 5, durations=[1, 1, 1, 1, 1])
+	assert timeouts[0] == pytest.approx(51)
+	assert timeouts[-1] == pytest.approx(251)
+
+
+def test_parallel_workers_share_rounds(clock):
+	budget = MissionBudget(seconds=300)
+	assert budget.allocate(budget.steps_left(5, 0, planning=False), workers=2).timeout == pytest.approx(85)
+	assert budget.allocate(budget.steps_left(5, 0, planning=False), workers=5).timeout == pytest.approx(255)
+
+
+def test_steps_are_skipped_once_the_budget_is_spent(clock):
+	budget = MissionBudget(seconds=300)
+	clock[0] += 250
+	assert budget.allocate(2).exhausted
+	assert not MissionBudget(seconds=300).allocate(2).exhausted
+
+
+def test_no_budget_means_no_limits():
+	allocation = MissionBudget(max_agent_steps=40).allocate(3)
+	assert allocation.timeout is None
+	assert allocation.max_steps == 40
+	assert not allocation.exhausted
+
+
+@pytest.mark.parametrize(
+	'used, calls, steps_left, max_steps', [(0, 0, 2, 5), (20_000, 10, 2, 5), (36_000, 10, 1, 1), (40_000, 10, 1, 0)]
+)
+def test_token_budget_becomes_agent_step_limit(monkeypatch, used, calls, steps_left, max_steps):
+	budget = MissionBudget(tokens=40_000, report_share=0.0)
+	monkeypatch.setattr(budget, '_token_usage', lambda: (used, calls))
+	allocation = budget.allocate(steps_left)
+	assert allocation.timeout is None
+	assert allocation.max_steps == max_steps
+	assert allocation.exhausted == (max_steps == 0)
+
+
+def test_from_env(monkeypatch):
+	monkeypatch.setenv('COFOUNDER_MISSION_BUDGET', '120')
+	monkeypatch.setenv('COFOUNDER_MISSION_TOKEN_BUDGET', '50000')
+	monkeypatch.setenv('COFOUNDER_MAX_AGENT_STEPS', '15')
+	budget = MissionBudget.from_env()
+	assert (budget.seconds, budget.tokens, budget.max_agent_steps) == (120, 50_000, 15)
+	assert MissionBudget.from_env(seconds=30).seconds == 30
@@ -0,0 +1,87 @@
+import threading
+
+import pytest
+
+from cofounder import cache as cache_module
+from cofounder.cache import SqliteCache, cache_key, normalize_text
+
+
+@pytest.fixture
+def clock(monkeypatch):
+	now = [1000.0]
+	monkeypatch.setattr(cache_module.time, 'time', lambda: now[0])
+	return now
+
+
+@pytest.fixture
+def path(tmp_path):
+	return str(tmp_path / 'cache.sqlite3')
+
+
+def test_values_round_trip_as_json(path):
+	cache = SqliteCache('plans', path=path)
+	cache.set('k', {'steps': ['a', 'b'], 'n': 1})
+	assert cache.get('k') == {'steps': ['a', 'b'], 'n': 1}
+	assert cache.get('missing', 'default') == 'default'
+	assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_entries_expire(path, clock):
+	cache = SqliteCache('plans', ttl=60, path=path)
+	cache.set('short', 1, ttl=10)
+	cache.set('default', 2)
+	clock[0] += 30
+	assert cache.get('short') is None
+	assert cache.get('default') == 2
+	clock[0] += 60
+	assert cache.get('default') is None
+	assert len(cache) == 0
+
+
+def test_least_recently_used_entries_are_evicted(path, clock):
+	cache = SqliteCache('plans', max_entries=2, path=path)
+	cache.set('a', 1)
+	clock[0] += 1
+	cache.set('b', 2)
+	clock[0] += 1
+	cache.get('a')
+	clock[0] += 1
+	cache.set('c', 3)
+	assert [key for key, _ in cache.items()] == ['c', 'a']
+
+
+def test_namespaces_share_a_file_but_not_entries(path):
+	plans, steps = SqliteCache('plans', path=path), SqliteCache('steps', path=path)
+	plans.set('k', 'plan')
+	steps.set('k', 'step')
+	plans.clear()
+	assert plans.get('k') is None
+	assert steps.get('k') == 'step'
+
+
+def test_incr_is_atomic_across_connections(path):
+	caches = [SqliteCache('stats', path=path) for _ in range(4)]
+
+	def bump(cache):
+		for _ in range(50):
+			cache.incr('runs')
+
+	threads = [threading.Thread(target=bump, args=(cache,)) for cache in caches]
+	for thread in threads:
+		thread.start()
+	for thread in threads:
+		thread.join()
+	assert caches[0].get('runs') == 200
+
+
+def test_from_env_overrides_limits(monkeypatch, path):
+	monkeypatch.setenv('COFOUNDER_PLAN_CACHE_TTL', '5')
+	monkeypatch.setenv('COFOUNDER_PLAN_CACHE_SIZE', '7')
+	cache = SqliteCache.from_env('plan', ttl=100, path=path)
+	assert (cache.ttl, cache.max_entries) == (5, 7)
+
+
+def test_keys_ignore_dict_order_and_text_whitespace():
+	assert cache_key({'a': 1, 'b': 2}, 'x') == cache_key({'b': 2, 'a': 1}, 'x')
+	assert cache_key(1) != cache_key('1', None)
+	assert normalize_text("  What's   trending\non HN? ") == normalize_text("what's trending on hn?")
@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip('langchain_core')
+
+from langchain_core.messages import HumanMessage  # noqa: E402
+from pydantic import BaseModel  # noqa: E402
+
+from benchmarks.fakes import ScriptedChatModel  # noqa: E402
+from cofounder.cache import SqliteCache  # noqa: E402
+from cofounder.cassette import CassetteChatModel, CassetteMiss, cassette_from_env  # noqa: E402
+
+
+class TaskBreakdown(BaseModel):
+	steps: list[str]
+
+
+class CountingModel(ScriptedChatModel):
+	calls: int = 0
+
+	async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+		self.calls += 1
+		return await super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+	async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+		self.calls += 1
+		async for chunk in super()._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+			yield chunk
+
+
+@pytest.fixture
+def store(tmp_path):
+	return SqliteCache('cassette', path=str(tmp_path / 'cassette.sqlite3'))
+
+
+def cassettes(store):
+	inner = CountingModel(steps=['Open example.com'], report_words=12)
+	return inner, CassetteChatModel(inner=inner, store=store, mode='record'), CassetteChatModel(inner=inner, store=store)
+
+
+def test_replay_returns_the_recorded_response_without_calling_the_model(store):
+	inner, recorder, player = cassettes(store)
+	recorded = asyncio.run(recorder.ainvoke('Write the report, it is 2026-10-17 09:30:00'))
+	assert inner.calls == 1
+	# Timestamps are masked, so a rerun at another time replays the same answer
+	replayed = asyncio.run(player.ainvoke('Write  the report, it is 2026-10-18 11:02:45'))
+	assert inner.calls == 1
+	assert replayed.content == recorded.content
+	assert replayed.usage_metadata == recorded.usage_metadata
+
+
+def test_streamed_responses_replay_chunk_by_chunk(store):
+	inner, recorder, player = cassettes(store)
+
+	async def stream(model):
+		return [chunk.content async for chunk in model.astream([HumanMessage('Write the report')])]
+
+	recorded = asyncio.run(stream(recorder))
+	replayed = asyncio.run(stream(player))
+	assert inner.calls == 1
+	assert replayed == recorded and len(recorded) == 12
+
+
+def test_tool_calls_replay(store):
+	inner, recorder, player = cassettes(store)
+	prompt = 'TASK ANALYSIS FRAMEWORK: break down the task'
+	recorded = asyncio.run(recorder.with_structured_output(TaskBreakdown).ainvoke(prompt))
+	replayed = asyncio.run(player.with_structured_output(TaskBreakdown).ainvoke(prompt))
+	assert inner.calls == 1
+	assert replayed == recorded == TaskBreakdown(steps=['Open example.com'])
+
+
+def test_unrecorded_prompt_is_a_miss(store):
+	inner, recorder, player = cassettes(store)
+	asyncio.run(recorder.ainvoke('Write the report'))
+	with pytest.raises(CassetteMiss):
+		asyncio.run(player.ainvoke('Write a different report'))
+	assert inner.calls == 1
+
+
+def test_passthrough_never_records(store):
+	inner = CountingModel(report_words=5)
+	model = CassetteChatModel(inner=inner, store=store, mode='passthrough')
+	asyncio.run(model.ainvoke('Write the report'))
+	assert inner.calls == 1 and len(store) == 0
+	with pytest.raises(ValueError, match='Unknown cassette mode'):
+		CassetteChatModel(inner=inner, store=store, mode='rewind')
+
+
+def test_cassette_from_env(monkeypatch, tmp_path):
+	inner = ScriptedChatModel()
+	monkeypatch.delenv('COFOUNDER_CASSETTE_MODE', raising=False)
+	assert cassette_from_env(inner) is inner
+	monkeypatch.setenv('COFOUNDER_CASSETTE_MODE', 'replay')
+	monkeypatch.setenv('COFOUNDER_CASSETTE_SPEED', '0.5')
+	monkeypatch.setenv('COFOUNDER_CASSETTE', str(tmp_path / 'cassette.sqlite3'))
+	model = cassette_from_env(inner)
+	assert (model.mode, model.speed, model.model_name) == ('replay', 0.5, 'scripted')
+	assert model.store.path == str(tmp_path / 'cassette.sqlite3')
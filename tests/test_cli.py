@@ -0,0 +1,60 @@
+import os
+
+import pytest
+
+from cofounder import cli
+
+pytest.importorskip('dotenv')
+
+
+def test_parser_defaults_come_from_dotenv(monkeypatch, tmp_path, capsys):
+	monkeypatch.chdir(tmp_path)
+	# load_dotenv writes to os.environ; keep that from leaking into other tests
+	environ = {key: value for key, value in os.environ.items() if key not in ('COFOUNDER_MAX_WORKERS', 'COFOUNDER_PROVIDER')}
+	monkeypatch.setattr(os, 'environ', environ)
+	(tmp_path / '.env').write_text('COFOUNDER_MAX_WORKERS=3\nCOFOUNDER_PROVIDER=gemini\n')
+	parsed = {}
+	monkeypatch.setattr(cli, 'resolve_task', lambda args, parser: parsed.update(vars(args)) or '')
+
+	assert cli.main(['some task']) == 1
+	assert parsed['workers'] == 3
+	assert parsed['provider'] == 'gemini'
+
+
+def test_invalid_workers_are_rejected(monkeypatch, tmp_path):
+	monkeypatch.chdir(tmp_path)
+	with pytest.raises(SystemExit):
+		cli.main(['--workers', '0', 'task'])
+
+
+def test_api_serves_the_chosen_provider(monkeypatch, tmp_path):
+	uvicorn = pytest.importorskip('uvicorn')
+	pytest.importorskip('fastapi')
+	pytest.importorskip('browser_use')
+	from cofounder import server
+
+	monkeypatch.chdir(tmp_path)
+	monkeypatch.setattr(server, 'default_provider', 'openai')
+	served = []
+	monkeypatch.setattr(uvicorn, 'run', lambda app, **kwargs: served.append((app, server.default_provider)))
+
+	assert cli.main(['--api', '--provider', 'gemini']) == 0
+	assert served == [(server.app, 'gemini')]
+
+
+def test_resume_goes_through_a_running_daemon(monkeypatch, tmp_path):
+	from cofounder import daemon, journal
+
+	monkeypatch.chdir(tmp_path)
+	monkeypatch.setattr(journal, 'RUNS_DIR', 'runs')
+	run = journal.RunJournal.create('What is trending?', provider='gemini', model='gemini-pro')
+	requests = []
+	monkeypatch.setattr(daemon, 'is_running', lambda: True)
+	monkeypatch.setattr(daemon, 'submit', lambda request: requests.append(request) or 0)
+
+	assert cli.main(['--resume', run.run_id]) == 0
+	(request,) = requests
+	assert request['resume'] == str(tmp_path / run.path)
+	assert (request['task'], request['provider'], request['model']) == ('What is trending?', 'gemini', 'gemini-pro')
+	# Only the daemon, which runs the mission, marks the journal as resumed
+	assert journal.RunJournal.load(run.run_id).events[-1]['event'] == 'start'
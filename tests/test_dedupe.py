@@ -0,0 +1,84 @@
+import threading
+
+import pytest
+
+from cofounder import dedupe as dedupe_module
+from cofounder.dedupe import DedupeStore, MemoryDedupeStore, SqliteDedupeStore, dedupe_store_from_env
+
+
+@pytest.fixture
+def clock(monkeypatch):
+	now = [1000.0]
+	monkeypatch.setattr(dedupe_module.time, 'time', lambda: now[0])
+	return now
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def store(request, tmp_path):
+	if request.param == 'memory':
+		return MemoryDedupeStore(ttl=60)
+	return SqliteDedupeStore(path=str(tmp_path / 'dedupe.sqlite3'), ttl=60)
+
+
+def test_incomplete_store_fails_when_instantiated():
+	class Incomplete(DedupeStore):
+		pass
+
+	with pytest.raises(TypeError):
+		Incomplete()
+
+
+def test_repeated_ids_are_seen(store, clock):
+	assert not store.seen('Ev1')
+	assert store.seen('Ev1')
+	assert not store.seen('Ev2')
+
+
+def test_ids_are_forgotten_after_the_ttl(store, clock):
+	store.seen('Ev1')
+	clock[0] += 30
+	assert store.seen('Ev1')
+	clock[0] += 31
+	assert not store.seen('Ev1')
+	assert store.seen('Ev1')
+
+
+def test_memory_store_evicts_oldest_beyond_capacity(clock):
+	store = MemoryDedupeStore(ttl=60, max_entries=2)
+	for key in ('a', 'b', 'c'):
+		store.seen(key)
+	assert len(store) == 2
+	assert not store.seen('a')
+
+
+def test_sqlite_store_is_shared_between_connections(tmp_path):
+	path = str(tmp_path / 'dedupe.sqlite3')
+	stores = [SqliteDedupeStore(path=path) for _ in range(4)]
+	firsts = []
+
+	def deliver(store):
+		firsts.append(not store.seen('Ev1'))
+
+	threads = [threading.Thread(target=deliver, args=(store,)) for store in stores]
+	for thread in threads:
+		thread.start()
+	for thread in threads:
+		thread.join()
+	assert firsts.count(True) == 1
+
+
+def test_sqlite_namespaces_are_separate(tmp_path):
+	path = str(tmp_path / 'dedupe.sqlite3')
+	slack, discord = SqliteDedupeStore(path=path, namespace='slack'), SqliteDedupeStore(path=path, namespace='discord')
+	assert not slack.seen('Ev1')
+	assert not discord.seen('Ev1')
+
+
+def test_backend_from_env(monkeypatch, tmp_path):
+	assert isinstance(dedupe_store_from_env('SLACK'), MemoryDedupeStore)
+	monkeypatch.setenv('SLACK_DEDUPE_BACKEND', 'sqlite')
+	monkeypatch.setenv('SLACK_DEDUPE_PATH', str(tmp_path / 'dedupe.sqlite3'))
+	monkeypatch.setenv('SLACK_DEDUPE_TTL', '5')
+	store = dedupe_store_from_env('SLACK')
+	assert isinstance(store, SqliteDedupeStore)
+	assert store.ttl == 5
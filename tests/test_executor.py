@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip('browser_use')
+
+from cofounder import executor  # noqa: E402
+from cofounder.executor import execute_steps  # noqa: E402
+
+POOL = object()
+
+
+class FakeRunStep:
+	"""Stands in for run_step: each step takes as long as its text says, and concurrency is recorded."""
+
+	def __init__(self):
+		self.running = 0
+		self.peak = 0
+		self.order = []
+
+	async def __call__(self, step, llm, controller, pool, client=None, timeout=None, max_steps=100, extract_llm=None):
+		assert pool is POOL
+		self.running += 1
+		self.peak = max(self.peak, self.running)
+		try:
+			await asyncio.sleep(float(step.split()[-1]))
+		finally:
+			self.running -= 1
+		self.order.append(step)
+		return {'step': step, 'result': f'done {step}', 'success': True, 'tier': 'browser'}
+
+
+@pytest.fixture
+def fake_run_step(monkeypatch):
+	fake = FakeRunStep()
+	monkeypatch.setattr(executor, 'run_step', fake)
+	return fake
+
+
+def run(steps, **kwargs):
+	return asyncio.run(execute_steps(steps, llm=None, controller=None, pool=POOL, http_first=False, **kwargs))
+
+
+def test_results_come_back_in_plan_order(fake_run_step):
+	steps = ['slow 0.03', 'fast 0', 'medium 0.01']
+	results = run(steps, max_workers=3)
+	assert [result['step'] for result in results] == steps
+	assert fake_run_step.order == ['fast 0', 'medium 0.01', 'slow 0.03']
+
+
+@pytest.mark.parametrize('max_workers', [1, 2, 4])
+def test_max_workers_caps_concurrent_steps(fake_run_step, max_workers):
+	run([f'step {i} 0.005' for i in range(8)], max_workers=max_workers)
+	assert fake_run_step.peak == max_workers
+
+
+def test_streamed_steps_and_callbacks(fake_run_step):
+	async def plan():
+		for step in ('a 0', 'b 0'):
+			await asyncio.sleep(0)
+			yield step
+
+	started, done = [], []
+	results = run(plan(), max_workers=2, on_start=lambda i, step: started.append(i), on_done=lambda i, result: done.append(i))
+	assert [result['step'] for result in results] == ['a 0', 'b 0']
+	assert sorted(started) == sorted(done) == [1, 2]
+
+
+def test_completed_steps_are_not_run_again(fake_run_step):
+	completed = {1: {'step': 'a 0', 'result': 'earlier', 'success': True}}
+	results = run(['a 0', 'b 0'], completed=completed)
+	assert results[0] == {'step': 'a 0', 'result': 'earlier', 'success': True, 'resumed': True}
+	assert fake_run_step.order == ['b 0']
+
+
+def test_failing_step_cancels_the_others(fake_run_step, monkeypatch):
+	async def failing(step, *args, **kwargs):
+		if step.startswith('bad'):
+			raise RuntimeError('boom')
+		return await fake_run_step(step, *args, **kwargs)
+
+	monkeypatch.setattr(executor, 'run_step', failing)
+	with pytest.raises(RuntimeError):
+		run(['bad 0', 'long 5'], max_workers=2)
+	assert fake_run_step.running == 0
@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip('httpx')
+pytest.importorskip('bs4')
+
+from cofounder.fetch import ESCALATE, Page, fetch_page, http_step, looks_js_rendered, needs_browser, step_url  # noqa: E402
+
+ARTICLE = '<html><body><main><h1>Top stories</h1>{}</main></body></html>'.format(
+	''.join(f'<p>Story {i}: a headline that is long enough to count as real content.</p>' for i in range(10))
+)
+SPA = '<html><body><div id="root"></div><noscript>You need to enable JavaScript to run this app.</noscript></body></html>'
+
+
+class Response:
+	def __init__(self, content: str):
+		self.content = content
+
+
+class ExtractModel:
+	def __init__(self, answer: str):
+		self.answer = answer
+		self.prompts = []
+
+	async def ainvoke(self, prompt: str):
+		self.prompts.append(prompt)
+		return Response(self.answer)
+
+
+def site(request: httpx.Request) -> httpx.Response:
+	pages = {
+		'/news': (200, 'text/html; charset=utf-8', ARTICLE),
+		'/app': (200, 'text/html', SPA),
+		'/feed': (200, 'application/json', '{}'),
+	}
+	status, content_type, body = pages.get(request.url.path, (404, 'text/html', 'Not found'))
+	return httpx.Response(status, headers={'content-type': content_type}, text=body)
+
+
+def client():
+	return httpx.AsyncClient(transport=httpx.MockTransport(site))
+
+
+def run(coro):
+	async def scenario():
+		async with client() as http:
+			return await coro(http)
+
+	return asyncio.run(scenario())
+
+
+@pytest.mark.parametrize(
+	'step, expected',
+	[
+		('Go to news.ycombinator.com and collect the first 10 headlines', False),
+		('Log in to linkedin.com and read my messages', True),
+		('Click "newest" on news.ycombinator.com', True),
+		('Read the posting guidelines on example.com', False),
+		('Summarize the clickbait on example.com', False),
+		('Sign up for the newsletter on example.com', True),
+	],
+)
+def test_needs_browser_matches_whole_keywords(step, expected):
+	assert needs_browser(step) is expected
+
+
+@pytest.mark.parametrize(
+	'step, url',
+	[
+		('Visit https://example.com/a?b=c, then summarize', 'https://example.com/a?b=c'),
+		('Go to news.ycombinator.com.', 'news.ycombinator.com'),
+		('Open (github.com/trending) and list repos', 'github.com/trending'),
+		('Find the best pizza nearby', None),
+	],
+)
+def test_step_url(step, url):
+	assert step_url(step) == url
+
+
+def test_looks_js_rendered():
+	assert looks_js_rendered(Page('u', 200, '', 'tiny'))
+	assert looks_js_rendered(Page('u', 200, '', 'Please enable JavaScript to continue. ' * 10))
+	assert not looks_js_rendered(Page('u', 200, '', 'Plenty of real article text here. ' * 20))
+
+
+def test_fetch_page_extracts_html_and_skips_errors_and_other_content():
+	async def fetch_all(http):
+		return [await fetch_page(http, f'https://example.com{path}') for path in ('/news', '/missing', '/feed')]
+
+	page, missing, feed = run(fetch_all)
+	assert (page.status, page.url) == (200, 'https://example.com/news')
+	assert 'Story 9' in page.text and '<p>' not in page.text
+	assert missing is None and feed is None
+	assert page.content_hash == Page('other', 200, 'different markup', page.text).content_hash
+
+
+def test_fetch_page_adds_a_scheme():
+	page = run(lambda http: fetch_page(http, 'example.com/news'))
+	assert page.url == 'https://example.com/news'
+
+
+def test_http_step_answers_from_the_page():
+	model = ExtractModel('Story 0\nStory 1')
+	result = run(lambda http: http_step('Go to example.com/news and list the stories', model, http))
+	assert result == 'Story 0\nStory 1'
+	assert 'Story 9' in model.prompts[0] and ESCALATE in model.prompts[0]
+
+
+@pytest.mark.parametrize(
+	'step, answer',
+	[
+		('Go to example.com/news and list the stories', f'{ESCALATE}: needs a login'),
+		('Go to example.com/news and list the stories', '   '),
+		('Go to example.com/app and list the stories', 'never asked'),
+		('Go to example.com/missing and list the stories', 'never asked'),
+		('Log in to example.com/news and list the stories', 'never asked'),
+		('List the stories', 'never asked'),
+	],
+)
+def test_http_step_escalates_to_the_browser(step, answer):
+	model = ExtractModel(answer)
+	assert run(lambda http: http_step(step, model, http)) is None
+	if answer == 'never asked':
+		assert model.prompts == []
@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from cofounder.jobs import JobQueue
+
+
+def run(coro):
+	return asyncio.run(coro)
+
+
+async def sleep_and_return(seconds: float, value=None):
+	await asyncio.sleep(seconds)
+	return value
+
+
+async def fail():
+	raise ValueError('bad input')
+
+
+def test_jobs_run_with_at_most_workers_at_once():
+	async def scenario():
+		queue = JobQueue(workers=2)
+		running = peak = 0
+
+		async def job():
+			nonlocal running, peak
+			running += 1
+			peak = max(peak, running)
+			await asyncio.sleep(0.001)
+			running -= 1
+
+		jobs = [queue.submit(job) for _ in range(6)]
+		await queue.join()
+		await queue.stop()
+		return peak, jobs
+
+	peak, jobs = run(scenario())
+	assert peak == 2
+	assert {job.status for job in jobs} == {'done'}
+
+
+def test_timeout_failure_and_stats():
+	finished = []
+
+	async def on_finish(job):
+		finished.append(job.status)
+
+	async def scenario():
+		queue = JobQueue(workers=1, timeout=0.01)
+		done = queue.submit(sleep_and_return, 0, 'ok', on_finish=on_finish)
+		slow = queue.submit(sleep_and_return, 1, name='slow', on_finish=on_finish)
+		failed = queue.submit(fail, on_finish=on_finish)
+		patient = queue.submit(sleep_and_return, 0.02, 'late', timeout=1)
+		assert queue.depth == 4
+		await queue.join()
+		stats = queue.stats()
+		await queue.stop()
+		return done, slow, failed, patient, stats
+
+	done, slow, failed, patient, stats = run(scenario())
+	assert (done.status, done.result) == ('done', 'ok')
+	assert (slow.status, slow.name, slow.error) == ('timeout', 'slow', 'Timed out after 0s')
+	assert (failed.status, failed.error) == ('failed', 'bad input')
+	assert (patient.status, patient.result) == ('done', 'late')
+	assert finished == ['done', 'timeout', 'failed']
+	assert stats['processed'] == 4
+	assert (stats['failed'], stats['timed_out'], stats['running'], stats['depth']) == (1, 1, 0, 0)
+	assert stats['max_wait'] >= stats['avg_wait'] > 0
+
+
+def test_timeout_raised_by_the_job_itself_is_a_failure():
+	async def times_out():
+		await asyncio.wait_for(asyncio.sleep(1), 0.001)
+
+	async def scenario():
+		queue = JobQueue(workers=1)
+		job = queue.submit(times_out)
+		after = queue.submit(sleep_and_return, 0, 'still running')
+		await queue.join()
+		await queue.stop()
+		return job, after
+
+	job, after = run(scenario())
+	assert job.status == 'failed'
+	assert (after.status, after.result) == ('done', 'still running')
+
+
+def test_full_queue_rejects_submissions():
+	async def scenario():
+		queue = JobQueue(workers=1, maxsize=1)
+		queue.submit(sleep_and_return, 0)
+		with pytest.raises(asyncio.QueueFull):
+			queue.submit(sleep_and_return, 0)
+		await queue.stop()
+
+	run(scenario())
+
+
+def test_from_env(monkeypatch):
+	monkeypatch.setenv('COFOUNDER_API_WORKERS', '3')
+	monkeypatch.setenv('COFOUNDER_API_QUEUE_SIZE', '10')
+	queue = JobQueue.from_env(prefix='COFOUNDER_API', timeout=1800)
+	assert (queue.workers, queue.timeout, queue.maxsize) == (3, 1800, 10)
+	monkeypatch.setenv('COFOUNDER_API_TASK_TIMEOUT', '60')
+	assert JobQueue.from_env(prefix='COFOUNDER_API', timeout=1800).timeout == 60.0
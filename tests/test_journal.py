@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from cofounder.journal import RunJournal
+
+
+def finished(index, success=True, partial=False):
+	return {
+		'index': index,
+		'step': f'step {index}',
+		'result': f'found {index}',
+		'success': success,
+		'partial': partial,
+		'tier': 'http',
+	}
+
+
+@pytest.fixture
+def journal(tmp_path):
+	journal = RunJournal.create('What is trending?', runs_dir=str(tmp_path), provider='openai', model=None)
+	journal.record('plan_step', {'step': 'step 1'})
+	journal.record('plan_done', {'steps': ['step 1', 'step 2', 'step 3']})
+	journal.record('step_finished', finished(1))
+	journal.record('step_finished', finished(2, partial=True))
+	journal.record('step_finished', finished(3, success=False))
+	return journal
+
+
+def test_resume_state(journal, tmp_path):
+	reopened = RunJournal.open(journal.run_id, runs_dir=str(tmp_path))
+	assert (reopened.task, reopened.start['provider']) == ('What is trending?', 'openai')
+	assert reopened.plan == ['step 1', 'step 2', 'step 3']
+	# Partial and failed steps run again
+	assert list(reopened.completed) == [1]
+	assert reopened.completed[1] == {'step': 'step 1', 'result': 'found 1', 'success': True, 'tier': 'http'}
+	assert not reopened.finished
+	assert [record['event'] for record in reopened.events][-1] == 'resume'
+
+
+def test_torn_last_line_is_dropped(journal):
+	with open(journal.journal_path, 'a', encoding='utf-8') as f:
+		f.write(json.dumps({'event': 'step_finished', **finished(3)})[:25])
+
+	loaded = RunJournal.load(journal.path)
+	assert list(loaded.completed) == [1]
+	loaded.append('report', {'report': 'done'})
+
+	lines = open(journal.journal_path, encoding='utf-8').read().splitlines()
+	assert [json.loads(line)['event'] for line in lines][-2:] == ['step_finished', 'report']
+	assert RunJournal.load(journal.path).finished
+
+
+def test_load_leaves_the_journal_alone(journal):
+	before = open(journal.journal_path, encoding='utf-8').read()
+	assert RunJournal.load(journal.path).plan == ['step 1', 'step 2', 'step 3']
+	assert open(journal.journal_path, encoding='utf-8').read() == before
+
+
+def test_unknown_run(tmp_path):
+	with pytest.raises(FileNotFoundError):
+		RunJournal.load('20250101-000000-abcdef', runs_dir=str(tmp_path))
+	(tmp_path / 'empty').mkdir()
+	(tmp_path / 'empty' / 'journal.jsonl').write_text('')
+	with pytest.raises(FileNotFoundError, match='no journal start record'):
+		RunJournal.load(str(tmp_path / 'empty'))
@@ -0,0 +1,39 @@
+import pytest
+
+from cofounder.jsonstream import StepStreamParser
+
+
+def feed_all(chunks):
+	parser = StepStreamParser()
+	return [parser.feed(chunk) for chunk in chunks], parser
+
+
+def test_steps_are_emitted_as_soon_as_they_are_complete():
+	emitted, parser = feed_all(['["Open ', 'Hacker News", "Col', 'lect headlines"', ', "Summarize"]'])
+	assert emitted == [[], ['Open Hacker News'], ['Collect headlines'], ['Summarize']]
+	assert parser.done
+
+
+@pytest.mark.parametrize(
+	'text',
+	[
+		'Here is the plan:\n```json\n["a", "b"]\n```\nGood luck!',
+		'{"steps": ["a", "b"]}',
+		'[{"step": "a"}, {"step": "b", "why": "x"}]',
+	],
+)
+def test_surrounding_text_and_wrappers_are_ignored(text):
+	parser = StepStreamParser()
+	assert parser.feed(text) == ['a', 'b']
+
+
+def test_one_character_at_a_time():
+	text = '["say \\"hi\\" [twice]", {"step": "use {braces}"}]'
+	emitted, _ = feed_all(list(text))
+	assert [step for steps in emitted for step in steps] == ['say "hi" [twice]', 'use {braces}']
+
+
+def test_text_after_the_array_is_ignored():
+	parser = StepStreamParser()
+	assert parser.feed('["a"] and then ["b"]') == ['a']
+	assert parser.feed('["c"]') == []
@@ -0,0 +1,160 @@
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip('browser_use')
+
+from rich.console import Console  # noqa: E402
+
+from benchmarks.fakes import ScriptedChatModel  # noqa: E402
+from cofounder import pipeline  # noqa: E402
+from cofounder.pipeline import classify_task, run_mission  # noqa: E402
+
+STEPS = ['Go to example.com and read the headlines']
+
+
+@pytest.fixture(autouse=True)
+def offline(monkeypatch):
+	monkeypatch.setenv('COFOUNDER_PREWARM', '0')
+	for stage in ('PLAN', 'AGENT', 'EXTRACT', 'REPORT'):
+		monkeypatch.delenv(f'COFOUNDER_MODEL_{stage}', raising=False)
+	monkeypatch.delenv('COFOUNDER_ROUTING', raising=False)
+	monkeypatch.delenv('COFOUNDER_MISSION_BUDGET', raising=False)
+	monkeypatch.delenv('COFOUNDER_MISSION_TOKEN_BUDGET', raising=False)
+
+
+def mission(llm, **kwargs):
+	kwargs.setdefault('report_style', 'trends')
+	return run_mission('What is trending?', llm, console=Console(quiet=True), pool=object(), output=None, **kwargs)
+
+
+async def fake_steps(steps, llm, controller, on_start=None, on_done=None, **kwargs):
+	results = []
+	async for step in steps:
+		results.append({'step': step, 'result': f'found {step}', 'success': True, 'tier': 'http'})
+		on_start(len(results), step)
+		on_done(len(results), results[-1])
+	return results
+
+
+@pytest.mark.parametrize(
+	'task, task_type',
+	[
+		("What's trending on Hacker News today?", 'trends'),
+		('Find YC companies raising funding', 'market_research'),
+		('Plan an influencer outreach campaign', 'outreach'),
+		('Find candidates for our open jobs', 'recruiting'),
+		('Upload a photo of my bicycle', 'general'),
+		('Compare postgres hosting', 'general'),
+	],
+)
+def test_classify_task_matches_whole_words(task, task_type):
+	assert classify_task(task) == task_type
+
+
+def test_mission_runs_end_to_end(monkeypatch):
+	monkeypatch.setattr(pipeline, 'execute_steps', fake_steps)
+	llm = ScriptedChatModel(steps=STEPS, report_words=20)
+	result = asyncio.run(mission(llm))
+	assert result.plan == STEPS
+	assert result.steps_completed[0]['result'] == f'found {STEPS[0]}'
+	assert len(result.report.split()) == 20
+
+
+def test_failed_execution_cancels_the_report_structure(monkeypatch):
+	structure = {}
+
+	async def slow_structure(task, llm, cache=None):
+		structure['started'] = True
+		try:
+			await asyncio.sleep(10)
+		except asyncio.CancelledError:
+			structure['cancelled'] = True
+			raise
+
+	async def failing_steps(steps, *args, **kwargs):
+		async for _ in steps:
+			await asyncio.sleep(0)
+			raise RuntimeError('browser crashed')
+
+	monkeypatch.setattr(pipeline, 'report_structure', slow_structure)
+	monkeypatch.setattr(pipeline, 'execute_steps', failing_steps)
+
+	async def scenario():
+		with pytest.raises(RuntimeError):
+			await mission(ScriptedChatModel(steps=STEPS), report_style='dynamic')
+		# Checked before asyncio.run tears the loop down, which would cancel a leaked task too
+		return dict(structure)
+
+	assert asyncio.run(scenario()) == {'started': True, 'cancelled': True}
+
+
+def test_failed_execution_cancels_running_summaries(monkeypatch):
+	summary = {}
+
+	async def slow_summary(self, step, result):
+		summary['started'] = True
+		try:
+			await asyncio.sleep(10)
+		except asyncio.CancelledError:
+			summary['cancelled'] = True
+			raise
+
+	async def failing_after_first_step(steps, llm, controller, on_start=None, on_done=None, **kwargs):
+		async for step in steps:
+			on_start(1, step)
+			on_done(1, {'step': step, 'result': 'x' * 5000, 'success': True, 'tier': 'http'})
+			await asyncio.sleep(0)
+			raise RuntimeError('browser crashed')
+
+	monkeypatch.setattr(pipeline.StreamingReporter, '_summarize', slow_summary)
+	monkeypatch.setattr(pipeline, 'execute_steps', failing_after_first_step)
+
+	async def scenario():
+		with pytest.raises(RuntimeError):
+			await mission(ScriptedChatModel(steps=STEPS))
+		return dict(summary)
+
+	assert asyncio.run(scenario()) == {'started': True, 'cancelled': True}
+
+
+def test_planning_stops_when_the_budget_runs_out(monkeypatch):
+	async def stalling_plan(self):
+		yield STEPS[0]
+		await asyncio.sleep(10)
+		yield 'never planned'
+
+	monkeypatch.setattr(pipeline.TaskPlanner, 'steps', stalling_plan)
+	monkeypatch.setattr(pipeline, 'execute_steps', fake_steps)
+	started = time.monotonic()
+	result = asyncio.run(mission(ScriptedChatModel(report_words=20), time_budget=0.5))
+	assert time.monotonic() - started < 2
+	assert result.plan == STEPS
+	assert len(result.report.split()) == 20
+
+
+def test_report_falls_back_to_raw_results_when_the_budget_runs_out(monkeypatch):
+	async def stalling_report(*args, **kwargs):
+		await asyncio.sleep(10)
+
+	monkeypatch.setattr(pipeline, 'generate_report', stalling_report)
+	monkeypatch.setattr(pipeline, 'execute_steps', fake_steps)
+	events = []
+	started = time.monotonic()
+	result = asyncio.run(mission(ScriptedChatModel(steps=STEPS), time_budget=0.5, on_event=lambda *event: events.append(event)))
+	assert time.monotonic() - started < 2
+	assert result.report.startswith('# What is trending?')
+	assert f'found {STEPS[0]}' in result.report
+	assert events[-1] == ('report', {'report': result.report})
+
+
+def test_planner_timeouts_are_not_budget_timeouts(monkeypatch):
+	async def timing_out_plan(self):
+		raise asyncio.TimeoutError
+		yield
+
+	monkeypatch.setattr(pipeline.TaskPlanner, 'steps', timing_out_plan)
+	monkeypatch.setattr(pipeline, 'execute_steps', fake_steps)
+	with pytest.raises(asyncio.TimeoutError):
+		asyncio.run(mission(ScriptedChatModel(), time_budget=60))
@@ -0,0 +1,149 @@
+import asyncio
+
+import pytest
+
+from cofounder import pool as pool_module
+from cofounder.pool import BrowserPool, _PooledBrowser
+
+
+class FakeContext:
+	def __init__(self, browser):
+		self.browser = browser
+		self.closed = False
+
+	async def close(self):
+		self.closed = True
+
+
+class FakeBrowser:
+	launched = []
+
+	def __init__(self):
+		self.launches = 0
+		self.closed = False
+		self.contexts = []
+		FakeBrowser.launched.append(self)
+
+	async def get_playwright_browser(self):
+		self.launches += 1
+		await asyncio.sleep(0)
+
+	async def new_context(self, config=None):
+		context = FakeContext(self)
+		self.contexts.append(context)
+		return context
+
+	async def close(self):
+		self.closed = True
+
+
+class FakePool(BrowserPool):
+	def _new_browser(self):
+		return _PooledBrowser(FakeBrowser())
+
+
+@pytest.fixture(autouse=True)
+def launched():
+	FakeBrowser.launched = []
+	return FakeBrowser.launched
+
+
+def run(coro):
+	return asyncio.run(coro)
+
+
+def test_contexts_share_one_launched_browser(launched):
+	async def scenario():
+		pool = FakePool(size=1, max_concurrency=3)
+		await pool.start()
+
+		async def use():
+			async with pool.context() as context:
+				await asyncio.sleep(0)
+				return context
+
+		contexts = await asyncio.gather(*(use() for _ in range(3)))
+		await pool.close()
+		return contexts
+
+	contexts = run(scenario())
+	assert len(launched) == 1
+	assert launched[0].launches == 1
+	assert all(context.closed for context in contexts)
+	assert launched[0].closed
+
+
+def test_browser_is_replaced_after_max_uses(launched):
+	async def scenario():
+		pool = FakePool(size=1, max_uses=2)
+		for _ in range(5):
+			async with pool.context():
+				pass
+		await pool.close()
+
+	run(scenario())
+	assert [len(browser.contexts) for browser in launched] == [2, 2, 1]
+	assert all(browser.closed for browser in launched)
+
+
+def test_retiring_browser_stays_open_until_its_contexts_close(launched):
+	async def scenario():
+		pool = FakePool(size=1, max_concurrency=2, max_uses=1)
+		async with pool.context():
+			async with pool.context():
+				assert len(launched) == 2
+			assert not launched[0].closed
+		assert launched[0].closed
+		await pool.close()
+
+	run(scenario())
+
+
+def test_browser_is_recycled_when_memory_exceeds_limit(launched, monkeypatch):
+	rss = [100.0]
+	monkeypatch.setattr(pool_module, 'process_tree_rss_mb', lambda pid=None: rss[0])
+
+	async def scenario():
+		pool = FakePool(size=1, max_rss_mb=500)
+		async with pool.context():
+			pass
+		assert not launched[0].closed
+		rss[0] = 900.0
+		async with pool.context():
+			pass
+		assert launched[0].closed
+		rss[0] = 100.0
+		async with pool.context():
+			pass
+		await pool.close()
+
+	run(scenario())
+	assert len(launched) == 2
+
+
+def test_max_concurrency_limits_open_contexts():
+	async def scenario():
+		pool = FakePool(size=1, max_concurrency=2)
+		running = peak = 0
+
+		async def use():
+			nonlocal running, peak
+			async with pool.context():
+				running += 1
+				peak = max(peak, running)
+				await asyncio.sleep(0.001)
+				running -= 1
+
+		await asyncio.gather(*(use() for _ in range(6)))
+		await pool.close()
+		return peak
+
+	assert run(scenario()) == 2
+
+
+def test_from_env(monkeypatch):
+	monkeypatch.setenv('COFOUNDER_POOL_SIZE', '2')
+	monkeypatch.setenv('COFOUNDER_POOL_MAX_USES', '7')
+	monkeypatch.setenv('COFOUNDER_POOL_MAX_RSS_MB', '1024')
+	pool = BrowserPool.from_env(max_concurrency=5)
+	assert (pool.size, pool.max_concurrency, pool.max_uses, pool.max_rss_mb) == (2, 5, 7, 1024.0)
@@ -0,0 +1,39 @@
+import pytest
+
+from cofounder.providers import tool_calling_method
+
+
+def chat_model(class_name: str):
+	return type(class_name, (), {})()
+
+
+class Fallbacks:
+	def __init__(self, runnable, *fallbacks):
+		self.runnable = runnable
+		self.fallbacks = list(fallbacks)
+
+
+class Cassette:
+	def __init__(self, inner):
+		self.inner = inner
+
+
+@pytest.mark.parametrize(
+	'class_name, method',
+	[
+		('ChatOpenAI', 'function_calling'),
+		('AzureChatOpenAI', 'function_calling'),
+		('ChatGoogleGenerativeAI', None),
+		('ChatOllama', None),
+	],
+)
+def test_tool_calling_method_matches_browser_use_auto(class_name, method):
+	assert tool_calling_method(chat_model(class_name)) == method
+
+
+def test_tool_calling_method_looks_through_fallbacks_and_cassettes():
+	openai, gemini = chat_model('ChatOpenAI'), chat_model('ChatGoogleGenerativeAI')
+	assert tool_calling_method(Fallbacks(openai, gemini)) == 'function_calling'
+	assert tool_calling_method(Cassette(openai)) == 'function_calling'
+	assert tool_calling_method(Fallbacks(Cassette(openai), gemini)) == 'function_calling'
+	assert tool_calling_method(Fallbacks(gemini, openai)) is None
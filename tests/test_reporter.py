@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip('langchain_core')
+
+from cofounder.reporter import StreamingReporter  # noqa: E402
+
+
+class Response:
+	def __init__(self, content: str):
+		self.content = content
+
+
+class SummaryModel:
+	"""Summarizes by keeping the first word; steps whose result says so fail or hang."""
+
+	def __init__(self):
+		self.cancelled = []
+
+	async def ainvoke(self, prompt: str):
+		result = prompt.split('RESULT:', 1)[1].split()
+		if result[0] == 'fail':
+			raise RuntimeError('rate limited')
+		if result[0] == 'hang':
+			try:
+				await asyncio.sleep(10)
+			except asyncio.CancelledError:
+				self.cancelled.append(result[0])
+				raise
+		return Response(result[0])
+
+
+def step(result):
+	return {'step': 'a step', 'result': result, 'success': result is not None}
+
+
+def test_long_results_are_summarized_in_plan_order():
+	async def scenario():
+		reporter = StreamingReporter('task', SummaryModel(), min_chars=10)
+		steps = [step('short'), step('first ' * 5), step(None), step('second ' * 5)]
+		for i, step_result in reversed(list(enumerate(steps, 1))):
+			reporter.submit(i, step_result)
+		return await reporter.collect(steps)
+
+	merged = asyncio.run(scenario())
+	assert [step_result['result'] for step_result in merged] == ['short', 'first', None, 'second']
+
+
+def test_failed_summary_falls_back_to_the_full_result():
+	async def scenario():
+		reporter = StreamingReporter('task', SummaryModel(), min_chars=10)
+		steps = [step('fail ' * 5)]
+		reporter.submit(1, steps[0])
+		return await reporter.collect(steps)
+
+	assert asyncio.run(scenario())[0]['result'] == 'fail ' * 5
+
+
+def test_aclose_cancels_running_summaries_and_retrieves_failures():
+	model = SummaryModel()
+
+	async def scenario():
+		reporter = StreamingReporter('task', model, min_chars=10)
+		reporter.submit(1, step('hang ' * 5))
+		reporter.submit(2, step('fail ' * 5))
+		await asyncio.sleep(0.01)
+		await reporter.aclose()
+		return list(reporter._summaries.values())
+
+	summaries = asyncio.run(scenario())
+	assert model.cancelled == ['hang']
+	assert all(summary.done() for summary in summaries)
@@ -0,0 +1,86 @@
+import json
+
+import pytest
+
+pytest.importorskip('langchain_core')
+
+from benchmarks.fakes import ScriptedChatModel  # noqa: E402
+from cofounder import routing  # noqa: E402
+from cofounder.providers import Provider  # noqa: E402
+from cofounder.routing import ModelRouter, parse_spec  # noqa: E402
+
+DEFAULT = ScriptedChatModel(model_name='mission')
+
+
+@pytest.fixture(autouse=True)
+def fake_providers(monkeypatch):
+	for stage in routing.STAGES:
+		monkeypatch.delenv(f'COFOUNDER_MODEL_{stage.upper()}', raising=False)
+	for name in ('COFOUNDER_ROUTING', 'COFOUNDER_ROUTING_TIMEOUT'):
+		monkeypatch.delenv(name, raising=False)
+	monkeypatch.setattr(routing, '_models', {})
+	created = []
+
+	def create(self, model=None, timeout=None, max_retries=None):
+		created.append((self.name, model, timeout, max_retries))
+		return ScriptedChatModel(model_name=f'{self.name}:{model}')
+
+	monkeypatch.setattr(Provider, 'create', create)
+	return created
+
+
+def names(llm):
+	"""Model names of a routed model, fallbacks included, preferred first."""
+	if hasattr(llm, 'fallbacks'):
+		return [llm.runnable.model_name] + [fallback.model_name for fallback in llm.fallbacks]
+	return [llm.model_name]
+
+
+def test_parse_spec():
+	assert parse_spec('openai:gpt-4o-mini') == ('openai', 'gpt-4o-mini')
+	assert parse_spec(' ollama:qwen2.5:7b ') == ('ollama', 'qwen2.5:7b')
+	assert parse_spec('claude') == ('openrouter', None)
+
+
+def test_routes_from_json_with_stage_overrides(monkeypatch, fake_providers):
+	monkeypatch.setenv('COFOUNDER_ROUTING', json.dumps({'plan': 'openai:gpt-4o-mini', 'agent': ['openai', 'claude']}))
+	monkeypatch.setenv('COFOUNDER_MODEL_PLAN', 'gemini, default')
+	monkeypatch.setenv('COFOUNDER_ROUTING_TIMEOUT', '15')
+	router = ModelRouter.from_env(DEFAULT)
+
+	assert router.routes == {'plan': ['gemini', 'default'], 'agent': ['openai', 'claude']}
+	assert names(router.model('plan')) == ['gemini:gemini-2.0-flash-exp', 'mission']
+	assert names(router.model('agent')) == ['openai:gpt-4o', 'openrouter:anthropic/claude-3.5-sonnet']
+	assert router.model('extract') is router.model('report') is DEFAULT
+	# Models with a fallback give way quickly, the last one waits as long as its provider likes
+	assert fake_providers == [
+		('gemini', 'gemini-2.0-flash-exp', 15.0, 0),
+		('openai', 'gpt-4o', 15.0, 0),
+		('openrouter', 'anthropic/claude-3.5-sonnet', None, None),
+	]
+	assert len(router.models()) == 3
+
+
+def test_routes_from_a_file(monkeypatch, tmp_path):
+	path = tmp_path / 'routing.json'
+	path.write_text(json.dumps({'report': 'openai:gpt-4o-mini'}))
+	monkeypatch.setenv('COFOUNDER_ROUTING', str(path))
+	router = ModelRouter.from_env(DEFAULT)
+	assert names(router.model('report')) == ['openai:gpt-4o-mini']
+	assert router.model('report') is router.model('report')
+
+
+def test_stages_share_built_models(fake_providers):
+	router = ModelRouter(DEFAULT, {'plan': 'openai:gpt-4o-mini', 'report': 'openai:gpt-4o-mini'})
+	assert router.model('plan') is router.model('report')
+	assert ModelRouter(DEFAULT, {'extract': 'openai:gpt-4o-mini'}).model('extract') is router.model('plan')
+	assert len(fake_providers) == 1
+
+
+def test_invalid_routes():
+	with pytest.raises(ValueError, match="Unknown stage 'summary'"):
+		ModelRouter(DEFAULT, {'summary': 'openai'})
+	with pytest.raises(KeyError, match="Unknown provider 'opneai'"):
+		ModelRouter(DEFAULT, {'plan': ['default', 'opneai:gpt-4o']})
+	with pytest.raises(ValueError, match="Unknown stage 'summary'"):
+		ModelRouter(DEFAULT).model('summary')
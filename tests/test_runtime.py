@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip('browser_use')
+
+from rich.console import Console  # noqa: E402
+
+from cofounder import cache, journal, runtime  # noqa: E402
+from cofounder.pipeline import MissionResult  # noqa: E402
+from cofounder.runtime import Runtime  # noqa: E402
+
+
+class FakePool:
+	async def start(self):
+		pass
+
+	async def close(self):
+		pass
+
+
+@pytest.fixture
+def missions(monkeypatch, tmp_path):
+	monkeypatch.setattr(cache, 'CACHE_DB', str(tmp_path / 'cache.sqlite3'))
+	monkeypatch.setattr(journal, 'RUNS_DIR', str(tmp_path / 'runs'))
+	runs = []
+
+	async def fake_run_mission(task, llm, journal=None, on_event=None, **kwargs):
+		runs.append((task, llm, journal))
+		return MissionResult(task=task, plan=[], steps_completed=[], report='', timings={})
+
+	monkeypatch.setattr(runtime, 'run_mission', fake_run_mission)
+	monkeypatch.setattr(Runtime, 'model', lambda self, provider, model=None: (provider, model))
+	return runs
+
+
+def test_every_mission_is_journaled_and_can_be_resumed(missions, tmp_path):
+	async def scenario():
+		rt = Runtime(pool=FakePool(), provider='gemini')
+		events = []
+		await rt.run(
+			{'task': 'What is trending?', 'model': 'gemini-pro'},
+			Console(quiet=True),
+			on_event=lambda *event: events.append(event),
+		)
+		first = missions[-1][2]
+		# The request's provider and model are ignored in favour of the run's own
+		await rt.run({'resume': first.run_id, 'provider': 'openai'}, Console(quiet=True))
+		await rt.close()
+		return events
+
+	events = asyncio.run(scenario())
+	(task, llm, created), (resumed_task, resumed_llm, resumed) = missions
+	assert events == [('run', {'run_id': created.run_id})]
+	assert created.path.startswith(str(tmp_path / 'runs'))
+	assert (task, llm, created.start['provider']) == ('What is trending?', ('gemini', 'gemini-pro'), 'gemini')
+	assert (resumed_task, resumed_llm, resumed.run_id) == (task, llm, created.run_id)
+	assert resumed.events[-1]['event'] == 'resume'
+
+
+def test_resuming_an_unknown_run_is_an_invalid_request(missions):
+	rt = Runtime(pool=FakePool())
+	with pytest.raises(ValueError, match='No run nope to resume'):
+		rt.resolve_task({'resume': 'nope'})
+	asyncio.run(rt.close())
@@ -0,0 +1,120 @@
+import asyncio
+
+import pytest
+
+from cofounder.scheduler import FairScheduler, QueuedTask, QuotaExceeded
+
+
+class Recorder:
+	"""Runs tasks until released, remembering the order they started in."""
+
+	def __init__(self):
+		self.started = []
+		self.release = {}
+
+	async def __call__(self, entry: QueuedTask):
+		self.started.append(entry.task)
+		await self.release.setdefault(entry.task, asyncio.Event()).wait()
+
+	async def finish(self, *tasks: str):
+		for task in tasks:
+			self.release.setdefault(task, asyncio.Event()).set()
+		for _ in range(3):
+			await asyncio.sleep(0)
+
+
+def run(coro):
+	return asyncio.run(coro)
+
+
+def test_global_cap_and_round_robin_across_users():
+	async def scenario():
+		recorder = Recorder()
+		scheduler = FairScheduler(recorder, max_concurrency=1, max_per_user=1, max_per_channel=5, max_queued_per_user=5)
+		positions = [scheduler.submit(QueuedTask(1, 10, 'a1'))]
+		positions += [scheduler.submit(QueuedTask(1, 10, f'a{i}')) for i in (2, 3)]
+		positions += [scheduler.submit(QueuedTask(2, 10, f'b{i}')) for i in (1, 2)]
+		await asyncio.sleep(0)
+		assert positions == [0, 1, 2, 2, 4]
+		for task in ('a1', 'a2', 'b1', 'a3'):
+			await recorder.finish(task)
+		assert recorder.started == ['a1', 'a2', 'b1', 'a3', 'b2']
+		assert scheduler.running == 1
+		await recorder.finish('b2')
+
+	run(scenario())
+
+
+def test_per_user_and_per_channel_quotas():
+	async def scenario():
+		recorder = Recorder()
+		scheduler = FairScheduler(recorder, max_concurrency=4, max_per_user=1, max_per_channel=1)
+		scheduler.submit(QueuedTask(1, 10, 'a1'))
+		scheduler.submit(QueuedTask(1, 20, 'a2'))
+		scheduler.submit(QueuedTask(2, 10, 'b1'))
+		scheduler.submit(QueuedTask(3, 30, 'c1'))
+		await asyncio.sleep(0)
+		# a2 waits for user 1's slot, b1 for channel 10
+		assert recorder.started == ['a1', 'c1']
+		await recorder.finish('a1')
+		assert sorted(recorder.started) == ['a1', 'a2', 'b1', 'c1']
+		await recorder.finish('a2', 'b1', 'c1')
+
+	run(scenario())
+
+
+def test_queue_quota_and_cancel():
+	async def scenario():
+		recorder = Recorder()
+		scheduler = FairScheduler(recorder, max_concurrency=1, max_queued_per_user=2)
+		scheduler.submit(QueuedTask(1, 10, 'a1'))
+		scheduler.submit(QueuedTask(1, 10, 'a2'))
+		scheduler.submit(QueuedTask(1, 10, 'a3'))
+		await asyncio.sleep(0)
+		with pytest.raises(QuotaExceeded):
+			scheduler.submit(QueuedTask(1, 10, 'a4'))
+		assert scheduler.cancel(1) == 2
+		await recorder.finish('a1')
+		assert recorder.started == ['a1']
+		assert scheduler.running == 0
+
+	run(scenario())
+
+
+def test_failing_task_frees_its_slot(capsys):
+	async def scenario():
+		done = []
+
+		async def flaky(entry: QueuedTask):
+			if entry.task == 'boom':
+				raise RuntimeError('boom')
+			done.append(entry.task)
+
+		scheduler = FairScheduler(flaky, max_concurrency=1)
+		scheduler.submit(QueuedTask(1, 10, 'boom'))
+		scheduler.submit(QueuedTask(2, 10, 'ok'))
+		for _ in range(5):
+			await asyncio.sleep(0)
+		assert done == ['ok']
+		assert scheduler.running == 0
+
+	run(scenario())
+
+
+def test_failing_task_is_logged_and_frees_its_slot(caplog):
+	async def scenario():
+		async def run_task(entry: QueuedTask):
+			if entry.task == 'bad':
+				raise RuntimeError('browser crashed')
+
+		scheduler = FairScheduler(run_task, max_concurrency=1, max_per_user=1, max_per_channel=1, max_queued_per_user=5)
+		scheduler.submit(QueuedTask(1, 10, 'bad'))
+		scheduler.submit(QueuedTask(1, 10, 'good'))
+		for _ in range(5):
+			await asyncio.sleep(0)
+		return scheduler.running
+
+	assert run(scenario()) == 0
+	failures = [record for record in caplog.records if record.name == 'cofounder.scheduler']
+	assert len(failures) == 1
+	assert failures[0].exc_info[1].args == ('browser crashed',)
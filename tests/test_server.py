@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip('fastapi')
+pytest.importorskip('browser_use')
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from cofounder import server  # noqa: E402
+from cofounder.jobs import Job  # noqa: E402
+from cofounder.server import JobRequest, MissionJob  # noqa: E402
+
+
+def finished_job(status='done'):
+	job = Job(lambda: None, (), None, 'mission')
+	job.status = status
+	return job
+
+
+def test_report_chunks_are_dropped_once_the_job_finishes():
+	async def scenario():
+		mission = MissionJob(JobRequest(task='task'))
+		received = []
+
+		async def follow():
+			async for event in mission.follow():
+				received.append(event['event'])
+
+		follower = asyncio.create_task(follow())
+		mission.emit('plan_done', {'steps': []})
+		for text in ('a ', 'report'):
+			mission.emit('report_chunk', {'text': text})
+			await asyncio.sleep(0)
+		mission.emit('report', {'report': 'a report'})
+		await mission.finish(finished_job())
+		await follower
+
+		late = [event async for event in mission.follow()]
+		return received, late, mission
+
+	received, late, mission = asyncio.run(scenario())
+	assert received == ['plan_done', 'report_chunk', 'report_chunk', 'report', 'done']
+	assert [event['event'] for event in late] == ['plan_done', 'report', 'done']
+	assert [event['id'] for event in late] == [0, 3, 4]
+	assert mission.to_dict()['events'] == 3
+
+
+class FakeRuntime:
+	instances = []
+
+	def __init__(self, missions=1, provider='openai'):
+		self.missions = missions
+		self.provider = provider
+		self.started = self.closed = False
+		FakeRuntime.instances.append(self)
+
+	async def start(self):
+		self.started = True
+
+	async def close(self):
+		self.closed = True
+
+	def resolve_task(self, request):
+		if not request.get('task'):
+			raise ValueError('No task given')
+		return request['task']
+
+
+def test_lifespan_builds_the_runtime_with_the_default_provider(monkeypatch):
+	FakeRuntime.instances = []
+	monkeypatch.setattr(server, 'Runtime', FakeRuntime)
+	monkeypatch.setattr(server, 'default_provider', 'gemini')
+	with TestClient(server.app) as client:
+		assert client.post('/jobs', json={}).status_code == 400
+		assert client.get('/jobs/unknown').status_code == 404
+	(runtime,) = FakeRuntime.instances
+	assert (runtime.provider, runtime.missions, runtime.started, runtime.closed) == ('gemini', server.queue.workers, True, True)
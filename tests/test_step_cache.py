@@ -0,0 +1,84 @@
+import pytest
+
+from cofounder import step_cache as step_cache_module
+from cofounder.cache import SqliteCache
+from cofounder.step_cache import StepResultCache, parse_domain_ttls, step_domains
+
+
+class Model:
+	def __init__(self, name: str):
+		self.model_name = name
+
+
+AGENT, EXTRACTOR = Model('agent'), Model('extractor')
+
+
+@pytest.fixture
+def clock(monkeypatch):
+	now = [1000.0]
+	monkeypatch.setattr(step_cache_module.time, 'time', lambda: now[0])
+	return now
+
+
+@pytest.fixture
+def store(tmp_path):
+	cache = SqliteCache('steps', path=str(tmp_path / 'cache.sqlite3'))
+	yield cache
+	cache.close()
+
+
+def test_parse_domain_ttls():
+	assert parse_domain_ttls(' News.ycombinator.com=900, twitter.com=0,,') == {'news.ycombinator.com': 900.0, 'twitter.com': 0.0}
+	assert parse_domain_ttls('') == {}
+
+
+def test_step_domains():
+	assert step_domains('Go to News.YCombinator.com then github.com/trending') == ['news.ycombinator.com', 'github.com']
+
+
+def test_results_expire_after_ttl(store, clock):
+	cache = StepResultCache(store, ttl=60)
+	cache.set('Check the weather', AGENT, 'sunny')
+	clock[0] += 60
+	assert cache.get('  check THE weather ', AGENT) == 'sunny'
+	clock[0] += 1
+	assert cache.get('Check the weather', AGENT) is None
+	assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_domain_windows_match_subdomains_and_shortest_wins(store):
+	cache = StepResultCache(store, ttl=3600, domain_ttls={'ycombinator.com': 900, 'news.ycombinator.com': 300, 'x.com': 0})
+	assert cache.ttl_for('Read news.ycombinator.com') == 300
+	assert cache.ttl_for('Read www.ycombinator.com') == 900
+	assert cache.ttl_for('Read notycombinator.com') == 3600
+	assert cache.ttl_for('Compare x.com and ycombinator.com') == 0
+
+
+def test_zero_window_disables_caching(store, clock):
+	cache = StepResultCache(store, ttl=3600, domain_ttls={'x.com': 0})
+	cache.set('Read x.com', AGENT, 'posts')
+	assert len(store) == 0
+	assert cache.get('Read x.com', AGENT) is None
+
+
+def test_results_are_kept_per_tier_and_model(store, clock):
+	cache = StepResultCache(store, ttl=60)
+	cache.set('Read example.com', AGENT, 'fetched', tier='http', extract_llm=EXTRACTOR)
+	assert cache.get('Read example.com', AGENT, EXTRACTOR) == 'fetched'
+	# Routed to another extraction model: the HTTP answer no longer applies
+	assert cache.get('Read example.com', AGENT, Model('other')) is None
+	# Without a separate extraction model the agent model reads the page
+	assert cache.get('Read example.com', AGENT) is None
+
+	cache.set('Read example.com', AGENT, 'browsed')
+	assert cache.get('Read example.com', AGENT, Model('other')) == 'browsed'
+	assert cache.get('Read example.com', Model('other agent'), EXTRACTOR) == 'fetched'
+
+
+def test_from_env_shares_the_given_store(store, monkeypatch):
+	monkeypatch.setenv('COFOUNDER_STEP_CACHE_TTL', '120')
+	monkeypatch.setenv('COFOUNDER_STEP_CACHE_DOMAIN_TTLS', 'x.com=5')
+	cache = StepResultCache.from_env(cache=store)
+	assert cache.cache is store
+	assert (cache.ttl, cache.domain_ttls) == (120.0, {'x.com': 5.0})
+	assert StepResultCache.from_env(30, cache=store).ttl == 30